@@ -0,0 +1,66 @@
+import argparse
+import fnmatch
+import sys
+
+import benchmarks.cases  # noqa: F401, registers the cases
+from benchmarks.harness import CASES, format_time, measure, read_results, write_results
+
+"""
+Runs the benchmarks and writes the results as JSON:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --filter 'enact*' --compare baseline.json
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--filter", default="*", help="only run benchmarks whose name matches this glob"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per repeat, at least"
+    )
+    parser.add_argument(
+        "--compare", help="a previous results file to report the change against"
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=None,
+        help="exit non-zero if any benchmark is this many times slower than --compare",
+    )
+    args = parser.parse_args()
+
+    baseline = read_results(args.compare) if args.compare else {}
+    regressions = []
+    results = []
+
+    for case in CASES:
+        if not fnmatch.fnmatch(case.name, args.filter):
+            continue
+
+        result = measure(case, args.repeat, args.min_time)
+        results.append(result)
+
+        line = f"{case.name:<36} {format_time(result.min):>12} {format_time(result.median):>12}"
+        if case.name in baseline:
+            ratio = result.min / baseline[case.name]["min"]
+            line += f" {ratio:>7.2f}x"
+            if args.max_slowdown is not None and ratio > args.max_slowdown:
+                regressions.append(case.name)
+        print(line, flush=True)
+
+    if args.output:
+        write_results(args.output, results)
+
+    if regressions:
+        print(f"slower than {args.max_slowdown}x the baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+import random
+from copy import deepcopy
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from benchmarks.harness import register
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.bot.belief import BeliefState
+from gcbc.bot.determinization import DeterminizationSampler, Knowledge
+from gcbc.bot.inference import infer
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    PlayerGunState,
+    PlayerHealthState,
+    TableTopGameState,
+)
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.engine.tournament import play_game
+from gcbc.operators.action.aim import Aim
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.equip import Equip
+from gcbc.operators.action.investigate import Investigate
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.base_operator import BaseOperator
+from gcbc.operators.equipment.blackmail import Blackmail
+from gcbc.operators.equipment.defibrillator import Defibrillator
+from gcbc.operators.equipment.polygraph import Polygraph
+from gcbc.operators.equipment.swap import Swap
+from gcbc.operators.equipment.taser import Taser
+
+TABLE_SIZES = (4, 8, 16)
+GAME_PLAYERS = 5
+
+
+def deal(num_players: int, seed: int = 0) -> Tuple[TableTopGameState, DeckState]:
+    random.seed(seed)
+    return (
+        GCBCInitalizer.build_game_state(num_players),
+        GCBCInitalizer.build_deck(num_players),
+    )
+
+
+# GCBCGameEngine.enact followed by the operator's undo, per operator type.
+# Player 0 acts, holding a gun aimed at player 1 and the equipment under test;
+# player 1 holds a gun aimed at player 2; player 4 is dead. The undo brings the
+# table back, so that every call starts from the same one; timeit can't restore
+# it between calls, so the pair is what is timed.
+
+ENACT_CASES = [
+    (Investigate, lambda: Investigate(0, 1, 0), None),
+    (Equip, lambda: Equip(0, 0), None),
+    (ArmAndAim, lambda: ArmAndAim(2, 1, 0), None),
+    (Aim, lambda: Aim(0, 2), None),
+    (Shoot, lambda: Shoot(0, 1), None),
+    (Pass, lambda: Pass(0), None),
+    (Taser, lambda: Taser(0, 1, 2), EquipmentCard.TASER),
+    (Defibrillator, lambda: Defibrillator(0, 4), EquipmentCard.DEFIBRILLATOR),
+    (Blackmail, lambda: Blackmail(0, 1), EquipmentCard.BLACKMAIL),
+    (Polygraph, lambda: Polygraph(0, 1), EquipmentCard.POLYGRAPH),
+    (Swap, lambda: Swap(0, 1, 0, 2, 0), EquipmentCard.SWAP),
+]
+
+
+def enact_setup(
+    make_operator: Callable[[], BaseOperator], equipment: Optional[EquipmentCard]
+):
+    def setup():
+        game_state, deck_state = deal(GAME_PLAYERS)
+        game_state.state[0].gun = PlayerGunState(has_gun=True, aimed_at=1)
+        game_state.state[0].equipment = equipment
+        game_state.state[1].gun = PlayerGunState(has_gun=True, aimed_at=2)
+        game_state.state[4].health = PlayerHealthState.DEAD
+
+        engine = GCBCGameEngine(
+            game_state,
+            deck_state,
+            BotManager({player: BaseBot() for player in range(GAME_PLAYERS)}),
+        )
+        operator = make_operator()
+        if not operator.is_valid(engine.game_state, engine.deck_state):
+            raise ValueError(f"{operator} is not valid on the benchmark table")
+
+        def run():
+            record = operator.undo_record(engine.game_state, engine.deck_state)
+            engine.enact(operator)
+            operator.undo(engine.game_state, engine.deck_state, record)
+
+        return run
+
+    return setup
+
+
+for operator, make_operator, equipment in ENACT_CASES:
+    register(
+        "enact_undo",
+        f"enact_undo[{operator.__name__}]",
+        enact_setup(make_operator, equipment),
+        operator=operator.__name__,
+    )
+
+
+# TableTopGameState.opaque_state(), when no player has changed since the last
+# call, and when one player has.
+
+
+def opaque_state_setup(num_players: int, changed: bool):
+    def setup():
+        game_state, _ = deal(num_players)
+        game_state.opaque_state()
+
+        def unchanged():
+            game_state.opaque_state()
+
+        def one_changed():
+            game_state.set_health(0, game_state.state[0].health)
+            game_state.opaque_state()
+
+        return one_changed if changed else unchanged
+
+    return setup
+
+
+def deck_opaque_state_setup():
+    _, deck_state = deal(GAME_PLAYERS)
+    return deck_state.opaque_state
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "opaque_state",
+        f"opaque_state[{num_players}]",
+        opaque_state_setup(num_players, changed=False),
+        players=num_players,
+    )
+    register(
+        "opaque_state",
+        f"opaque_state[{num_players}, one changed]",
+        opaque_state_setup(num_players, changed=True),
+        players=num_players,
+    )
+register("opaque_state", "deck_opaque_state", deck_opaque_state_setup)
+
+
+# deepcopy of the table, e.g. for a bot to simulate moves on
+
+
+def deepcopy_setup(num_players: int):
+    def setup():
+        game_state, _ = deal(num_players)
+        return lambda: deepcopy(game_state)
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "deepcopy",
+        f"deepcopy[{num_players}]",
+        deepcopy_setup(num_players),
+        players=num_players,
+    )
+
+
+# The read-only snapshot each pre-round pass shares between the bots, when no
+# player has changed since the last one, and when one player has.
+
+
+def snapshot_setup(num_players: int, changed: bool):
+    def setup():
+        game_state, _ = deal(num_players)
+        game_state.snapshot()
+
+        def unchanged():
+            game_state.snapshot()
+
+        def one_changed():
+            game_state.set_health(0, game_state.state[0].health)
+            game_state.snapshot()
+
+        return one_changed if changed else unchanged
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "snapshot",
+        f"snapshot[{num_players}]",
+        snapshot_setup(num_players, changed=False),
+        players=num_players,
+    )
+    register(
+        "snapshot",
+        f"snapshot[{num_players}, one changed]",
+        snapshot_setup(num_players, changed=True),
+        players=num_players,
+    )
+
+
+# Fanning a public notification out to a table of bots that take typed events,
+# of bots that take dicts, and of bots that ignore notifications.
+
+
+class DictBot(BaseBot):
+    def on_public_notification(self, notification):
+        pass
+
+
+class EventBot(DictBot):
+    receives_events = True
+
+
+NOTIFY_BOTS = {"events": EventBot, "dicts": DictBot, "unsubscribed": BaseBot}
+
+
+def notify_setup(num_players: int, bot_class: type):
+    def setup():
+        bot_manager = BotManager({player: bot_class() for player in range(num_players)})
+        operator = Swap(0, 1, 0, 2, 0)
+        return lambda: operator.notify(None, bot_manager)
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    for bots, bot_class in NOTIFY_BOTS.items():
+        register(
+            "notify",
+            f"notify[{num_players}, {bots}]",
+            notify_setup(num_players, bot_class),
+            players=num_players,
+        )
+
+
+# A full game between random bots, capped at 300 rounds. The same game is played
+# on every call, so that timings are comparable between runs.
+
+
+def random_game_setup():
+    bots = [RandomBot] * GAME_PLAYERS
+    seating = tuple(range(GAME_PLAYERS))
+
+    def run():
+        random.seed(0)
+        play_game(bots, seating, max_rounds=300)
+
+    return run
+
+
+register(
+    "game", f"random_game[{GAME_PLAYERS}]", random_game_setup, players=GAME_PLAYERS
+)
+
+
+# GCBCInitalizer dealing a new table and deck
+
+
+def deal_setup(num_players: int):
+    def setup():
+        random.seed(0)
+        return lambda: (
+            GCBCInitalizer.build_game_state(num_players),
+            GCBCInitalizer.build_deck(num_players),
+        )
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "deal", f"deal[{num_players}]", deal_setup(num_players), players=num_players
+    )
+
+
+# GCBCInitalizer.deal_many dealing the integrity cards of many games at once
+
+
+def deal_many_setup(num_games: int, num_players: int):
+    def setup():
+        rng = np.random.default_rng(0)
+        return lambda: GCBCInitalizer.deal_many(num_games, num_players, rng)
+
+    return setup
+
+
+for num_games in (1000, 1_000_000):
+    register(
+        "deal",
+        f"deal_many[{num_games}, 8]",
+        deal_many_setup(num_games, 8),
+        players=8,
+        games=num_games,
+    )
+
+
+# DeterminizationSampler drawing hidden worlds for the first player of a dealt
+# table
+
+
+def determinize_setup(num_players: int, num_worlds: int):
+    def setup():
+        game_state, deck_state = deal(num_players)
+        sampler = DeterminizationSampler(
+            game_state.opaque_state(), deck_state.opaque_state(), Knowledge(0)
+        )
+        rng = np.random.default_rng(0)
+        return lambda: sampler.sample_many(num_worlds, rng)
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "determinize",
+        f"determinize[{num_players}, 1000]",
+        determinize_setup(num_players, 1000),
+        players=num_players,
+        worlds=1000,
+    )
+
+
+# BeliefState answering the team of every seat, for a player who has seen one
+# other hand
+
+
+def belief_setup(num_players: int):
+    def setup():
+        game_state, _ = deal(num_players)
+        belief = BeliefState(0, num_players)
+        for player in (0, 1):
+            for index, card_state in enumerate(game_state.state[player].integrity_cards):
+                belief.learn((player, index), card_state.card)
+        players = list(range(num_players))
+        return lambda: [belief.team_probabilities(player) for player in players]
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "belief",
+        f"belief[{num_players}]",
+        belief_setup(num_players),
+        players=num_players,
+    )
+
+
+# infer working out the exact posterior of every seat of a dealt table, for the
+# first player
+
+
+def infer_setup(num_players: int):
+    def setup():
+        game_state, _ = deal(num_players)
+        opaque = game_state.opaque_state()
+        knowledge = Knowledge(0)
+        return lambda: infer(opaque, knowledge)
+
+    return setup
+
+
+for num_players in TABLE_SIZES:
+    register(
+        "infer", f"infer[{num_players}]", infer_setup(num_players), players=num_players
+    )
@@ -0,0 +1,124 @@
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from gcbc.__about__ import __version__
+
+"""
+A small benchmark harness on top of timeit. Cases are registered with a setup
+function that builds whatever the case needs and returns the callable to time, so
+setup cost never shows up in the measurements.
+"""
+
+
+@dataclass
+class Case:
+    group: str
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    params: Dict[str, Any]
+
+
+@dataclass
+class Result:
+    group: str
+    name: str
+    params: Dict[str, Any]
+    calls: int  # calls per repeat
+    repeat: int
+    min: float  # seconds per call
+    median: float
+    mean: float
+    stdev: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1 / self.min if self.min else float("inf")
+
+
+CASES: List[Case] = []
+
+
+def register(
+    group: str, name: str, setup: Callable[[], Callable[[], Any]], **params
+):
+    CASES.append(Case(group, name, setup, params))
+
+
+def measure(case: Case, repeat: int, min_time: float) -> Result:
+    """
+    Times the case's callable in `repeat` batches, each batch sized so that it
+    takes at least `min_time` seconds.
+    """
+    timer = timeit.Timer(case.setup())
+    calls, elapsed = timer.autorange()
+    if elapsed < min_time:
+        calls = max(1, int(calls * min_time / max(elapsed, 1e-9)))
+
+    per_call = [t / calls for t in timer.repeat(repeat=repeat, number=calls)]
+    return Result(
+        group=case.group,
+        name=case.name,
+        params=case.params,
+        calls=calls,
+        repeat=repeat,
+        min=min(per_call),
+        median=statistics.median(per_call),
+        mean=statistics.fmean(per_call),
+        stdev=statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+    )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata() -> Dict[str, Any]:
+    return {
+        "gcbc_version": __version__,
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_results(path: str, results: List[Result]):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "metadata": metadata(),
+                "benchmarks": [
+                    {**asdict(result), "ops_per_sec": result.ops_per_sec}
+                    for result in results
+                ],
+            },
+            f,
+            indent=2,
+        )
+
+
+def read_results(path: str) -> Dict[str, dict]:
+    with open(path) as f:
+        return {
+            benchmark["name"]: benchmark for benchmark in json.load(f)["benchmarks"]
+        }
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional, Tuple, Union
 from gcbc.core.core_data import DeckState, Player, TableTopGameState
+from gcbc.core.events import Event, Notification, as_dict
 
 
 class BaseBot:
@@ -7,6 +11,14 @@ class BaseBot:
     This is a base class for implementing bots in GCBC.
     """
 
+    # set to True to be notified with the typed events of gcbc.core.events,
+    # rather than their dict form
+    receives_events = False
+
+    # the event types the bot is notified of, None for all of them. Bots that do
+    # not override a notification handler are never notified through it.
+    subscriptions: Optional[Collection[type]] = None
+
     def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
         """
         Called before the round is started. This is where the bot should decide which
@@ -49,35 +61,164 @@ class BaseBot:
         """
         pass
 
-    def on_public_notification(self, notification: dict):
+    def on_public_notification(self, notification: Notification):
         """
         Called when the bot receives a public notification from another player. This is
         where the bot should process the notification and update its state if necessary.
 
-        :param notification: The notification from another player.
+        :param notification: The notification from another player: an event of
+                             gcbc.core.events if receives_events is set, or
+                             else its dict form.
         """
         pass
 
-    def on_private_notification(self, notification: dict):
+    def on_private_notification(self, notification: Notification):
         """
         Called when the bot receives a private notification from another player. This is
         where the bot should process the notification and update its state if necessary.
 
-        :param notification: The notification from another player.
+        :param notification: The notification from another player, as for
+                             on_public_notification.
+        """
+        pass
+
+
+class AsyncBaseBot:
+    """
+    A base class for bots that wait on I/O, e.g. a model server, to make their
+    decisions. Same as BaseBot, except that pre_round, action and aim are
+    coroutines, awaited by the AsyncGCBCGameEngine. Notifications are delivered
+    synchronously, so they should only update the bot's state.
+    """
+
+    receives_events = False
+    subscriptions: Optional[Collection[type]] = None
+
+    async def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
+        """
+        See BaseBot.pre_round.
+        """
+        pass
+
+    async def action(self, game_state: TableTopGameState, deck_state: DeckState):
+        """
+        See BaseBot.action.
+        """
+        pass
+
+    async def aim(self, game_state: TableTopGameState, deck_state: DeckState):
+        """
+        See BaseBot.aim.
+        """
+        pass
+
+    def on_public_notification(self, notification: Notification):
+        """
+        See BaseBot.on_public_notification.
+        """
+        pass
+
+    def on_private_notification(self, notification: Notification):
+        """
+        See BaseBot.on_private_notification.
         """
         pass
 
 
+AnyBot = Union[BaseBot, AsyncBaseBot]
+
+# (handler, receives_events) for each bot to notify
+Subscribers = List[Tuple[Callable, bool]]
+
+
 @dataclass
 class BotManager:
-    player_map: dict[Player, BaseBot]
+    """
+    Fans notifications out to the bots subscribed to them. The subscribers of
+    each notification type are worked out the first time it is sent.
 
-    def get_bot(self, player: Player) -> BaseBot:
-        return self.player_map[player]
+    player_map is read-only: bots are changed with seat(), or by assigning a new
+    player_map, both of which drop the subscribers worked out so far. Call
+    refresh() after changing the handlers of a seated bot.
+    """
+
+    player_map: Mapping[Player, AnyBot]
+    _public: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _private: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
-    def emit_public_notification(self, notification: dict):
-        for _, bot in self.player_map.items():
-            bot.on_public_notification(notification)
+    def __setattr__(self, name, value):
+        if name == "player_map":
+            value = MappingProxyType(dict(value))
+            if "_public" in self.__dict__:
+                self.refresh()
+        object.__setattr__(self, name, value)
 
-    def emit_private_notification(self, player: Player, notification: dict):
-        self.player_map[player].on_private_notification(notification)
+    def get_bot(self, player: Player) -> AnyBot:
+        return self.player_map[player]
+
+    def seat(self, player: Player, bot: AnyBot):
+        """
+        Seats the bot as the player, replacing any bot already there.
+        """
+        self.player_map = {**self.player_map, player: bot}
+
+    def refresh(self):
+        self._public.clear()
+        self._private.clear()
+
+    def public_subscribers(self, kind: type) -> Subscribers:
+        subscribers = self._public.get(kind)
+        if subscribers is None:
+            subscribers = self._public[kind] = [
+                (bot.on_public_notification, receives_events(bot))
+                for bot in self.player_map.values()
+                if is_subscribed(bot, "on_public_notification", kind)
+            ]
+        return subscribers
+
+    def private_subscribers(self, player: Player, kind: type) -> Subscribers:
+        subscribers = self._private.get((player, kind))
+        if subscribers is None:
+            bot = self.player_map[player]
+            subscribers = self._private[(player, kind)] = []
+            if is_subscribed(bot, "on_private_notification", kind):
+                subscribers.append((bot.on_private_notification, receives_events(bot)))
+        return subscribers
+
+    def emit_public_notification(self, notification: Notification):
+        self._emit(self.public_subscribers(type(notification)), notification)
+
+    def emit_private_notification(self, player: Player, notification: Notification):
+        self._emit(self.private_subscribers(player, type(notification)), notification)
+
+    @staticmethod
+    def _emit(subscribers: Subscribers, notification: Notification):
+        legacy = None
+        for handler, wants_events in subscribers:
+            if wants_events:
+                handler(notification)
+            else:
+                if legacy is None:
+                    legacy = as_dict(notification)
+                handler(legacy)
+
+
+def receives_events(bot: AnyBot) -> bool:
+    # `is True`, so that mocks of bots get dicts
+    return getattr(bot, "receives_events", False) is True
+
+
+def is_subscribed(bot: AnyBot, handler: str, kind: type) -> bool:
+    # looked up on the bot, so that handlers assigned to an instance count
+    method = getattr(getattr(bot, handler, None), "__func__", None)
+    if method is not None and method in (
+        getattr(BaseBot, handler),
+        getattr(AsyncBaseBot, handler),
+    ):
+        return False
+
+    subscriptions = getattr(bot, "subscriptions", None)
+    if not isinstance(subscriptions, Collection) or not issubclass(kind, Event):
+        # all notifications, and dicts cannot be told apart by type
+        return True
+    return issubclass(kind, tuple(subscriptions))
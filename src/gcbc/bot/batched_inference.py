@@ -0,0 +1,203 @@
+import asyncio
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from gcbc.bot.base_bot import AsyncBaseBot, BaseBot
+from gcbc.bot.observation import encode_observation, move_index
+from gcbc.core.core_data import DeckState, Player, TableTopGameState, TurnPhase
+from gcbc.operators.base_operator import BaseOperator
+from gcbc.operators.legal_moves import legal_moves
+
+"""
+Batches the forward passes of neural bots across many games. Bots submit their
+observations to a shared InferenceBatcher, which runs the model on everything
+queued once `max_batch_size` observations are waiting or the oldest has waited
+`max_wait` seconds, and hands each bot back its own row of the output.
+
+The games have to run concurrently for batches to fill up: on threads with
+PolicyBot, or interleaved on an event loop with the AsyncGCBCGameEngine and
+AsyncPolicyBot.
+"""
+
+# maps a (batch, observation_size) array to a (batch, num_moves) array of scores
+Model = Callable[[np.ndarray], np.ndarray]
+
+
+class InferenceBatcher:
+    def __init__(self, model: Model, max_batch_size: int = 64, max_wait: float = 0.005):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self.requests: queue.Queue = queue.Queue()
+        self.batches = 0
+        self.observations = 0
+        self.closed = False
+        self.thread = threading.Thread(
+            target=self._run, name="gcbc-inference", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, observation: np.ndarray) -> Future:
+        """
+        Queues one observation, returning a future for its row of the model's
+        output.
+        """
+        if self.closed:
+            raise RuntimeError("the batcher is closed")
+        future: Future = Future()
+        self.requests.put((observation, future))
+        return future
+
+    def infer(self, observation: np.ndarray) -> np.ndarray:
+        return self.submit(observation).result()
+
+    async def infer_async(self, observation: np.ndarray) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(observation))
+
+    def _next_batch(self) -> Optional[List[Tuple[np.ndarray, Future]]]:
+        request = self.requests.get()
+        if request is None:
+            return None
+
+        batch = [request]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                request = self.requests.get(
+                    timeout=max(0.0, deadline - time.perf_counter())
+                )
+            except queue.Empty:
+                break
+            if request is None:
+                # flush what we have, and stop on the next call
+                self.requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            futures = [future for _, future in batch]
+            try:
+                outputs = self.model(np.stack([observation for observation, _ in batch]))
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.observations += len(batch)
+            for future, output in zip(futures, outputs):
+                future.set_result(output)
+
+    def close(self):
+        """
+        Runs whatever is still queued, then stops the batching thread.
+        """
+        if not self.closed:
+            self.closed = True
+            self.requests.put(None)
+            self.thread.join()
+
+    def __enter__(self) -> "InferenceBatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PolicyMixin:
+    """
+    Plays the legal move the model scores highest, with ties broken at random
+    from `rng`, or the global random module if none is given. The pre-round and
+    aim phases may also make no move.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        batcher: InferenceBatcher,
+        rng: Optional[random.Random] = None,
+    ):
+        self.player = player
+        self.batcher = batcher
+        self.rng = rng if rng is not None else random
+
+    def _request(
+        self, phase: TurnPhase, game_state: TableTopGameState, deck_state: DeckState
+    ) -> Tuple[List[Optional[BaseOperator]], np.ndarray]:
+        moves: List[Optional[BaseOperator]] = list(
+            legal_moves(game_state, deck_state, self.player, phase)
+        )
+        if phase != TurnPhase.ACTION:
+            moves.append(None)
+        return moves, encode_observation(game_state, deck_state, self.player)
+
+    def _choose(
+        self,
+        moves: List[Optional[BaseOperator]],
+        scores: np.ndarray,
+        num_players: int,
+    ) -> Optional[BaseOperator]:
+        move_scores = [scores[move_index(move, self.player, num_players)] for move in moves]
+        best = max(move_scores)
+        return self.rng.choice(
+            [move for move, score in zip(moves, move_scores) if score == best]
+        )
+
+
+class PolicyBot(PolicyMixin, BaseBot):
+    """
+    A neural policy bot for engines running on threads. Blocks until its batch
+    has run.
+    """
+
+    def _decide(self, phase, game_state, deck_state) -> Optional[BaseOperator]:
+        moves, observation = self._request(phase, game_state, deck_state)
+        if all(move is None for move in moves):
+            return None
+        scores = self.batcher.infer(observation)
+        return self._choose(moves, scores, len(game_state.state))
+
+    def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._decide(TurnPhase.PRE_ROUND, game_state, deck_state)
+
+    def action(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._decide(TurnPhase.ACTION, game_state, deck_state)
+
+    def aim(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._decide(TurnPhase.AIM, game_state, deck_state)
+
+
+class AsyncPolicyBot(PolicyMixin, AsyncBaseBot):
+    """
+    A neural policy bot for the AsyncGCBCGameEngine, which yields to the other
+    games on the loop while its batch runs.
+    """
+
+    async def _decide(self, phase, game_state, deck_state) -> Optional[BaseOperator]:
+        moves, observation = self._request(phase, game_state, deck_state)
+        if all(move is None for move in moves):
+            return None
+        scores = await self.batcher.infer_async(observation)
+        return self._choose(moves, scores, len(game_state.state))
+
+    async def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
+        return await self._decide(TurnPhase.PRE_ROUND, game_state, deck_state)
+
+    async def action(self, game_state: TableTopGameState, deck_state: DeckState):
+        return await self._decide(TurnPhase.ACTION, game_state, deck_state)
+
+    async def aim(self, game_state: TableTopGameState, deck_state: DeckState):
+        return await self._decide(TurnPhase.AIM, game_state, deck_state)
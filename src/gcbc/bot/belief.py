@@ -0,0 +1,278 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+from gcbc.bot.determinization import (
+    AGENT,
+    BAD_COP,
+    GOOD_COP,
+    KINGPIN,
+    Knowledge,
+    Position,
+    flip_code,
+)
+from gcbc.bot.inference import Posterior, dealt_counts, infer, majority_table
+from gcbc.core.core_data import (
+    ActionType,
+    Card,
+    EquipmentCard,
+    IntegrityCard,
+    Player,
+    PlayerHealthState,
+    RoleType,
+    TableTopGameState,
+)
+from gcbc.core.events import Notification, as_dict
+from gcbc.core.packed import CARDS_PER_PLAYER, INTEGRITY_CARD_CODES, INTEGRITY_CARDS
+
+"""
+Keeps a player's beliefs about the hidden cards up to date from their
+notifications.
+
+The worlds believed in are those of gcbc.bot.inference: the dealt cards the
+player hasn't seen, arranged over the positions they haven't seen, each as
+likely as the next as long as the game isn't over. The probabilities follow
+from a few totals: how many of each dealt card are unseen, how many positions
+are unseen at each seat and at the live seats, and who holds a kingpin or agent
+that has been seen. Each notification changes them in a few places, and any
+probability is a few lookups away.
+"""
+
+# the card a dealt card shows after an odd number of blackmails, by code
+FLIPPED = tuple(flip_code(code) for code in range(len(INTEGRITY_CARDS)))
+
+
+class BeliefState(Knowledge):
+    """
+    A player's Knowledge, with the totals its beliefs need kept as it changes.
+    Forward the player's notifications to it, and show it the table with
+    observe_table() after an Equip or ArmAndAim, so that it reads the card
+    turned face-up, and after a Shoot or Defibrillator, so that it reads who is
+    dead. Its probabilities then agree with posterior() on the same table.
+    """
+
+    def __init__(self, player: Player, num_players: int):
+        super().__init__(player)
+        self.num_players = num_players
+        self.unseen = list(dealt_counts(num_players))  # dealt cards not seen, by code
+        self.hidden = [CARDS_PER_PLAYER] * num_players  # unseen positions, by seat
+        # unseen positions at the live seats, and the sum of their squares by seat
+        self.live_hidden = num_players * CARDS_PER_PLAYER
+        self.live_squares = num_players * CARDS_PER_PLAYER**2
+        self.dead: Set[Player] = set()
+        self.holders: Dict[int, Player] = {}  # the seat of a seen kingpin or agent
+
+        # what observe_table() has yet to read: cards turned face-up, and seats
+        # that were shot or revived
+        self.turned_up: Set[Position] = set()
+        self.health_changed: Set[Player] = set()
+
+    @property
+    def num_unseen(self) -> int:
+        return sum(self.unseen)
+
+    def _dealt(self, position: Position) -> int:
+        code = INTEGRITY_CARD_CODES[self.cards[position]]
+        return FLIPPED[code] if position in self.flipped else code
+
+    def _hide(self, player: Player, change: int):
+        hidden = self.hidden[player]
+        if player not in self.dead:
+            self.live_hidden += change
+            self.live_squares += (hidden + change) ** 2 - hidden**2
+        self.hidden[player] = hidden + change
+
+    def _uncount(self, positions: Iterable[Position]):
+        for position in positions:
+            if position in self.cards:
+                code = self._dealt(position)
+                self.unseen[code] += 1
+                if code in (KINGPIN, AGENT):
+                    del self.holders[code]
+            else:
+                self._hide(position[0], -1)
+
+    def _count(self, positions: Iterable[Position]):
+        for position in positions:
+            if position in self.cards:
+                code = self._dealt(position)
+                self.unseen[code] -= 1
+                if code in (KINGPIN, AGENT):
+                    self.holders[code] = position[0]
+            else:
+                self._hide(position[0], 1)
+
+    def _set_dead(self, player: Player, dead: bool):
+        if dead == (player in self.dead):
+            return
+        hidden = self.hidden[player]
+        sign = -1 if dead else 1
+        self.live_hidden += sign * hidden
+        self.live_squares += sign * hidden**2
+        if dead:
+            self.dead.add(player)
+        else:
+            self.dead.discard(player)
+
+    def on_public_notification(self, notification: Notification):
+        notification = as_dict(notification)
+        action = notification["action"]
+
+        positions: List[Position] = []
+        if action in (ActionType.EQUIP, ActionType.ARM_AND_AIM):
+            self.turned_up.add((notification["actor"], notification["card_to_flip"]))
+        elif action == ActionType.SHOOT:
+            self.health_changed.add(notification["target"])
+        elif action == EquipmentCard.DEFIBRILLATOR:
+            self.health_changed.add(notification["revived"])
+        elif action == EquipmentCard.SWAP:
+            a = (notification["playerA"], notification["cardA"])
+            b = (notification["playerB"], notification["cardB"])
+            positions = [a, b]
+            if (a in self.turned_up) != (b in self.turned_up):
+                self.turned_up ^= {a, b}
+        elif action == EquipmentCard.BLACKMAIL:
+            positions = [
+                (notification["target"], index) for index in range(CARDS_PER_PLAYER)
+            ]
+
+        self._uncount(positions)
+        super().on_public_notification(notification)
+        self._count(positions)
+
+    def on_private_notification(self, notification: Notification):
+        notification = as_dict(notification)
+        action = notification["action"]
+        data = notification["private_data"]
+
+        positions: List[Position] = []
+        if action == ActionType.INVESTIGATE:
+            positions = [(data["target"], data["target_card"])]
+        elif action == EquipmentCard.POLYGRAPH:
+            positions = [
+                (player, index)
+                for player in (data["actor"], data["target"])
+                for index in range(CARDS_PER_PLAYER)
+            ]
+        elif action == EquipmentCard.SWAP:
+            positions = [(data["playerA"], data["cardA"]), (data["playerB"], data["cardB"])]
+
+        self._uncount(positions)
+        super().on_private_notification(notification)
+        self._count(positions)
+
+    def learn(self, position: Position, card: IntegrityCard):
+        """
+        Records a card seen some other way, e.g. face-up on the table.
+        """
+        self._uncount([position])
+        self.cards[position] = card
+        self._count([position])
+
+    def observe_table(self, game_state: TableTopGameState):
+        """
+        Reads the cards turned face-up, and the health of the seats shot or
+        revived, since the table was last observed.
+        """
+        for player, index in self.turned_up:
+            card = game_state.state[player].integrity_cards[index].card
+            if card != IntegrityCard.UNKNOWN:
+                self.learn((player, index), card)
+        self.turned_up.clear()
+
+        for player in self.health_changed:
+            self._set_dead(
+                player, game_state.state[player].health == PlayerHealthState.DEAD
+            )
+        self.health_changed.clear()
+
+    # Queries
+
+    def _holds(self, player: Player, code: int) -> float:
+        holder = self.holders.get(code)
+        if holder is not None:
+            return float(holder == player)
+        if player in self.dead:
+            return 0.0
+
+        hidden = self.hidden[player]
+        other = self.holders.get(AGENT if code == KINGPIN else KINGPIN)
+        if other is None:
+            # both are unseen: one can be in any live unseen position, and the
+            # other in any outside its seat
+            placements = self.live_hidden**2 - self.live_squares
+            together = hidden * (self.live_hidden - hidden)
+        elif other == player:
+            return 0.0
+        else:
+            placements = self.live_hidden
+            if other not in self.dead:
+                placements -= self.hidden[other]
+            together = hidden
+        if placements == 0:
+            raise ValueError("no world is consistent with what is known")
+        return together / placements
+
+    def kingpin_probability(self, player: Player) -> float:
+        return self._holds(player, KINGPIN)
+
+    def agent_probability(self, player: Player) -> float:
+        return self._holds(player, AGENT)
+
+    def card_probabilities(self, player: Player, index: Card) -> Dict[IntegrityCard, float]:
+        position = (player, index)
+        if position in self.cards:
+            return {self.cards[position]: 1.0}
+
+        # every unseen position of a seat is as likely as the next to hold a
+        # special, and any cop is good or bad in proportion to the cops left
+        hidden = self.hidden[player]
+        kingpin = self.kingpin_probability(player) / hidden
+        agent = self.agent_probability(player) / hidden
+        cop = (1.0 - kingpin - agent) / max(1, self.unseen[GOOD_COP] + self.unseen[BAD_COP])
+
+        flipped = position in self.flipped
+        probabilities: Dict[IntegrityCard, float] = {}
+        for code, probability in (
+            (KINGPIN, kingpin),
+            (AGENT, agent),
+            (GOOD_COP, cop * self.unseen[GOOD_COP]),
+            (BAD_COP, cop * self.unseen[BAD_COP]),
+        ):
+            if probability:
+                probabilities[INTEGRITY_CARDS[FLIPPED[code] if flipped else code]] = probability
+        return probabilities
+
+    def _seat(self, player: Player) -> Tuple[int, int, int, int]:
+        """
+        The seat's unseen positions, unflipped and flipped, and the cops seen.
+        """
+        seat = [0, 0, 0, 0]
+        for index in range(CARDS_PER_PLAYER):
+            position = (player, index)
+            card = self.cards.get(position)
+            if card is None:
+                seat[int(position in self.flipped)] += 1
+            elif card == IntegrityCard.GOOD_COP:
+                seat[2] += 1
+            elif card == IntegrityCard.BAD_COP:
+                seat[3] += 1
+        unflipped, flipped, good, bad = seat
+        return unflipped, flipped, good, bad
+
+    def team_probabilities(self, player: Player) -> Dict[RoleType, float]:
+        kingpin = self.kingpin_probability(player)
+        agent = self.agent_probability(player)
+        mostly_good = majority_table(self.unseen[GOOD_COP], self.unseen[BAD_COP])[
+            self._seat(player)
+        ]
+        neither = 1.0 - kingpin - agent
+        return {
+            RoleType.GOOD: agent + neither * float(mostly_good),
+            RoleType.BAD: kingpin + neither * (1.0 - float(mostly_good)),
+        }
+
+    def posterior(self, game_state: TableTopGameState) -> Posterior:
+        """
+        The posterior of every seat, worked out from the table the bot is handed
+        by gcbc.bot.inference.infer().
+        """
+        return infer(game_state, self)
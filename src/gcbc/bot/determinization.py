@@ -0,0 +1,383 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union, overload
+
+import numpy as np
+
+from gcbc.core.core_data import (
+    ActionType,
+    Card,
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    Player,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+    UnknownEquipmentCards,
+)
+from gcbc.core.events import Notification, as_dict
+from gcbc.core.packed import (
+    CARDS_PER_PLAYER,
+    DECK_EQUIPMENT,
+    EQUIPMENT_CARDS,
+    EQUIPMENT_CODES,
+    INTEGRITY_CARD_CODES,
+    INTEGRITY_CARDS,
+)
+from gcbc.engine.state_init import GCBCInitalizer
+
+"""
+Samples the hidden cards of a table, for search bots that play imperfect-
+information games by searching concrete worlds.
+
+A player's Knowledge records what they have learned from their notifications.
+A DeterminizationSampler combines it with the table they can see into the
+constraints every world must meet, once, and then draws any number of worlds
+uniformly from those consistent with them.
+
+Blackmail turns good cops into bad cops and back, so the cards on the table
+need not have the counts they were dealt with. Instead, every card is the card
+it was dealt as, flipped once for each time it was blackmailed; the dealt cards
+have the counts of GCBCInitalizer.integrity_cards, and how often each card was
+blackmailed is public.
+"""
+
+Position = Tuple[Player, Card]
+
+KINGPIN = INTEGRITY_CARD_CODES[IntegrityCard.KINGPIN]
+AGENT = INTEGRITY_CARD_CODES[IntegrityCard.AGENT]
+GOOD_COP = INTEGRITY_CARD_CODES[IntegrityCard.GOOD_COP]
+BAD_COP = INTEGRITY_CARD_CODES[IntegrityCard.BAD_COP]
+UNKNOWN = -1
+
+USED_EQUIPMENT = (
+    EquipmentCard.TASER,
+    EquipmentCard.DEFIBRILLATOR,
+    EquipmentCard.BLACKMAIL,
+    EquipmentCard.POLYGRAPH,
+    EquipmentCard.SWAP,
+)
+
+
+def flip_code(code: int) -> int:
+    return INTEGRITY_CARD_CODES[INTEGRITY_CARDS[code].flip()]
+
+
+class Knowledge:
+    """
+    What one player knows of the hidden cards: the cards they were shown by
+    investigations, polygraphs and swaps, which cards were blackmailed, and the
+    equipment they drew. Forward the player's notifications to it.
+
+    Cards move with swaps and flip with blackmail, both of which are public, so
+    what was learned stays correct until the game ends.
+    """
+
+    def __init__(self, player: Player):
+        self.player = player
+        self.cards: Dict[Position, IntegrityCard] = {}
+        # cards blackmailed an odd number of times
+        self.flipped: Set[Position] = set()
+        self.equipment: Optional[EquipmentCard] = None
+
+    def on_public_notification(self, notification: Notification):
+        notification = as_dict(notification)
+        action = notification["action"]
+
+        if action == EquipmentCard.SWAP:
+            a = (notification["playerA"], notification["cardA"])
+            b = (notification["playerB"], notification["cardB"])
+            self._swap(self.cards, a, b)
+            if (a in self.flipped) != (b in self.flipped):
+                self.flipped ^= {a, b}
+        elif action == EquipmentCard.BLACKMAIL:
+            target = notification["target"]
+            for index in range(CARDS_PER_PLAYER):
+                position = (target, index)
+                self.flipped ^= {position}
+                if position in self.cards:
+                    self.cards[position] = self.cards[position].flip()
+
+        if action in USED_EQUIPMENT and notification["actor"] == self.player:
+            self.equipment = None
+
+    def on_private_notification(self, notification: Notification):
+        notification = as_dict(notification)
+        action = notification["action"]
+        data = notification["private_data"]
+
+        if action == ActionType.INVESTIGATE:
+            self.cards[(data["target"], data["target_card"])] = data["card_value"]
+        elif action == ActionType.EQUIP:
+            self.equipment = data["equipped_card"]
+        elif action == EquipmentCard.POLYGRAPH:
+            for player, cards in (
+                (data["actor"], data["actor_cards"]),
+                (data["target"], data["target_cards"]),
+            ):
+                for index, card in enumerate(cards):
+                    self.cards[(player, index)] = card
+        elif action == EquipmentCard.SWAP:
+            # sent after the swap, with the cards now in each position
+            self.cards[(data["playerA"], data["cardA"])] = data["cardAValue"]
+            self.cards[(data["playerB"], data["cardB"])] = data["cardBValue"]
+
+    @staticmethod
+    def _swap(cards: Dict[Position, IntegrityCard], a: Position, b: Position):
+        card_a = cards.pop(a, None)
+        card_b = cards.pop(b, None)
+        if card_a is not None:
+            cards[b] = card_a
+        if card_b is not None:
+            cards[a] = card_b
+
+
+class Worlds(Sequence[Tuple[TableTopGameState, DeckState]]):
+    """
+    Sampled worlds, held as arrays of card and equipment codes and built into a
+    table and deck only when indexed. Slicing gives the Worlds of those samples.
+    """
+
+    def __init__(
+        self,
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+        cards: np.ndarray,
+        equipment: np.ndarray,
+        deck: np.ndarray,
+    ):
+        self.game_state = game_state
+        self.deck_state = deck_state
+        self.cards = cards  # (worlds, players, CARDS_PER_PLAYER) card codes
+        self.equipment = equipment  # (worlds, players) equipment codes
+        self.deck = deck  # (worlds, deck size) equipment codes, bottom first
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    @overload
+    def __getitem__(self, world: int) -> Tuple[TableTopGameState, DeckState]:
+        ...
+
+    @overload
+    def __getitem__(self, world: slice) -> "Worlds":
+        ...
+
+    def __getitem__(
+        self, world: Union[int, slice]
+    ) -> Union[Tuple[TableTopGameState, DeckState], "Worlds"]:
+        if isinstance(world, slice):
+            return Worlds(
+                self.game_state,
+                self.deck_state,
+                self.cards[world],
+                self.equipment[world],
+                self.deck[world],
+            )
+        table_top_state = {}
+        cards = self.cards[world].tolist()
+        equipment = self.equipment[world].tolist()
+        for player, player_state in self.game_state.state.items():
+            gun = player_state.gun
+            table_top_state[player] = PlayerGameState(
+                integrity_cards=[
+                    PlayerIntegrityCardState(INTEGRITY_CARDS[code], card_state.face_up)
+                    for code, card_state in zip(
+                        cards[player], player_state.integrity_cards
+                    )
+                ],
+                gun=PlayerGunState(gun.has_gun, gun.aimed_at) if gun is not None else None,
+                equipment=EQUIPMENT_CARDS[equipment[player]],
+                health=player_state.health,
+            )
+        deck = DeckState(
+            [DECK_EQUIPMENT[code] for code in self.deck[world].tolist()],
+            self.deck_state.guns,
+        )
+        return TableTopGameState(table_top_state), deck
+
+
+class DeterminizationSampler:
+    """
+    Draws the worlds consistent with a table, as one player sees it, and what they
+    know. Cards that are face-up, shown in the table given, or known are fixed;
+    the rest are the dealt cards left over, arranged uniformly at random among
+    the unknown positions, subject to the game not being over: no dead player
+    holds the kingpin or the agent, and no live player holds both.
+
+    The constraints are worked out once, when the sampler is made, so that each
+    batch of worlds costs a few array operations.
+    """
+
+    def __init__(
+        self,
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+        knowledge: Optional[Knowledge] = None,
+    ):
+        self.game_state = game_state
+        self.deck_state = deck_state
+        num_players = len(game_state.state)
+        self.num_players = num_players
+        knowledge = knowledge if knowledge is not None else Knowledge(-1)
+
+        # what is known of the card in every position, and which are flipped
+        size = num_players * CARDS_PER_PLAYER
+        self.cards = np.full(size, UNKNOWN, dtype=np.int8)
+        self.flipped = np.zeros(size, dtype=bool)
+        dealt = {code: 0 for code in range(len(INTEGRITY_CARDS))}
+        for card in GCBCInitalizer.integrity_cards(num_players):
+            dealt[INTEGRITY_CARD_CODES[card]] += 1
+
+        alive = np.zeros(size, dtype=bool)
+        for player in range(num_players):
+            player_state = game_state.state[player]
+            for index, card_state in enumerate(player_state.integrity_cards):
+                position = player * CARDS_PER_PLAYER + index
+                alive[position] = player_state.health != PlayerHealthState.DEAD
+                self.flipped[position] = (player, index) in knowledge.flipped
+
+                card = card_state.card
+                if card == IntegrityCard.UNKNOWN:
+                    card = knowledge.cards.get((player, index), card)
+                if card == IntegrityCard.UNKNOWN:
+                    continue
+
+                code = INTEGRITY_CARD_CODES[card]
+                self.cards[position] = code
+                dealt[flip_code(code) if self.flipped[position] else code] -= 1
+
+        if any(count < 0 for count in dealt.values()):
+            raise ValueError("the cards known don't match the cards dealt")
+
+        self.unknown = np.flatnonzero(self.cards == UNKNOWN)
+        self.unknown_flipped = self.flipped[self.unknown]
+        self.placements = self._special_placements(dealt, alive)
+        self.cops = np.asarray(
+            [GOOD_COP] * dealt[GOOD_COP] + [BAD_COP] * dealt[BAD_COP], dtype=np.int8
+        )
+        if len(self.cops) + dealt[KINGPIN] + dealt[AGENT] != len(self.unknown):
+            raise ValueError("the cards known don't match the cards dealt")
+        self.sample_kingpin = dealt[KINGPIN] == 1
+        self.sample_agent = dealt[AGENT] == 1
+
+        self._equipment_slots(game_state, deck_state, knowledge)
+
+    def _special_placements(self, dealt: Dict[int, int], alive: np.ndarray) -> np.ndarray:
+        """
+        Every valid (kingpin, agent) pair of positions for the specials left to
+        place, -1 for one that is already known.
+        """
+        def player_of(position: int) -> Optional[Player]:
+            return position // CARDS_PER_PLAYER if position != -1 else None
+
+        candidates = [int(position) for position in self.unknown if alive[position]]
+        known = {}
+        for code in (KINGPIN, AGENT):
+            positions = np.flatnonzero(self.cards == code)
+            if len(positions):
+                known[code] = player_of(int(positions[0]))
+
+        placements = []
+        for kingpin in candidates if dealt[KINGPIN] else [-1]:
+            kingpin_player = known.get(KINGPIN, player_of(kingpin))
+            for agent in candidates if dealt[AGENT] else [-1]:
+                # which also keeps them out of the same position
+                if known.get(AGENT, player_of(agent)) != kingpin_player:
+                    placements.append((kingpin, agent))
+
+        if not placements:
+            raise ValueError("no world is consistent with what is known")
+        return np.asarray(placements, dtype=np.intp)
+
+    def _equipment_slots(
+        self,
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+        knowledge: Knowledge,
+    ):
+        self.equipment = np.zeros(self.num_players, dtype=np.int8)
+        self.unknown_holders = []
+        remaining = list(GCBCInitalizer.equipment_cards())
+
+        for player in range(self.num_players):
+            equipment = game_state.state[player].equipment
+            if equipment == EquipmentCard.UNKNOWN and player == knowledge.player:
+                equipment = knowledge.equipment or equipment
+            if equipment == EquipmentCard.UNKNOWN:
+                self.unknown_holders.append(player)
+                continue
+            self.equipment[player] = EQUIPMENT_CODES[equipment]
+            if equipment is not None:
+                remaining.remove(equipment)
+
+        cards = deck_state.equipment_cards
+        self.deck_unknown = isinstance(cards, UnknownEquipmentCards) or any(
+            card == EquipmentCard.UNKNOWN for card in cards
+        )
+        if self.deck_unknown:
+            self.deck_size = len(cards)
+        else:
+            self.deck = np.asarray([EQUIPMENT_CODES[card] for card in cards], dtype=np.int8)
+            for card in cards:
+                remaining.remove(card)
+            self.deck_size = 0
+
+        if len(remaining) != len(self.unknown_holders) + self.deck_size:
+            raise ValueError("the equipment known doesn't match the equipment cards")
+        self.remaining_equipment = np.asarray(
+            [EQUIPMENT_CODES[card] for card in remaining], dtype=np.int8
+        )
+
+    def sample_many(
+        self, num_worlds: int, rng: Optional[np.random.Generator] = None
+    ) -> Worlds:
+        rng = rng if rng is not None else np.random.default_rng()
+        rows = np.arange(num_worlds)
+
+        cards = np.tile(self.cards, (num_worlds, 1))
+        placements = self.placements[rng.integers(len(self.placements), size=num_worlds)]
+        if self.sample_kingpin:
+            cards[rows, placements[:, 0]] = KINGPIN
+        if self.sample_agent:
+            cards[rows, placements[:, 1]] = AGENT
+
+        # the cops fill the unknown positions the specials didn't take, in order
+        unknown = cards[:, self.unknown]
+        free = unknown == UNKNOWN
+        unknown[free] = rng.permuted(
+            np.broadcast_to(self.cops, (num_worlds, len(self.cops))), axis=1
+        ).ravel()
+        unknown[:, self.unknown_flipped] ^= (
+            unknown[:, self.unknown_flipped] >= GOOD_COP
+        ).astype(np.int8)
+        cards[:, self.unknown] = unknown
+
+        equipment = np.tile(self.equipment, (num_worlds, 1))
+        shuffled = rng.permuted(
+            np.broadcast_to(
+                self.remaining_equipment, (num_worlds, len(self.remaining_equipment))
+            ),
+            axis=1,
+        )
+        holders = len(self.unknown_holders)
+        equipment[:, self.unknown_holders] = shuffled[:, :holders]
+        deck = (
+            shuffled[:, holders:]
+            if self.deck_unknown
+            else np.tile(self.deck, (num_worlds, 1))
+        )
+
+        return Worlds(
+            self.game_state,
+            self.deck_state,
+            cards.reshape(num_worlds, self.num_players, CARDS_PER_PLAYER),
+            equipment,
+            deck,
+        )
+
+    def sample(
+        self, rng: Optional[np.random.Generator] = None
+    ) -> Tuple[TableTopGameState, DeckState]:
+        return self.sample_many(1, rng)[0]
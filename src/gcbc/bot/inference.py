@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb, perm
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from gcbc.bot.determinization import (
+    AGENT,
+    BAD_COP,
+    GOOD_COP,
+    KINGPIN,
+    Knowledge,
+    flip_code,
+)
+from gcbc.core.core_data import (
+    IntegrityCard,
+    Player,
+    PlayerHealthState,
+    RoleType,
+    TableTopGameState,
+)
+from gcbc.core.packed import CARDS_PER_PLAYER, INTEGRITY_CARD_CODES, INTEGRITY_CARDS
+from gcbc.engine.state_init import GCBCInitalizer
+
+"""
+Exact beliefs about who holds what, by counting rather than sampling.
+
+The worlds are those a DeterminizationSampler draws from, each as likely as the
+next: the dealt cards nobody has seen, arranged over the positions nobody has
+seen, with no dead player holding the kingpin or the agent and no live player
+holding both. Every placement of the kingpin and the agent leaves the same
+number of arrangements of the cops, so
+
+- where the specials are is uniform over their valid placements, which are
+  counted seat by seat: the kingpin can be in any live unseen position, and the
+  agent in any of those outside the kingpin's seat
+- a seat without either draws its unseen cards from the cops left over, so
+  whether it is on the good team follows from a hypergeometric count, which only
+  depends on the cops left and the seat's unseen and seen cards, and is looked up
+  from a table made once per count of cops
+"""
+
+
+@dataclass
+class Posterior:
+    """
+    The probability, for each seat, that it holds the kingpin or the agent, and
+    that it is on the good or the bad team.
+    """
+
+    kingpin: np.ndarray
+    agent: np.ndarray
+    good: np.ndarray
+    bad: np.ndarray
+
+    def team_probabilities(self, player: Player) -> Dict[RoleType, float]:
+        return {
+            RoleType.GOOD: float(self.good[player]),
+            RoleType.BAD: float(self.bad[player]),
+        }
+
+
+@lru_cache(maxsize=None)
+def dealt_counts(num_players: int) -> Tuple[int, ...]:
+    counts = [0] * len(INTEGRITY_CARDS)
+    for card in GCBCInitalizer.integrity_cards(num_players):
+        counts[INTEGRITY_CARD_CODES[card]] += 1
+    return tuple(counts)
+
+
+@lru_cache(maxsize=1024)
+def majority_table(good: int, bad: int) -> np.ndarray:
+    """
+    The probability that a hand is mostly good cops, indexed by its unseen
+    unflipped and flipped positions and its seen good and bad cops, when its
+    unseen cards are drawn from `good` good and `bad` bad dealt cops.
+    """
+    size = CARDS_PER_PLAYER + 1
+    table = np.zeros((size, size, size, size))
+    cops = good + bad
+    for unflipped in range(size):
+        for flipped in range(size - unflipped):
+            drawn = unflipped + flipped
+            if drawn > cops:
+                continue
+            # how likely each count of good cops among the unflipped and flipped
+            draws = {}
+            for i in range(unflipped + 1):
+                for j in range(flipped + 1):
+                    goods = i + j
+                    draws[i, j] = (
+                        comb(unflipped, i)
+                        * comb(flipped, j)
+                        * perm(good, goods)
+                        * perm(bad, drawn - goods)
+                        / perm(cops, drawn)
+                    )
+            for seen_good in range(size - drawn):
+                for seen_bad in range(size - drawn - seen_good):
+                    table[unflipped, flipped, seen_good, seen_bad] = sum(
+                        p
+                        for (i, j), p in draws.items()
+                        if seen_good + i + flipped - j > seen_bad + unflipped - i + j
+                    )
+    table.flags.writeable = False
+    return table
+
+
+def infer(
+    game_state: TableTopGameState, knowledge: Optional[Knowledge] = None
+) -> Posterior:
+    """
+    The posterior of every seat, given the table a bot is handed and what it
+    knows. Raises ValueError if no world is consistent with them.
+    """
+    knowledge = knowledge if knowledge is not None else Knowledge(-1)
+    num_players = len(game_state.state)
+    unseen = list(dealt_counts(num_players))
+
+    alive = np.zeros(num_players, dtype=bool)
+    # per seat: unseen positions, unflipped and flipped, and the cops seen
+    seat = np.zeros((4, num_players), dtype=np.intp)
+    holders: Dict[int, Optional[Player]] = {KINGPIN: None, AGENT: None}
+    for player in range(num_players):
+        player_state = game_state.state[player]
+        alive[player] = player_state.health != PlayerHealthState.DEAD
+        for index, card_state in enumerate(player_state.integrity_cards):
+            position = (player, index)
+            is_flipped = position in knowledge.flipped
+            card = card_state.card
+            if card == IntegrityCard.UNKNOWN:
+                card = knowledge.cards.get(position, card)
+            if card == IntegrityCard.UNKNOWN:
+                seat[int(is_flipped), player] += 1
+                continue
+
+            code = INTEGRITY_CARD_CODES[card]
+            unseen[flip_code(code) if is_flipped else code] -= 1
+            if code in holders:
+                holders[code] = player
+            else:
+                seat[2 if code == GOOD_COP else 3, player] += 1
+
+    unflipped, flipped, seen_good, seen_bad = seat
+    hidden = unflipped + flipped
+    if min(unseen) < 0 or sum(unseen) != hidden.sum():
+        raise ValueError("the cards known don't match the cards dealt")
+
+    # the specials left to place, by where they could go
+    kingpin = np.zeros(num_players)
+    agent = np.zeros(num_players)
+    candidates = np.where(alive, hidden, 0)
+    if unseen[KINGPIN] and unseen[AGENT]:
+        placements = candidates * (candidates.sum() - candidates)
+        kingpin = placements / _total(placements)
+        agent = kingpin.copy()
+    elif unseen[KINGPIN]:
+        candidates[holders[AGENT]] = 0
+        kingpin = candidates / _total(candidates)
+    elif unseen[AGENT]:
+        candidates[holders[KINGPIN]] = 0
+        agent = candidates / _total(candidates)
+    for code, probabilities in ((KINGPIN, kingpin), (AGENT, agent)):
+        if holders[code] is not None:
+            probabilities[holders[code]] = 1.0
+
+    mostly_good = majority_table(unseen[GOOD_COP], unseen[BAD_COP])[
+        unflipped, flipped, seen_good, seen_bad
+    ]
+    neither = 1.0 - kingpin - agent
+    return Posterior(
+        kingpin=kingpin,
+        agent=agent,
+        good=agent + neither * mostly_good,
+        bad=kingpin + neither * (1.0 - mostly_good),
+    )
+
+
+def _total(placements: np.ndarray) -> int:
+    total = placements.sum()
+    if total == 0:
+        raise ValueError("no world is consistent with what is known")
+    return total
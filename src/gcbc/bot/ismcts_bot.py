@@ -0,0 +1,449 @@
+import math
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from gcbc.bot.base_bot import BaseBot
+from gcbc.bot.determinization import DeterminizationSampler, Knowledge
+from gcbc.bot.wire import OPERATOR_FIELDS, OPERATOR_OPCODES, OPERATORS
+from gcbc.core.core_data import (
+    ActionType,
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    Player,
+    TableTopGameState,
+    TurnPhase,
+)
+from gcbc.core.events import Notification, as_dict
+from gcbc.core.packed import NO_OP, OP_SWAP, OPCODES
+from gcbc.engine.engine import find_win_condition, find_winners
+from gcbc.operators.base_operator import BaseOperator
+from gcbc.operators.legal_moves import legal_moves
+
+"""
+An Information-Set Monte Carlo Tree Search bot (single-observer ISMCTS).
+
+Every simulation samples a world consistent with what the bot knows, with a
+DeterminizationSampler, and walks one tree shared by all the worlds: only the
+moves legal in the sampled world are considered, and a move's UCB is computed
+from how often it was available rather than from its parent's visits.
+
+Turns are modelled as the engine plays them, except that the pre-round is only
+searched when the bot is asked for its own pre-round move; in simulations
+players take their action, then may re-aim, then play passes to the next live
+seat. Simulations are played out at random beyond the tree, and score 1 for
+the winners, 0 for everyone else, and 1/2 each if `max_depth` moves pass
+without the game ending.
+"""
+
+MoveKey = Tuple[int, ...]
+Turn = Tuple[Player, TurnPhase]
+
+NO_MOVE: MoveKey = (NO_OP,)
+ACTIONS = {action for action in ActionType if action != ActionType.AIM}
+
+
+def canonical_key(key: MoveKey) -> MoveKey:
+    """
+    A Swap and its mirror image are one move, and legal_moves only lists the one
+    with the lower seat as playerA, so the other is keyed as that one.
+    """
+    if key[0] == OP_SWAP and key[2] > key[4]:
+        opcode, user, player_a, card_a, player_b, card_b = key
+        return (opcode, user, player_b, card_b, player_a, card_a)
+    return key
+
+
+def move_key(move: Optional[BaseOperator]) -> MoveKey:
+    if move is None:
+        return NO_MOVE
+    cls = type(move)
+    return canonical_key(
+        (OPERATOR_OPCODES[cls], *(getattr(move, name) for name in OPERATOR_FIELDS[cls]))
+    )
+
+
+def key_move(key: MoveKey) -> Optional[BaseOperator]:
+    if key == NO_MOVE:
+        return None
+    return OPERATORS[key[0]](*key[1:])
+
+
+def notification_key(notification: Notification) -> Optional[MoveKey]:
+    """
+    The move a public notification reports. Events list the fields of their
+    operator, in order.
+    """
+    notification = as_dict(notification)
+    opcode = OPCODES.get(notification["action"])
+    if opcode is None:
+        return None
+    return canonical_key(
+        (opcode, *(value for name, value in notification.items() if name != "action"))
+    )
+
+
+def next_alive(game_state: TableTopGameState, player: Player) -> Player:
+    num_players = len(game_state.state)
+    for offset in range(1, num_players + 1):
+        other = (player + offset) % num_players
+        if game_state.is_player_alive(other):
+            return other
+    return player
+
+
+class Node:
+    """
+    A node of the search tree, reached by `player` making the move it is keyed
+    by in its parent's children. `turn` is who decides at the node, and in
+    which phase.
+    """
+
+    __slots__ = ("player", "turn", "children", "visits", "reward", "available")
+
+    def __init__(self, player: Optional[Player], turn: Optional[Turn] = None):
+        self.player = player
+        self.turn = turn
+        self.children: Dict[MoveKey, "Node"] = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.available = 0
+
+    def descend(self, key: MoveKey) -> Optional["Node"]:
+        """
+        The child for a move the bot saw, passing through a skipped aim.
+        """
+        child = self.children.get(key)
+        if child is None and NO_MOVE in self.children:
+            child = self.children[NO_MOVE].children.get(key)
+        return child
+
+
+def random_move(
+    moves: List[Optional[BaseOperator]], player: Player, rng: random.Random
+) -> Optional[BaseOperator]:
+    """
+    Picks a kind of move uniformly, then one of its moves, like the RandomBot.
+    """
+    by_type = defaultdict(list)
+    for move in moves:
+        if getattr(move, "target", None) != player:
+            by_type[type(move)].append(move)
+    if not by_type:
+        return moves[-1]
+    return rng.choice(rng.choice(list(by_type.values())))
+
+
+class Simulation:
+    """
+    One sampled world being played out from the root.
+    """
+
+    def __init__(
+        self,
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+        turn: Turn,
+        to_move: Player,
+    ):
+        self.game_state = game_state
+        self.deck_state = deck_state
+        self.player, self.phase = turn
+        # who acts once the pre-round is over
+        self.to_move = to_move
+        self.players = list(game_state.state)
+
+    def legal(self) -> List[Optional[BaseOperator]]:
+        moves: List[Optional[BaseOperator]] = list(
+            legal_moves(self.game_state, self.deck_state, self.player, self.phase)
+        )
+        if self.phase != TurnPhase.ACTION:
+            moves.append(None)
+        return moves
+
+    def play(self, move: Optional[BaseOperator]):
+        if move is not None:
+            self.game_state, self.deck_state = move.play(self.game_state, self.deck_state)
+
+        if self.phase == TurnPhase.PRE_ROUND:
+            self.player, self.phase = self.to_move, TurnPhase.ACTION
+        elif self.phase == TurnPhase.ACTION:
+            self.phase = TurnPhase.AIM
+        else:
+            self.player = next_alive(self.game_state, self.player)
+            self.phase = TurnPhase.ACTION
+
+    def skip_forced(self) -> Optional[List[Optional[BaseOperator]]]:
+        """
+        Plays on through phases with no choice, returning the moves of the next
+        real decision, or None if the game is over.
+        """
+        while find_win_condition(self.game_state, self.players) is None:
+            moves = self.legal()
+            if len(moves) > 1:
+                return moves
+            self.play(moves[0])
+        return None
+
+    def rewards(self) -> Dict[Player, float]:
+        win_condition = find_win_condition(self.game_state, self.players)
+        if win_condition is None:
+            return {player: 0.5 for player in self.players}
+        winners = set(find_winners(self.game_state, self.players, win_condition))
+        return {player: float(player in winners) for player in self.players}
+
+
+def search(
+    root: Node,
+    game_state: TableTopGameState,
+    deck_state: DeckState,
+    knowledge: Knowledge,
+    to_move: Player,
+    simulations: Optional[int],
+    time_budget: Optional[float],
+    seed: int,
+    exploration: float = 0.7,
+    max_depth: int = 60,
+) -> Node:
+    """
+    Runs simulations from the root until either budget is spent, and returns the
+    root. A module-level function so that root-parallel searches can run in
+    worker processes.
+    """
+    turn = root.turn
+    if turn is None:
+        raise ValueError("the root must be made with the turn at it")
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    rng = random.Random(seed)
+    worlds_rng = np.random.default_rng(seed)
+    sampler = DeterminizationSampler(game_state, deck_state, knowledge)
+
+    done = 0
+    while simulations is None or done < simulations:
+        batch = 64 if simulations is None else min(64, simulations - done)
+        for game, deck in sampler.sample_many(batch, worlds_rng):
+            simulate(root, Simulation(game, deck, turn, to_move), rng, exploration, max_depth)
+        done += batch
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+    return root
+
+
+def simulate(
+    root: Node,
+    simulation: Simulation,
+    rng: random.Random,
+    exploration: float,
+    max_depth: int,
+):
+    # the nodes below the root that were visited, with who moved into each
+    path: List[Tuple[Node, Player]] = []
+    node = root
+
+    # selection and expansion
+    moves = simulation.skip_forced()
+    while moves is not None:
+        keys = [move_key(move) for move in moves]
+        untried = []
+        for key in keys:
+            child = node.children.get(key)
+            if child is None:
+                untried.append(key)
+            else:
+                child.available += 1
+
+        player = simulation.player
+        if untried:
+            key = rng.choice(untried)
+            node.children[key] = child = Node(player)
+            child.available = 1
+        else:
+            key = max(
+                keys,
+                key=lambda key: ucb(node.children[key], exploration),
+            )
+            child = node.children[key]
+
+        simulation.play(moves[keys.index(key)])
+        moves = simulation.skip_forced()
+        if child.turn is None:
+            child.turn = (simulation.player, simulation.phase)
+        path.append((child, player))
+        node = child
+        if child.visits == 0:
+            break
+
+    # random play-out
+    depth = 0
+    while moves is not None and depth < max_depth:
+        simulation.play(random_move(moves, simulation.player, rng))
+        moves = simulation.skip_forced()
+        depth += 1
+
+    rewards = simulation.rewards()
+    root.visits += 1
+    for visited, mover in path:
+        visited.visits += 1
+        visited.reward += rewards[mover]
+
+
+def ucb(node: Node, exploration: float) -> float:
+    if node.visits == 0:
+        return math.inf
+    return node.reward / node.visits + exploration * math.sqrt(
+        math.log(node.available) / node.visits
+    )
+
+
+class ISMCTSBot(BaseBot):
+    """
+    Searches for each move with ISMCTS, for `simulations` simulations or
+    `time_budget` seconds, whichever runs out first.
+
+    With `workers`, the search is root-parallel: each worker process grows its
+    own tree with its share of the simulations, and the move visited most across
+    all of them is played. The trees are kept between moves, and follow the
+    moves the bot is notified of, so that the search carries on from what it
+    already explored.
+    """
+
+    receives_events = True
+
+    def __init__(
+        self,
+        player: Player,
+        simulations: Optional[int] = 1000,
+        time_budget: Optional[float] = None,
+        workers: int = 0,
+        exploration: float = 0.7,
+        max_depth: int = 60,
+        rng: Optional[random.Random] = None,
+    ):
+        if simulations is None and time_budget is None:
+            raise ValueError("give a simulation or a time budget")
+        self.player = player
+        self.simulations = simulations
+        self.time_budget = time_budget
+        self.workers = workers
+        self.exploration = exploration
+        self.max_depth = max_depth
+        self.rng = rng if rng is not None else random.Random()
+
+        self.knowledge = Knowledge(player)
+        self.trees: List[Node] = []
+        self.last_actor: Optional[Player] = None
+        self.executor: Optional[Executor] = None
+
+    def on_public_notification(self, notification: Notification):
+        self.knowledge.on_public_notification(notification)
+
+        action = as_dict(notification)["action"]
+        if action in ACTIONS:
+            self.last_actor = as_dict(notification)["actor"]
+
+        key = notification_key(notification)
+        if key is None:
+            self.trees = []
+            return
+        self.trees = [
+            child for child in (tree.descend(key) for tree in self.trees) if child
+        ]
+
+    def on_private_notification(self, notification: Notification):
+        self.knowledge.on_private_notification(notification)
+
+    def view(
+        self, game_state: TableTopGameState, deck_state: DeckState
+    ) -> Tuple[TableTopGameState, DeckState]:
+        """
+        The table as the bot may see it. The engine hands pre_round() and aim()
+        the whole table, so the bot only keeps its own cards and equipment from
+        it, and searches worlds sampled over the rest.
+        """
+        player_state = game_state.state[self.player]
+        for index, card_state in enumerate(player_state.integrity_cards):
+            if card_state.card != IntegrityCard.UNKNOWN:
+                self.knowledge.cards[(self.player, index)] = card_state.card
+        if player_state.equipment not in (None, EquipmentCard.UNKNOWN):
+            self.knowledge.equipment = player_state.equipment
+        return game_state.opaque_state(), deck_state.opaque_state()
+
+    def _roots(self, turn: Turn) -> List[Node]:
+        lanes = max(1, self.workers)
+        if len(self.trees) != lanes or any(tree.turn != turn for tree in self.trees):
+            return [Node(None, turn) for _ in range(lanes)]
+        return self.trees
+
+    def _search(
+        self, phase: TurnPhase, game_state: TableTopGameState, deck_state: DeckState
+    ) -> Optional[BaseOperator]:
+        moves: List[Optional[BaseOperator]] = list(
+            legal_moves(game_state, deck_state, self.player, phase)
+        )
+        if phase != TurnPhase.ACTION:
+            moves.append(None)
+        if len(moves) == 1:
+            return moves[0]
+
+        if phase == TurnPhase.ACTION:
+            to_move = self.player
+        elif self.last_actor is None:
+            to_move = 0 if game_state.is_player_alive(0) else next_alive(game_state, 0)
+        else:
+            to_move = next_alive(game_state, self.last_actor)
+
+        game_state, deck_state = self.view(game_state, deck_state)
+        roots = self._roots((self.player, phase))
+        simulations = self.simulations
+        if simulations is not None:
+            simulations = max(1, simulations // len(roots))
+        args = [
+            (
+                root,
+                game_state,
+                deck_state,
+                self.knowledge,
+                to_move,
+                simulations,
+                self.time_budget,
+                self.rng.getrandbits(64),
+                self.exploration,
+                self.max_depth,
+            )
+            for root in roots
+        ]
+
+        if self.workers:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [self.executor.submit(search, *lane) for lane in args]
+            self.trees = [future.result() for future in futures]
+        else:
+            self.trees = [search(*lane) for lane in args]
+
+        visits: Dict[MoveKey, int] = defaultdict(int)
+        for tree in self.trees:
+            for key, child in tree.children.items():
+                visits[key] += child.visits
+        legal = {move_key(move): move for move in moves}
+        return legal[max(legal, key=lambda key: visits.get(key, 0))]
+
+    def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._search(TurnPhase.PRE_ROUND, game_state, deck_state)
+
+    def action(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._search(TurnPhase.ACTION, game_state, deck_state)
+
+    def aim(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._search(TurnPhase.AIM, game_state, deck_state)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
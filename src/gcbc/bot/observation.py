@@ -0,0 +1,160 @@
+from typing import Optional
+
+import numpy as np
+
+from gcbc.bot.wire import OPERATOR_FIELDS, OPERATOR_OPCODES
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    Player,
+    PlayerHealthState,
+    TableTopGameState,
+)
+from gcbc.core.packed import CARDS_PER_PLAYER, OPCODES
+from gcbc.operators.base_operator import BaseOperator
+
+"""
+A fixed-size tensor encoding of what a player can see of the table, for neural
+bots, and a fixed move space for their policies.
+
+Seats are rotated so that the observing player is always seat 0, then the player
+to their left, and so on. Each seat is encoded as:
+
+- a one-hot of KINGPIN, AGENT, GOOD_COP, BAD_COP, UNKNOWN for each card
+- whether each card is face-up
+- a one-hot of DEAD, ALIVE, WOUNDED
+- whether the player holds a gun, and whether their gun was tasered
+- a one-hot of the seat they are aiming at, if any
+- a one-hot of the equipment they hold, if any
+
+followed by the guns and equipment cards left in the deck. Other players' face-
+down cards and equipment are always UNKNOWN; the observer's own are shown when
+the state given is not opaque.
+"""
+
+CARD_ONE_HOT = {
+    card: index
+    for index, card in enumerate(
+        (
+            IntegrityCard.KINGPIN,
+            IntegrityCard.AGENT,
+            IntegrityCard.GOOD_COP,
+            IntegrityCard.BAD_COP,
+            IntegrityCard.UNKNOWN,
+        )
+    )
+}
+EQUIPMENT_ONE_HOT = {
+    card: index
+    for index, card in enumerate(
+        (
+            EquipmentCard.TASER,
+            EquipmentCard.DEFIBRILLATOR,
+            EquipmentCard.BLACKMAIL,
+            EquipmentCard.POLYGRAPH,
+            EquipmentCard.SWAP,
+            EquipmentCard.UNKNOWN,
+        )
+    )
+}
+HEALTH_ONE_HOT = {
+    PlayerHealthState.DEAD: 0,
+    PlayerHealthState.ALIVE: 1,
+    PlayerHealthState.WOUNDED: 2,
+}
+
+# offsets into a seat's features
+CARD_FEATURES = 0
+FACE_UP_FEATURES = CARD_FEATURES + CARDS_PER_PLAYER * len(CARD_ONE_HOT)
+HEALTH_FEATURES = FACE_UP_FEATURES + CARDS_PER_PLAYER
+GUN_FEATURES = HEALTH_FEATURES + len(HEALTH_ONE_HOT)
+AIM_FEATURES = GUN_FEATURES + 2
+DECK_FEATURES = 2
+
+
+def seat_size(num_players: int) -> int:
+    return AIM_FEATURES + num_players + len(EQUIPMENT_ONE_HOT)
+
+
+def observation_size(num_players: int) -> int:
+    return num_players * seat_size(num_players) + DECK_FEATURES
+
+
+def encode_observation(
+    game_state: TableTopGameState,
+    deck_state: DeckState,
+    player: Player,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Encodes the table as `player` sees it into a float32 vector of
+    observation_size(num_players), writing into `out` if given.
+    """
+    num_players = len(game_state.state)
+    size = seat_size(num_players)
+    if out is None:
+        out = np.zeros(observation_size(num_players), dtype=np.float32)
+    else:
+        out[:] = 0
+
+    opaque = game_state.opaque_state()
+    for seat in range(num_players):
+        other = (player + seat) % num_players
+        # the observer knows their own hand, if the state given shows it
+        player_state = game_state.state[other] if seat == 0 else opaque.state[other]
+        offset = seat * size
+
+        for index, card_state in enumerate(player_state.integrity_cards):
+            card_offset = offset + CARD_FEATURES + index * len(CARD_ONE_HOT)
+            out[card_offset + CARD_ONE_HOT[card_state.card]] = 1
+            out[offset + FACE_UP_FEATURES + index] = card_state.face_up
+
+        out[offset + HEALTH_FEATURES + HEALTH_ONE_HOT[player_state.health]] = 1
+
+        gun = player_state.gun
+        if gun is None:
+            out[offset + GUN_FEATURES + 1] = 1
+        else:
+            out[offset + GUN_FEATURES] = gun.has_gun
+            if gun.aimed_at is not None:
+                out[offset + AIM_FEATURES + (gun.aimed_at - player) % num_players] = 1
+
+        if player_state.equipment is not None:
+            equipment_offset = offset + AIM_FEATURES + num_players
+            out[equipment_offset + EQUIPMENT_ONE_HOT[player_state.equipment]] = 1
+
+    out[num_players * size] = deck_state.guns
+    out[num_players * size + 1] = len(deck_state.equipment_cards)
+    return out
+
+
+# The policy's move space: a score for each opcode and target seat, relative to
+# the acting player, then one for making no move. Moves that only differ in their
+# other arguments (the cards they flip or swap, where a taser re-aims) share a
+# score. Moves without a target player (Equip, Pass) use seat 0, and a swap uses
+# its first player.
+
+NUM_OPCODES = len(OPCODES)
+
+MOVE_TARGETS = {
+    operator: next((name for name in names if name in ("target", "playerA")), None)
+    for operator, names in OPERATOR_FIELDS.items()
+}
+
+
+def num_moves(num_players: int) -> int:
+    return NUM_OPCODES * num_players + 1
+
+
+def no_move_index(num_players: int) -> int:
+    return num_moves(num_players) - 1
+
+
+def move_index(move: Optional[BaseOperator], player: Player, num_players: int) -> int:
+    if move is None:
+        return no_move_index(num_players)
+
+    target_field = MOVE_TARGETS[type(move)]
+    target = player if target_field is None else getattr(move, target_field)
+    return OPERATOR_OPCODES[type(move)] * num_players + (target - player) % num_players
@@ -0,0 +1,63 @@
+import random
+from collections import defaultdict
+from typing import List, Optional
+
+from gcbc.bot.base_bot import BaseBot
+from gcbc.core.core_data import DeckState, Player, TableTopGameState, TurnPhase
+from gcbc.operators.base_operator import BaseOperator
+from gcbc.operators.legal_moves import legal_moves
+
+
+class RandomBot(BaseBot):
+    """
+    A bot that plays at random among the legal moves it can see. Useful as a
+    baseline opponent and for simulations. Draws from `rng`, or the global random
+    module if none is given.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        equipment_probability: float = 0.5,
+        aim_probability: float = 0.5,
+        rng: Optional[random.Random] = None,
+    ):
+        self.player = player
+        self.rng = rng if rng is not None else random
+        self.equipment_probability = equipment_probability
+        self.aim_probability = aim_probability
+
+    def _choose(self, moves: List[BaseOperator]) -> Optional[BaseOperator]:
+        """
+        Pick a kind of operator uniformly, then one of its moves, so that moves with
+        many targets (investigating) do not crowd out the rest. Moves targeting the
+        bot itself are legal, but never useful to a random player.
+        """
+        by_type = defaultdict(list)
+        for move in moves:
+            if getattr(move, "target", None) != self.player:
+                by_type[type(move)].append(move)
+        if not by_type:
+            return None
+        return self.rng.choice(self.rng.choice(list(by_type.values())))
+
+    def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
+        if self.rng.random() >= self.equipment_probability:
+            return None
+
+        return self._choose(
+            legal_moves(game_state, deck_state, self.player, TurnPhase.PRE_ROUND)
+        )
+
+    def action(self, game_state: TableTopGameState, deck_state: DeckState):
+        moves = legal_moves(game_state, deck_state, self.player, TurnPhase.ACTION)
+        # passing is only worth it when nothing else is legal
+        return self._choose(moves[:-1]) or moves[-1]
+
+    def aim(self, game_state: TableTopGameState, deck_state: DeckState):
+        if self.rng.random() >= self.aim_probability:
+            return None
+
+        return self._choose(
+            legal_moves(game_state, deck_state, self.player, TurnPhase.AIM)
+        )
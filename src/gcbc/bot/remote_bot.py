@@ -0,0 +1,257 @@
+import multiprocessing
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Callable, List, Optional
+
+from gcbc.bot.base_bot import BaseBot
+from gcbc.bot.wire import (
+    decode_notification,
+    decode_operator,
+    decode_state,
+    encode_notification,
+    encode_operator,
+    encode_state,
+)
+from gcbc.core.core_data import DeckState, Player, TableTopGameState
+from gcbc.core.events import Notification
+from gcbc.operators.base_operator import BaseOperator
+
+"""
+Bots that run in their own worker processes, so that bot compute on one core does
+not hold up the engine or the other bots. The engine talks to them through
+RemoteBot adapters over pipes, using the encoding in gcbc.bot.wire.
+
+Bot factories are called with the seat a bot plays, and must be picklable (e.g. a
+module-level class or function) so they can be sent to the workers.
+"""
+
+BotFactory = Callable[[Player], BaseBot]
+
+# Request kinds, the first byte of every message to a worker. Move requests
+# follow it with a sequence number, and are answered with the same number and
+# an encoded operator; everything else is not answered.
+PRE_ROUND = 0
+ACTION = 1
+AIM = 2
+PUBLIC_NOTIFICATION = 3
+PRIVATE_NOTIFICATION = 4
+SEAT = 5  # builds a new bot for the seat in the next byte
+CLOSE = 6
+
+MOVES = {PRE_ROUND: "pre_round", ACTION: "action", AIM: "aim"}
+
+SEQUENCE_BYTES = 4
+
+# how long a RemoteBot waits on its pipe at a time, between checking whether a
+# later request has superseded the one it is waiting on
+POLL_INTERVAL = 0.05
+
+
+def bot_worker(conn: Connection, bot_factory: BotFactory):
+    """
+    The loop run by a worker process: answers requests from its RemoteBot until
+    it is closed or the pipe breaks. Until a bot is seated, moves are answered
+    with no move and notifications are dropped.
+    """
+    bot: Optional[BaseBot] = None
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except EOFError:
+            return
+
+        kind, payload = message[0], message[1:]
+        if kind in MOVES:
+            sequence, payload = payload[:SEQUENCE_BYTES], payload[SEQUENCE_BYTES:]
+            move = None
+            if bot is not None:
+                game_state, deck_state = decode_state(payload)
+                move = getattr(bot, MOVES[kind])(game_state, deck_state)
+            conn.send_bytes(sequence + encode_operator(move))
+        elif kind == PUBLIC_NOTIFICATION:
+            if bot is not None:
+                bot.on_public_notification(decode_notification(payload))
+        elif kind == PRIVATE_NOTIFICATION:
+            if bot is not None:
+                bot.on_private_notification(decode_notification(payload))
+        elif kind == SEAT:
+            bot = bot_factory(payload[0])
+        elif kind == CLOSE:
+            return
+
+
+class BotWorker:
+    """
+    A worker process and the engine's end of its pipe.
+    """
+
+    def __init__(self, bot_factory: BotFactory, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=bot_worker, args=(child_conn, bot_factory), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def close(self, timeout: Optional[float] = None):
+        try:
+            self.conn.send_bytes(bytes([CLOSE]))
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class RemoteBot(BaseBot):
+    """
+    Plays a seat with a bot running in a worker process. If the worker dies or
+    takes longer than the supervisor's timeout to answer, the move is skipped
+    (None) and the supervisor restarts the worker with a new bot for the seat,
+    which has missed the game so far.
+
+    Move requests are numbered, so that a reply to a request the engine has
+    given up on, e.g. after its pre-round deadline, is dropped rather than taken
+    as the answer to a later one. A thread still waiting on a superseded request
+    gives up as soon as the next request is sent.
+    """
+
+    def __init__(self, supervisor: "BotSupervisor", worker: BotWorker, player: Player):
+        self.supervisor = supervisor
+        self.worker = worker
+        self.player = player
+        self.sequence = 0
+        self.lock = threading.Lock()  # held by whoever is reading the pipe
+
+    def _send(self, kind: int, payload: bytes = b"") -> bool:
+        try:
+            self.worker.conn.send_bytes(bytes([kind]) + payload)
+            return True
+        except (BrokenPipeError, OSError):
+            self.worker = self.supervisor.restart(self.worker, self.player)
+            return False
+
+    def _sequence_bytes(self) -> bytes:
+        return self.sequence.to_bytes(SEQUENCE_BYTES, "little")
+
+    def _ask(
+        self, kind: int, game_state: TableTopGameState, deck_state: DeckState
+    ) -> Optional[BaseOperator]:
+        with self.lock:
+            self.sequence = (self.sequence + 1) % (1 << (8 * SEQUENCE_BYTES))
+            sequence = self._sequence_bytes()
+        if not self._send(kind, sequence + encode_state(game_state, deck_state)):
+            return None
+
+        timeout = self.supervisor.timeout
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            with self.lock:
+                if self._sequence_bytes() != sequence:
+                    return None  # superseded, whoever asked has moved on
+                try:
+                    if self.worker.conn.poll(POLL_INTERVAL):
+                        reply = self.worker.conn.recv_bytes()
+                        if reply[:SEQUENCE_BYTES] == sequence:
+                            return decode_operator(reply[SEQUENCE_BYTES:])
+                        continue  # the answer to a request given up on
+                except (EOFError, OSError):
+                    break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        with self.lock:
+            if self._sequence_bytes() == sequence:
+                self.worker = self.supervisor.restart(self.worker, self.player)
+        return None
+
+    def pre_round(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._ask(PRE_ROUND, game_state, deck_state)
+
+    def action(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._ask(ACTION, game_state, deck_state)
+
+    def aim(self, game_state: TableTopGameState, deck_state: DeckState):
+        return self._ask(AIM, game_state, deck_state)
+
+    def on_public_notification(self, notification: Notification):
+        self._send(PUBLIC_NOTIFICATION, encode_notification(notification))
+
+    def on_private_notification(self, notification: Notification):
+        self._send(PRIVATE_NOTIFICATION, encode_notification(notification))
+
+
+class BotSupervisor:
+    """
+    Spawns and pools the worker processes for one kind of bot. acquire() seats a
+    fresh bot on an idle worker, spawning one if none is idle, and release()
+    returns it to the pool once its game is over. Workers that die or stop
+    answering are replaced.
+
+    :param timeout: Seconds a bot has to answer before its worker is restarted.
+                    None waits forever.
+    """
+
+    def __init__(
+        self,
+        bot_factory: BotFactory,
+        workers: int = 0,
+        timeout: Optional[float] = None,
+        context=None,
+    ):
+        self.bot_factory = bot_factory
+        self.timeout = timeout
+        self.context = context or multiprocessing.get_context()
+        self.idle: List[BotWorker] = [self.spawn() for _ in range(workers)]
+        self.busy: List[BotWorker] = []
+        self.restarts = 0
+
+    def spawn(self) -> BotWorker:
+        return BotWorker(self.bot_factory, self.context)
+
+    def acquire(self, player: Player) -> RemoteBot:
+        worker = None
+        while self.idle and worker is None:
+            worker = self.idle.pop()
+            if not worker.is_alive():
+                worker.close(timeout=0)
+                worker = None
+        worker = worker or self.spawn()
+        self.busy.append(worker)
+
+        bot = RemoteBot(self, worker, player)
+        bot._send(SEAT, bytes([player]))
+        return bot
+
+    def release(self, bot: RemoteBot):
+        self.busy.remove(bot.worker)
+        self.idle.append(bot.worker)
+
+    def restart(self, worker: BotWorker, player: Player) -> BotWorker:
+        """
+        Kills the worker and spawns a new one, with a new bot for the seat.
+        """
+        worker.close(timeout=0)
+        new_worker = self.spawn()
+        self.busy[self.busy.index(worker)] = new_worker
+        new_worker.conn.send_bytes(bytes([SEAT, player]))
+        self.restarts += 1
+        return new_worker
+
+    def close(self):
+        for worker in self.idle + self.busy:
+            worker.close(timeout=1)
+        self.idle = []
+        self.busy = []
+
+    def __enter__(self) -> "BotSupervisor":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,239 @@
+import struct
+from dataclasses import fields
+from typing import Any, Optional, Tuple
+
+from gcbc.core.core_data import (
+    ActionType,
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    TableTopGameState,
+    UnknownEquipmentCards,
+)
+from gcbc.core.events import Notification, as_dict
+from gcbc.core.packed import (
+    DECK_EQUIPMENT,
+    EQUIPMENT_CODES,
+    FIELDS,
+    NO_OP,
+    OP_AIM,
+    OP_ARM_AND_AIM,
+    OP_BLACKMAIL,
+    OP_DEFIBRILLATOR,
+    OP_EQUIP,
+    OP_INVESTIGATE,
+    OP_PASS,
+    OP_POLYGRAPH,
+    OP_SHOOT,
+    OP_SWAP,
+    OP_TASER,
+    PackedTableTopState,
+)
+from gcbc.operators.action.aim import Aim
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.equip import Equip
+from gcbc.operators.action.investigate import Investigate
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.base_operator import BaseOperator
+from gcbc.operators.equipment.blackmail import Blackmail
+from gcbc.operators.equipment.defibrillator import Defibrillator
+from gcbc.operators.equipment.polygraph import Polygraph
+from gcbc.operators.equipment.swap import Swap
+from gcbc.operators.equipment.taser import Taser
+
+"""
+The binary encoding used to talk to bots in other processes. Tables are sent as
+their PackedTableTopState bytes, operators as an opcode and their arguments, and
+notifications with a small tagged encoding of the dicts the operators emit.
+"""
+
+# the operator class for each opcode; arguments are its init fields in order
+OPERATORS = {
+    OP_INVESTIGATE: Investigate,
+    OP_EQUIP: Equip,
+    OP_ARM_AND_AIM: ArmAndAim,
+    OP_AIM: Aim,
+    OP_SHOOT: Shoot,
+    OP_PASS: Pass,
+    OP_TASER: Taser,
+    OP_DEFIBRILLATOR: Defibrillator,
+    OP_BLACKMAIL: Blackmail,
+    OP_POLYGRAPH: Polygraph,
+    OP_SWAP: Swap,
+}
+OPERATOR_OPCODES = {operator: opcode for opcode, operator in OPERATORS.items()}
+OPERATOR_FIELDS = {
+    operator: tuple(f.name for f in fields(operator) if f.init)
+    for operator in OPERATORS.values()
+}
+
+# num_players, opaque table, opaque deck, guns, equipment cards in the deck
+STATE_HEADER = struct.Struct("<B??BB")
+
+
+def encode_state(game: TableTopGameState, deck: DeckState) -> bytes:
+    """
+    Encodes a table and deck whose players are numbered 0..n-1. An opaque deck
+    only sends its size.
+    """
+    packed = PackedTableTopState.from_state(game)
+    cards = deck.equipment_cards
+    opaque_deck = isinstance(cards, UnknownEquipmentCards) or any(
+        card == EquipmentCard.UNKNOWN for card in cards
+    )
+    header = STATE_HEADER.pack(
+        packed.num_players, packed.opaque, opaque_deck, deck.guns, len(cards)
+    )
+    if opaque_deck:
+        return header + packed.tobytes()
+    return header + packed.tobytes() + bytes(EQUIPMENT_CODES[card] for card in cards)
+
+
+def decode_state(data: bytes) -> Tuple[TableTopGameState, DeckState]:
+    num_players, opaque, opaque_deck, guns, num_cards = STATE_HEADER.unpack_from(data)
+    start = STATE_HEADER.size
+    end = start + num_players * FIELDS
+    game = PackedTableTopState.frombytes(num_players, data[start:end], opaque).to_state()
+    if opaque_deck:
+        return game, DeckState(UnknownEquipmentCards(num_cards), guns)
+    return game, DeckState([DECK_EQUIPMENT[code] for code in data[end:]], guns)
+
+
+def encode_operator(operator: Optional[BaseOperator]) -> bytes:
+    """
+    The opcode followed by the operator's fields, one signed byte each. No move
+    is encoded as NO_OP.
+    """
+    if operator is None:
+        return struct.pack("<b", NO_OP)
+    cls = type(operator)
+    return struct.pack(
+        f"<b{len(OPERATOR_FIELDS[cls])}b",
+        OPERATOR_OPCODES[cls],
+        *(getattr(operator, name) for name in OPERATOR_FIELDS[cls]),
+    )
+
+
+def decode_operator(data: bytes) -> Optional[BaseOperator]:
+    opcode, *args = struct.unpack(f"<{len(data)}b", data)
+    if opcode == NO_OP:
+        return None
+    return OPERATORS[opcode](*args)
+
+
+# Notification values. Each value is a tag byte followed by its payload; enums
+# are sent as the index of the member in their class.
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3  # 8 bytes
+TAG_SMALL_INT = 4  # 1 byte
+TAG_STR = 5  # length as 2 bytes, then utf-8
+TAG_LIST = 6  # length as 2 bytes, then the values
+TAG_DICT = 7  # length as 2 bytes, then a string key and a value for each item
+TAG_ACTION_TYPE = 8
+TAG_EQUIPMENT_CARD = 9
+TAG_INTEGRITY_CARD = 10
+
+ENUM_TAGS = {
+    ActionType: TAG_ACTION_TYPE,
+    EquipmentCard: TAG_EQUIPMENT_CARD,
+    IntegrityCard: TAG_INTEGRITY_CARD,
+}
+ENUM_MEMBERS = {tag: tuple(enum) for enum, tag in ENUM_TAGS.items()}
+ENUM_INDEX = {
+    member: index for members in ENUM_MEMBERS.values() for index, member in enumerate(members)
+}
+
+U16 = struct.Struct("<H")
+I64 = struct.Struct("<q")
+
+
+def _encode_str(value: str, out: bytearray):
+    data = value.encode()
+    out += U16.pack(len(data))
+    out += data
+
+
+def _encode_value(value: Any, out: bytearray):
+    if value is None:
+        out.append(TAG_NONE)
+    elif value is True or value is False:
+        out.append(TAG_TRUE if value else TAG_FALSE)
+    elif isinstance(value, int):
+        if -128 <= value < 128:
+            out.append(TAG_SMALL_INT)
+            out += struct.pack("<b", value)
+        else:
+            out.append(TAG_INT)
+            out += I64.pack(value)
+    elif isinstance(value, str):
+        out.append(TAG_STR)
+        _encode_str(value, out)
+    elif type(value) in ENUM_TAGS:
+        out.append(ENUM_TAGS[type(value)])
+        out.append(ENUM_INDEX[value])
+    elif isinstance(value, (list, tuple)):
+        out.append(TAG_LIST)
+        out += U16.pack(len(value))
+        for item in value:
+            _encode_value(item, out)
+    elif isinstance(value, dict):
+        out.append(TAG_DICT)
+        out += U16.pack(len(value))
+        for key, item in value.items():
+            _encode_str(key, out)
+            _encode_value(item, out)
+    else:
+        raise TypeError(f"cannot encode {type(value).__name__} in a notification")
+
+
+def _decode_str(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = U16.unpack_from(data, offset)
+    offset += U16.size
+    return data[offset : offset + length].decode(), offset + length
+
+
+def _decode_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_FALSE or tag == TAG_TRUE:
+        return tag == TAG_TRUE, offset
+    if tag == TAG_SMALL_INT:
+        return struct.unpack_from("<b", data, offset)[0], offset + 1
+    if tag == TAG_INT:
+        return I64.unpack_from(data, offset)[0], offset + I64.size
+    if tag == TAG_STR:
+        return _decode_str(data, offset)
+    if tag in ENUM_MEMBERS:
+        return ENUM_MEMBERS[tag][data[offset]], offset + 1
+    if tag == TAG_LIST or tag == TAG_DICT:
+        (length,) = U16.unpack_from(data, offset)
+        offset += U16.size
+        if tag == TAG_LIST:
+            items = []
+            for _ in range(length):
+                item, offset = _decode_value(data, offset)
+                items.append(item)
+            return items, offset
+        value = {}
+        for _ in range(length):
+            key, offset = _decode_str(data, offset)
+            value[key], offset = _decode_value(data, offset)
+        return value, offset
+    raise ValueError(f"unknown notification tag {tag}")
+
+
+def encode_notification(notification: Notification) -> bytes:
+    out = bytearray()
+    _encode_value(as_dict(notification), out)
+    return bytes(out)
+
+
+def decode_notification(data: bytes) -> dict:
+    notification, _ = _decode_value(data, 0)
+    return notification
@@ -1,6 +1,26 @@
 import enum
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import random
+from collections import deque
+from copy import deepcopy
+from types import MappingProxyType
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from gcbc.core.zobrist import card_key, equipment_key, gun_key, health_key
+
+if TYPE_CHECKING:
+    from gcbc.core.journal import ChangeJournal
 
 """
 Rules for the game can be found at:
@@ -106,34 +126,111 @@ class TurnPhase(enum.Enum):
 
 
 class PlayerHealthState:
-    DEAD = 0
-    ALIVE = 1
-    WOUNDED = 2
+    # plain ints, typed as health states for the type checker
+    DEAD = cast("PlayerHealthState", 0)
+    ALIVE = cast("PlayerHealthState", 1)
+    WOUNDED = cast("PlayerHealthState", 2)
+
+
+# attributes linking a player's state to the table caching views of it
+OWNER_ATTRIBUTES = ("_owner", "_table", "_seat")
+
+
+class Tracked:
+    """
+    Tells the table a player belongs to when a field of the player, their gun or
+    one of their cards is assigned, so that changes made directly, rather than
+    through the mutators, still drop the table's cached views of the player.
+    Replacing an item of integrity_cards in place isn't seen.
+    """
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        owner = self.__dict__.get("_owner")
+        if owner is not None:
+            owner._touch()
+
+    def __getstate__(self):
+        # copies belong to no table until one caches a view of them
+        state = self.__dict__
+        if "_owner" in state or "_table" in state:
+            state = {
+                name: value
+                for name, value in state.items()
+                if name not in OWNER_ATTRIBUTES
+            }
+        return state
 
 
 @dataclass
-class PlayerIntegrityCardState:
+class PlayerIntegrityCardState(Tracked):
     card: IntegrityCard
     face_up: bool
 
+    def __init__(self, card: IntegrityCard, face_up: bool):
+        # a new card belongs to no table yet, so there is no one to tell
+        self.__dict__.update(card=card, face_up=face_up)
+
 
 @dataclass
-class PlayerGunState:
+class PlayerGunState(Tracked):
     has_gun: bool
     aimed_at: Optional[Player]
 
+    def __init__(self, has_gun: bool, aimed_at: Optional[Player]):
+        self.__dict__.update(has_gun=has_gun, aimed_at=aimed_at)
+
 
 @dataclass
-class PlayerGameState:
+class PlayerGameState(Tracked):
     integrity_cards: List[PlayerIntegrityCardState]
     gun: PlayerGunState
     equipment: Optional[EquipmentCard]
     health: PlayerHealthState
 
+    def __init__(
+        self,
+        integrity_cards: List[PlayerIntegrityCardState],
+        gun: Optional[PlayerGunState],  # None once the gun is taken
+        equipment: Optional[EquipmentCard],
+        health: PlayerHealthState,
+    ):
+        self.__dict__.update(
+            integrity_cards=integrity_cards, gun=gun, equipment=equipment, health=health
+        )
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        self._touch()
+
+    def _touch(self):
+        table = self.__dict__.get("_table")
+        if table is not None:
+            table._changed(self._seat)
+
 
 @dataclass
 class TableTopGameState:
     state: Dict[Player, PlayerGameState]
+    journal: Optional["ChangeJournal"] = field(default=None, repr=False, compare=False)
+    # the Zobrist key of the table, kept up to date by the mutators once computed
+    zobrist: Optional[int] = field(default=None, repr=False, compare=False)
+    # frozen views of each player with the player each was made from, dropped
+    # when the player changes, and opaque views with the frozen view each was
+    # made from
+    _opaque: Dict[Player, Tuple[PlayerGameState, "FrozenPlayerGameState"]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _frozen: Dict[Player, Tuple[PlayerGameState, "FrozenPlayerGameState"]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __deepcopy__(self, memo) -> "TableTopGameState":
+        # the opaque view cache is rebuilt on demand rather than copied, and the
+        # journal belongs to whoever attached it to this state
+        copied = TableTopGameState(deepcopy(self.state, memo), zobrist=self.zobrist)
+        memo[id(self)] = copied
+        return copied
 
     def get_player_state(self, player: Player) -> PlayerGameState:
         return self.state[player]
@@ -144,51 +241,541 @@ class TableTopGameState:
     def get_player_health(self, player: Player) -> PlayerHealthState:
         return self.state[player].health
 
-    def opaque_state(self) -> "TableTopGameState":
-        return TableTopGameState(
-            {
-                player: PlayerGameState(
-                    [
-                        PlayerIntegrityCardState(
-                            state.card if state.face_up else IntegrityCard.UNKNOWN,
-                            state.face_up,
-                        )
-                        for state in player_state.integrity_cards
-                    ],
-                    PlayerGunState(player_state.gun.has_gun, player_state.gun.aimed_at),
-                    EquipmentCard.UNKNOWN if player_state.equipment else None,
-                    player_state.health,
-                )
-                for player, player_state in self.state.items()
-            }
+    def get_player_team(self, player: Player) -> RoleType:
+        """
+        The Kingpin and the Agent decide the team of whoever holds them, otherwise
+        the majority of the player's integrity cards does.
+        """
+        cards = [card_state.card for card_state in self.state[player].integrity_cards]
+        if IntegrityCard.KINGPIN in cards:
+            return RoleType.BAD
+        if IntegrityCard.AGENT in cards:
+            return RoleType.GOOD
+
+        good = sum(1 for card in cards if card.value.type == RoleType.GOOD)
+        bad = sum(1 for card in cards if card.value.type == RoleType.BAD)
+        if good == bad:
+            return RoleType.UNKNOWN
+        return RoleType.GOOD if good > bad else RoleType.BAD
+
+    def compute_zobrist(self) -> int:
+        """
+        Computes the Zobrist key of the table from scratch. From then on the
+        mutators update it incrementally, so the state must only be changed through
+        them for the key to stay correct.
+        """
+        key = 0
+        for player, player_state in self.state.items():
+            for index, card_state in enumerate(player_state.integrity_cards):
+                key ^= card_key(player, index, card_state)
+            key ^= health_key(player, player_state.health)
+            key ^= gun_key(player, player_state.gun)
+            key ^= equipment_key(player, player_state.equipment)
+
+        self.zobrist = key
+        return key
+
+    def _changed(self, player: Player):
+        self._opaque.pop(player, None)
+        self._frozen.pop(player, None)
+
+    def _watch(self, player: Player, player_state: PlayerGameState):
+        """
+        Links the player, their gun and their cards to the table, so that direct
+        changes to them drop its cached views of the player.
+        """
+        object.__setattr__(player_state, "_table", self)
+        object.__setattr__(player_state, "_seat", player)
+        for card_state in player_state.integrity_cards:
+            object.__setattr__(card_state, "_owner", player_state)
+        if player_state.gun is not None:
+            object.__setattr__(player_state.gun, "_owner", player_state)
+
+    # Mutators. Operators change the table through these so that an attached
+    # ChangeJournal can record the inverse of each change, and a tracked zobrist
+    # key can be updated for just the fields that changed. Assigning a field drops
+    # the cached views of the player by itself (see Tracked).
+
+    def set_health(self, player: Player, health: PlayerHealthState):
+        player_state = self.state[player]
+        if self.journal is not None:
+            self.journal.record(self.set_health, player, player_state.health)
+        if self.zobrist is not None:
+            self.zobrist ^= health_key(player, player_state.health)
+            self.zobrist ^= health_key(player, health)
+        player_state.health = health
+
+    def set_equipment(self, player: Player, equipment: Optional[EquipmentCard]):
+        player_state = self.state[player]
+        if self.journal is not None:
+            self.journal.record(self.set_equipment, player, player_state.equipment)
+        if self.zobrist is not None:
+            self.zobrist ^= equipment_key(player, player_state.equipment)
+            self.zobrist ^= equipment_key(player, equipment)
+        player_state.equipment = equipment
+
+    def set_gun(self, player: Player, gun: Optional[PlayerGunState]):
+        player_state = self.state[player]
+        if self.journal is not None:
+            self.journal.record(self.set_gun, player, player_state.gun)
+        if self.zobrist is not None:
+            self.zobrist ^= gun_key(player, player_state.gun) ^ gun_key(player, gun)
+        player_state.gun = gun
+
+    def set_has_gun(self, player: Player, has_gun: bool):
+        gun = self.state[player].gun
+        if self.journal is not None:
+            self.journal.record(self.set_has_gun, player, gun.has_gun)
+        if self.zobrist is not None:
+            self.zobrist ^= gun_key(player, gun)
+        gun.has_gun = has_gun
+        if self.zobrist is not None:
+            self.zobrist ^= gun_key(player, gun)
+
+    def set_aimed_at(self, player: Player, aimed_at: Optional[Player]):
+        gun = self.state[player].gun
+        if self.journal is not None:
+            self.journal.record(self.set_aimed_at, player, gun.aimed_at)
+        if self.zobrist is not None:
+            self.zobrist ^= gun_key(player, gun)
+        gun.aimed_at = aimed_at
+        if self.zobrist is not None:
+            self.zobrist ^= gun_key(player, gun)
+
+    def set_card(self, player: Player, index: Card, card: IntegrityCard):
+        card_state = self.state[player].integrity_cards[index]
+        if self.journal is not None:
+            self.journal.record(self.set_card, player, index, card_state.card)
+        if self.zobrist is not None:
+            self.zobrist ^= card_key(player, index, card_state)
+        card_state.card = card
+        if self.zobrist is not None:
+            self.zobrist ^= card_key(player, index, card_state)
+
+    def set_face_up(self, player: Player, index: Card, face_up: bool):
+        card_state = self.state[player].integrity_cards[index]
+        if self.journal is not None:
+            self.journal.record(self.set_face_up, player, index, card_state.face_up)
+        if self.zobrist is not None:
+            self.zobrist ^= card_key(player, index, card_state)
+        card_state.face_up = face_up
+        if self.zobrist is not None:
+            self.zobrist ^= card_key(player, index, card_state)
+
+    def swap_cards(
+        self, player_a: Player, card_a: Card, player_b: Player, card_b: Card
+    ):
+        cards_a = self.state[player_a].integrity_cards
+        cards_b = self.state[player_b].integrity_cards
+        if self.journal is not None:
+            self.journal.record(self.swap_cards, player_a, card_a, player_b, card_b)
+        self._changed(player_a)
+        self._changed(player_b)
+        if self.zobrist is not None:
+            self.zobrist ^= card_key(player_a, card_a, cards_a[card_a])
+            self.zobrist ^= card_key(player_b, card_b, cards_b[card_b])
+        cards_a[card_a], cards_b[card_b] = cards_b[card_b], cards_a[card_a]
+        if self.zobrist is not None:
+            self.zobrist ^= card_key(player_a, card_a, cards_a[card_a])
+            self.zobrist ^= card_key(player_b, card_b, cards_b[card_b])
+
+    def opaque_player_state(self, player: Player) -> "FrozenPlayerGameState":
+        """
+        What everyone at the table can see of the player: face-down cards and any
+        equipment are unknown. The view is read-only, and cached until the player
+        changes.
+        """
+        frozen = self.frozen_player_state(player)
+        cached = self._opaque.get(player)
+        if cached is not None and cached[0] is frozen:
+            return cached[1]
+        view = frozen.opaque()
+        self._opaque[player] = (frozen, view)
+        return view
+
+    def opaque_state(self) -> "FrozenTableTopGameState":
+        """
+        The table as everyone can see it, read-only since player views are shared
+        with later calls; thaw() it for a copy to change, e.g. to simulate moves.
+        """
+        return FrozenTableTopGameState.of(
+            {player: self.opaque_player_state(player) for player in self.state}
         )
 
+    def frozen_player_state(self, player: Player) -> "FrozenPlayerGameState":
+        """
+        A read-only copy of the player, cached until the player changes, whether
+        through the mutators or by assigning their fields directly.
+        """
+        player_state = self.state[player]
+        cached = self._frozen.get(player)
+        if cached is not None and cached[0] is player_state:
+            return cached[1]
+        view = FrozenPlayerGameState.of(player_state)
+        self._watch(player, player_state)
+        self._frozen[player] = (player_state, view)
+        return view
+
+    def snapshot(self) -> "FrozenTableTopGameState":
+        """
+        A read-only copy of the table, which can be handed to any number of bots
+        at once. Frozen player views are cached until the player changes, so
+        consecutive snapshots share the players that did not change.
+        """
+        return FrozenTableTopGameState.of(
+            {player: self.frozen_player_state(player) for player in self.state},
+            self.zobrist,
+        )
+
+
+class UnknownEquipmentCards(Sequence[EquipmentCard]):
+    """
+    A stand-in for the equipment cards of an opaque deck, which are all unknown.
+    Only the number of cards is stored. It has the deque operations DeckState
+    uses, so that bots can play operators on an opaque deck: cards drawn from it
+    are UNKNOWN, and cards put back are only counted.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def pop(self) -> EquipmentCard:
+        if self.size == 0:
+            raise IndexError("pop from an empty deck")
+        self.size -= 1
+        return EquipmentCard.UNKNOWN
+
+    popleft = pop
+
+    def append(self, card: EquipmentCard):
+        self.size += 1
+
+    appendleft = append
+
+    def extend(self, cards: Iterable[EquipmentCard]):
+        self.size += sum(1 for _ in cards)
+
+    def clear(self):
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EquipmentCard.UNKNOWN] * len(range(self.size)[index])
+        range(self.size)[index]  # raises IndexError when out of range
+        return EquipmentCard.UNKNOWN
+
+    def __iter__(self) -> Iterator[EquipmentCard]:
+        return iter([EquipmentCard.UNKNOWN] * self.size)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UnknownEquipmentCards):
+            return self.size == other.size
+        if isinstance(other, (list, deque)):
+            return len(other) == self.size and all(
+                card == EquipmentCard.UNKNOWN for card in other
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"UnknownEquipmentCards({self.size})"
+
+
+class EquipmentCardDeque(Protocol):
+    """
+    The deque operations DeckState uses on its cards, which a deque and an
+    UnknownEquipmentCards both have.
+    """
+
+    def __len__(self) -> int: ...
+    def pop(self) -> EquipmentCard: ...
+    def popleft(self) -> EquipmentCard: ...
+    def append(self, card: EquipmentCard): ...
+    def appendleft(self, card: EquipmentCard): ...
+    def extend(self, cards: Iterable[EquipmentCard]): ...
+    def clear(self): ...
+
 
 @dataclass
 class DeckState:
-    equipment_cards: List[EquipmentCard]
+    # the top of the deck is the right end; other sequences are converted to a
+    # deque so that drawing from the top and returning to the bottom are both O(1)
+    equipment_cards: Sequence[EquipmentCard]
     guns: int
+    journal: Optional["ChangeJournal"] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.equipment_cards, (deque, UnknownEquipmentCards)):
+            self.equipment_cards = deque(self.equipment_cards)
+
+    @property
+    def _cards(self) -> EquipmentCardDeque:
+        return cast(EquipmentCardDeque, self.equipment_cards)
+
+    def reset(
+        self,
+        equipment_cards: Iterable[EquipmentCard],
+        guns: int,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Refills the deck in place, shuffling the cards if an rng is given, so that
+        a deck can be reused across games. The reset is not journaled.
+        """
+        cards = list(equipment_cards)
+        if rng is not None:
+            rng.shuffle(cards)
+        self._cards.clear()
+        self._cards.extend(cards)
+        self.guns = guns
 
     def get_gun(self) -> bool:
         if self.guns > 0:
             self.guns -= 1
+            if self.journal is not None:
+                self.journal.record(self.return_gun)
             return True
         else:
             return False
 
     def return_gun(self):
         self.guns += 1
+        if self.journal is not None:
+            self.journal.record(self.get_gun)
 
     def draw_equipment_card(self) -> Optional[EquipmentCard]:
         if len(self.equipment_cards) > 0:
-            return self.equipment_cards.pop()
+            card = self._cards.pop()
+            if self.journal is not None:
+                self.journal.record(self.undraw_equipment_card, card)
+            return card
         else:
             return None
 
     def return_equipment_card(self, card: EquipmentCard):
-        self.equipment_cards.insert(0, card)
+        self._cards.appendleft(card)
+        if self.journal is not None:
+            self.journal.record(self.unreturn_equipment_card)
+
+    def undraw_equipment_card(self, card: EquipmentCard):
+        """
+        Puts a drawn card back on top of the deck, reverting draw_equipment_card.
+        """
+        self._cards.append(card)
+        if self.journal is not None:
+            self.journal.record(self.draw_equipment_card)
+
+    def unreturn_equipment_card(self) -> EquipmentCard:
+        """
+        Takes the last returned card back off the bottom of the deck, reverting
+        return_equipment_card.
+        """
+        card = self._cards.popleft()
+        if self.journal is not None:
+            self.journal.record(self.return_equipment_card, card)
+        return card
+
+    def opaque_state(self) -> "DeckState":
+        return DeckState(UnknownEquipmentCards(len(self.equipment_cards)), self.guns)
+
+    def snapshot(self) -> "FrozenDeckState":
+        """
+        A read-only copy of the deck.
+        """
+        return FrozenDeckState.of(self)
+
+
+# Read-only snapshots of the state. They are instances of the classes they
+# freeze, so everything that reads the state accepts them, but assigning to any
+# field or calling a mutator raises FrozenInstanceError.
+
+
+def _read_only(self, *args, **kwargs):
+    raise FrozenInstanceError(f"{type(self).__name__} is a read-only snapshot")
+
+
+class Frozen:
+    base: type  # the dataclass being frozen
+
+    @classmethod
+    def _build(cls, **values):
+        instance = object.__new__(cls)
+        for name, value in values.items():
+            object.__setattr__(instance, name, value)
+        return instance
+
+    def __setattr__(self, name, value):
+        _read_only(self)
+
+    def __delattr__(self, name):
+        _read_only(self)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, self.base):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(self.base)
+            if f.compare
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __deepcopy__(self, memo):
+        # nothing can change a snapshot, so copies can share it
+        return self
+
+
+class FrozenPlayerIntegrityCardState(Frozen, PlayerIntegrityCardState):
+    base = PlayerIntegrityCardState
+
+    @staticmethod
+    def of(card_state: PlayerIntegrityCardState) -> "FrozenPlayerIntegrityCardState":
+        return FrozenPlayerIntegrityCardState._build(
+            card=card_state.card, face_up=card_state.face_up
+        )
+
+    def thaw(self) -> PlayerIntegrityCardState:
+        return PlayerIntegrityCardState(self.card, self.face_up)
+
+
+HIDDEN_CARD = FrozenPlayerIntegrityCardState._build(
+    card=IntegrityCard.UNKNOWN, face_up=False
+)
+
+
+class FrozenPlayerGunState(Frozen, PlayerGunState):
+    base = PlayerGunState
+
+    @staticmethod
+    def of(gun: PlayerGunState) -> "FrozenPlayerGunState":
+        return FrozenPlayerGunState._build(has_gun=gun.has_gun, aimed_at=gun.aimed_at)
+
+    def thaw(self) -> PlayerGunState:
+        return PlayerGunState(self.has_gun, self.aimed_at)
+
+
+class FrozenPlayerGameState(Frozen, PlayerGameState):
+    base = PlayerGameState
+
+    @staticmethod
+    def of(player_state: PlayerGameState) -> "FrozenPlayerGameState":
+        gun = player_state.gun
+        return FrozenPlayerGameState._build(
+            integrity_cards=tuple(
+                FrozenPlayerIntegrityCardState.of(card_state)
+                for card_state in player_state.integrity_cards
+            ),
+            gun=FrozenPlayerGunState.of(gun) if gun is not None else None,
+            equipment=player_state.equipment,
+            health=player_state.health,
+        )
+
+    def opaque(self) -> "FrozenPlayerGameState":
+        return FrozenPlayerGameState._build(
+            integrity_cards=tuple(
+                card_state if card_state.face_up else HIDDEN_CARD
+                for card_state in self.integrity_cards
+            ),
+            gun=self.gun,
+            equipment=EquipmentCard.UNKNOWN if self.equipment else None,
+            health=self.health,
+        )
+
+    def thaw(self) -> PlayerGameState:
+        # the cards and gun were frozen along with the player
+        cards = cast(Tuple[FrozenPlayerIntegrityCardState, ...], self.integrity_cards)
+        gun = cast(Optional[FrozenPlayerGunState], self.gun)
+        return PlayerGameState(
+            [card_state.thaw() for card_state in cards],
+            gun.thaw() if gun is not None else None,
+            self.equipment,
+            self.health,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PlayerGameState):
+            return NotImplemented
+        # the cards are a tuple here, but a list in the state being compared with
+        return (
+            list(self.integrity_cards) == list(other.integrity_cards)
+            and self.gun == other.gun
+            and self.equipment == other.equipment
+            and self.health == other.health
+        )
+
+
+class FrozenTableTopGameState(Frozen, TableTopGameState):
+    base = TableTopGameState
+
+    @staticmethod
+    def of(
+        state: Dict[Player, FrozenPlayerGameState], zobrist: Optional[int] = None
+    ) -> "FrozenTableTopGameState":
+        return FrozenTableTopGameState._build(
+            state=MappingProxyType(state),
+            journal=None,
+            zobrist=zobrist,
+            _opaque={},
+            _frozen={},
+        )
+
+    def thaw(self) -> TableTopGameState:
+        """
+        A mutable copy of the table, e.g. for a bot to simulate moves on.
+        """
+        return TableTopGameState(
+            {player: self.frozen_player_state(player).thaw() for player in self.state},
+            zobrist=self.zobrist,
+        )
+
+    def snapshot(self) -> "FrozenTableTopGameState":
+        return self
+
+    def frozen_player_state(self, player: Player) -> "FrozenPlayerGameState":
+        return cast(FrozenPlayerGameState, self.state[player])
+
+    def compute_zobrist(self) -> int:
+        key = self.thaw().compute_zobrist()
+        object.__setattr__(self, "zobrist", key)  # a cache, not part of the state
+        return key
+
+    def __reduce__(self):
+        return (TableTopGameState.snapshot, (self.thaw(),))
+
+    set_health = set_equipment = set_gun = set_has_gun = set_aimed_at = _read_only
+    set_card = set_face_up = swap_cards = _read_only
+
+
+class FrozenDeckState(Frozen, DeckState):
+    base = DeckState
+
+    @staticmethod
+    def of(deck_state: DeckState) -> "FrozenDeckState":
+        return FrozenDeckState._build(
+            equipment_cards=tuple(deck_state.equipment_cards),
+            guns=deck_state.guns,
+            journal=None,
+        )
+
+    def thaw(self) -> DeckState:
+        return DeckState(list(self.equipment_cards), self.guns)
+
+    def snapshot(self) -> "FrozenDeckState":
+        return self
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DeckState):
+            return NotImplemented
+        return (
+            list(self.equipment_cards) == list(other.equipment_cards)
+            and self.guns == other.guns
+        )
+
+    def __reduce__(self):
+        return (DeckState.snapshot, (self.thaw(),))
 
-    def opaque_state(self):
-        return DeckState(
-            [EquipmentCard.UNKNOWN for _ in range(len(self.equipment_cards))], self.guns
-        )
\ No newline at end of file
+    get_gun = return_gun = draw_equipment_card = return_equipment_card = _read_only
+    undraw_equipment_card = unreturn_equipment_card = reset = _read_only
\ No newline at end of file
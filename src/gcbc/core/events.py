@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Tuple, Union
+
+from gcbc.core.core_data import ActionType, Card, EquipmentCard, IntegrityCard, Player
+
+"""
+The notifications operators send to bots. Each operator builds one frozen event
+and shares it between every bot it is sent to.
+
+Bots that set `receives_events = True` get the events themselves. Every other bot
+gets the dict form from as_dict(), which is built once per notification, only if
+some bot needs it, and is shared in the same way, so it must not be mutated.
+"""
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Event:
+    action: ClassVar[Union[ActionType, EquipmentCard]]
+    private: ClassVar[bool] = False  # private events nest their fields in "private_data"
+
+    def as_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        names: Tuple[str, ...] = self.__slots__  # the fields, in order
+        for name in names:
+            value = getattr(self, name)
+            data[name] = list(value) if isinstance(value, tuple) else value
+        if self.private:
+            return {"action": self.action, "private_data": data}
+        return {"action": self.action, **data}
+
+    def _values(self) -> Tuple:
+        names: Tuple[str, ...] = self.__slots__
+        return tuple(getattr(self, name) for name in names)
+
+    def __eq__(self, other) -> bool:
+        # events compare equal to their dict form, so either can be expected
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+
+Notification = Union[Event, Dict[str, Any]]
+
+
+def as_dict(notification: Notification) -> Dict[str, Any]:
+    return notification.as_dict() if isinstance(notification, Event) else notification
+
+
+# Public events, sent to every bot
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class InvestigateEvent(Event):
+    action = ActionType.INVESTIGATE
+    actor: Player
+    target: Player
+    target_card: Card
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class EquipEvent(Event):
+    action = ActionType.EQUIP
+    actor: Player
+    card_to_flip: Card
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ArmAndAimEvent(Event):
+    action = ActionType.ARM_AND_AIM
+    actor: Player
+    target: Player
+    card_to_flip: Card
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class AimEvent(Event):
+    action = ActionType.AIM
+    actor: Player
+    target: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ShootEvent(Event):
+    action = ActionType.SHOOT
+    actor: Player
+    target: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PassEvent(Event):
+    action = ActionType.PASS
+    actor: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TaserEvent(Event):
+    action = EquipmentCard.TASER
+    actor: Player
+    stolen_from: Player
+    aimed_at: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DefibrillatorEvent(Event):
+    action = EquipmentCard.DEFIBRILLATOR
+    actor: Player
+    revived: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BlackmailEvent(Event):
+    action = EquipmentCard.BLACKMAIL
+    actor: Player
+    target: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PolygraphEvent(Event):
+    action = EquipmentCard.POLYGRAPH
+    actor: Player
+    target: Player
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SwapEvent(Event):
+    action = EquipmentCard.SWAP
+    actor: Player
+    playerA: Player
+    cardA: Card
+    playerB: Player
+    cardB: Card
+
+
+# Private events, sent only to the players who learn something
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PrivateInvestigateEvent(Event):
+    action = ActionType.INVESTIGATE
+    private = True
+    actor: Player
+    target: Player
+    target_card: Card
+    card_value: IntegrityCard
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PrivateEquipEvent(Event):
+    action = ActionType.EQUIP
+    private = True
+    actor: Player
+    equipped_card: EquipmentCard
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PrivatePolygraphEvent(Event):
+    action = EquipmentCard.POLYGRAPH
+    private = True
+    actor: Player
+    target: Player
+    actor_cards: Tuple[IntegrityCard, ...]
+    target_cards: Tuple[IntegrityCard, ...]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PrivateSwapEvent(Event):
+    action = EquipmentCard.SWAP
+    private = True
+    actor: Player
+    playerA: Player
+    cardA: Card
+    cardAValue: IntegrityCard
+    playerB: Player
+    cardB: Card
+    cardBValue: IntegrityCard
@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from typing import Any, Callable, List, Tuple
+
+
+class ChangeJournal:
+    """
+    Records the inverse of every mutation made through the TableTopGameState and
+    DeckState mutators while it is attached to them. Committing drops the record,
+    rolling back replays the inverses newest-first, so the cost of a transaction
+    scales with the size of the change rather than the size of the table.
+    """
+
+    def __init__(self):
+        self.entries: List[Tuple[Callable[..., Any], tuple]] = []
+        self.states: tuple = ()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, undo: Callable[..., Any], *args):
+        """
+        Remember that calling `undo(*args)` reverts the mutation just made.
+        """
+        self.entries.append((undo, args))
+
+    def attach(self, *states):
+        for state in states:
+            state.journal = self
+        self.states = states
+
+    def detach(self):
+        for state in self.states:
+            state.journal = None
+        self.states = ()
+
+    def commit(self):
+        self.entries.clear()
+
+    def rollback(self):
+        """
+        Revert every recorded mutation. The journal must be detached first so the
+        inverse mutations are not themselves recorded.
+        """
+        while self.entries:
+            undo, args = self.entries.pop()
+            undo(*args)
+
+    @contextmanager
+    def transaction(self, *states):
+        """
+        Attach the journal to the given states for the duration of the block. The
+        changes are committed if the block succeeds and rolled back if it raises.
+        """
+        self.attach(*states)
+        try:
+            yield self
+        except BaseException:
+            self.detach()
+            self.rollback()
+            raise
+        self.detach()
+        self.commit()
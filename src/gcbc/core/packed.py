@@ -0,0 +1,343 @@
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
+
+from gcbc.core.core_data import (
+    ActionType,
+    Card,
+    EquipmentCard,
+    IntegrityCard,
+    Player,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+
+if TYPE_CHECKING:
+    from gcbc.core.journal import ChangeJournal
+
+"""
+A compact encoding of the table. Every player is a row of small ints in one flat
+array, in the column order below, instead of a tree of dataclasses.
+"""
+
+CARDS_PER_PLAYER = 3
+
+# columns of a player row
+CARDS = 0  # 2 bits per integrity card, card i in bits 2i and 2i + 1
+FACE_UP = 1  # bit i is set if card i is face-up
+GUN = 2  # one of the gun codes below
+AIMED_AT = 3  # the player aimed at, or NO_TARGET
+EQUIPMENT = 4  # index into EQUIPMENT_CARDS
+HEALTH = 5  # a PlayerHealthState value
+FIELDS = 6
+
+# integrity cards in code order, a card's code is its index
+INTEGRITY_CARDS = (
+    IntegrityCard.KINGPIN,
+    IntegrityCard.AGENT,
+    IntegrityCard.GOOD_COP,
+    IntegrityCard.BAD_COP,
+)
+INTEGRITY_CARD_CODES = {card: code for code, card in enumerate(INTEGRITY_CARDS)}
+
+# equipment in code order, code 0 is no equipment
+EQUIPMENT_CARDS = (
+    None,
+    EquipmentCard.TASER,
+    EquipmentCard.DEFIBRILLATOR,
+    EquipmentCard.BLACKMAIL,
+    EquipmentCard.POLYGRAPH,
+    EquipmentCard.SWAP,
+    EquipmentCard.UNKNOWN,
+)
+EQUIPMENT_CODES = {card: code for code, card in enumerate(EQUIPMENT_CARDS)}
+NO_EQUIPMENT = EQUIPMENT_CODES[None]
+UNKNOWN_EQUIPMENT = EQUIPMENT_CODES[EquipmentCard.UNKNOWN]
+# the equipment a deck code stands for; a deck never holds code 0
+DECK_EQUIPMENT: Dict[int, EquipmentCard] = {
+    code: card for code, card in enumerate(EQUIPMENT_CARDS) if card is not None
+}
+
+# gun codes
+NO_GUN = 0
+HAS_GUN = 1
+GUN_TAKEN = 2  # the gun slot was emptied by a taser, i.e. PlayerGameState.gun is None
+
+NO_TARGET = -1
+
+ALL_FACE_UP = (1 << CARDS_PER_PLAYER) - 1
+
+# Operator opcodes. Actions use their ActionType value, equipment follows on.
+# An operator's arguments are its dataclass fields after the acting player, in
+# declaration order.
+OP_INVESTIGATE = ActionType.INVESTIGATE.value
+OP_EQUIP = ActionType.EQUIP.value
+OP_ARM_AND_AIM = ActionType.ARM_AND_AIM.value
+OP_AIM = ActionType.AIM.value
+OP_SHOOT = ActionType.SHOOT.value
+OP_PASS = ActionType.PASS.value
+OP_TASER = 6
+OP_DEFIBRILLATOR = 7
+OP_BLACKMAIL = 8
+OP_POLYGRAPH = 9
+OP_SWAP = 10
+NO_OP = -1
+
+OPCODES = {
+    ActionType.INVESTIGATE: OP_INVESTIGATE,
+    ActionType.EQUIP: OP_EQUIP,
+    ActionType.ARM_AND_AIM: OP_ARM_AND_AIM,
+    ActionType.AIM: OP_AIM,
+    ActionType.SHOOT: OP_SHOOT,
+    ActionType.PASS: OP_PASS,
+    EquipmentCard.TASER: OP_TASER,
+    EquipmentCard.DEFIBRILLATOR: OP_DEFIBRILLATOR,
+    EquipmentCard.BLACKMAIL: OP_BLACKMAIL,
+    EquipmentCard.POLYGRAPH: OP_POLYGRAPH,
+    EquipmentCard.SWAP: OP_SWAP,
+}
+EQUIPMENT_OPCODES = {
+    EQUIPMENT_CODES[card]: opcode
+    for card, opcode in OPCODES.items()
+    if isinstance(card, EquipmentCard)
+}
+
+
+def pack_cards(cards: List[IntegrityCard]) -> int:
+    packed = 0
+    for index, card in enumerate(cards):
+        packed |= INTEGRITY_CARD_CODES[card] << (2 * index)
+    return packed
+
+
+def unpack_card(packed: int, index: Card) -> IntegrityCard:
+    return INTEGRITY_CARDS[(packed >> (2 * index)) & 0b11]
+
+
+class PackedTableTopState:
+    """
+    The table-top state packed into a single `array` of signed bytes, FIELDS per
+    player. It mirrors the query and mutator methods of TableTopGameState, and
+    converts to and from it with to_state() and from_state() so operators written
+    against the dataclasses keep working.
+
+    An opaque packed state has the identities of face-down cards zeroed out and
+    held equipment set to UNKNOWN_EQUIPMENT; they decode to the UNKNOWN cards.
+    """
+
+    __slots__ = ("num_players", "data", "opaque", "journal")
+
+    def __init__(
+        self, num_players: int, data: Optional[array] = None, opaque: bool = False
+    ):
+        self.num_players = num_players
+        self.data = data if data is not None else array("b", bytes(num_players * FIELDS))
+        self.opaque = opaque
+        self.journal: Optional["ChangeJournal"] = None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PackedTableTopState):
+            return NotImplemented
+        return (
+            self.num_players == other.num_players
+            and self.opaque == other.opaque
+            and self.data == other.data
+        )
+
+    def __repr__(self) -> str:
+        return f"PackedTableTopState({self.num_players}, {self.data!r}, opaque={self.opaque})"
+
+    @staticmethod
+    def from_state(game: TableTopGameState) -> "PackedTableTopState":
+        """
+        Packs a TableTopGameState whose players are numbered 0..n-1 and each hold
+        exactly CARDS_PER_PLAYER integrity cards.
+        """
+        num_players = len(game.state)
+        packed = PackedTableTopState(num_players)
+        opaque = False
+
+        for player in range(num_players):
+            if player not in game.state:
+                raise ValueError(f"players must be numbered 0..{num_players - 1}")
+
+            player_state = game.state[player]
+            if len(player_state.integrity_cards) != CARDS_PER_PLAYER:
+                raise ValueError(
+                    f"player {player} must hold {CARDS_PER_PLAYER} integrity cards"
+                )
+
+            cards = 0
+            face_up = 0
+            for index, card_state in enumerate(player_state.integrity_cards):
+                if card_state.card == IntegrityCard.UNKNOWN:
+                    opaque = True
+                else:
+                    cards |= INTEGRITY_CARD_CODES[card_state.card] << (2 * index)
+                if card_state.face_up:
+                    face_up |= 1 << index
+
+            gun = player_state.gun
+            offset = player * FIELDS
+            packed.data[offset + CARDS] = cards
+            packed.data[offset + FACE_UP] = face_up
+            if gun is None:
+                packed.data[offset + GUN] = GUN_TAKEN
+                packed.data[offset + AIMED_AT] = NO_TARGET
+            else:
+                packed.data[offset + GUN] = HAS_GUN if gun.has_gun else NO_GUN
+                packed.data[offset + AIMED_AT] = (
+                    NO_TARGET if gun.aimed_at is None else gun.aimed_at
+                )
+            packed.data[offset + EQUIPMENT] = EQUIPMENT_CODES[player_state.equipment]
+            packed.data[offset + HEALTH] = cast(int, player_state.health)
+            opaque = opaque or player_state.equipment == EquipmentCard.UNKNOWN
+
+        packed.opaque = opaque
+        return packed
+
+    def to_state(self) -> TableTopGameState:
+        return TableTopGameState(
+            {player: self.get_player_state(player) for player in range(self.num_players)}
+        )
+
+    def get_player_state(self, player: Player) -> PlayerGameState:
+        """
+        Decodes one player into a fresh PlayerGameState.
+        """
+        offset = player * FIELDS
+        cards = self.data[offset + CARDS]
+        face_up = self.data[offset + FACE_UP]
+
+        integrity_cards = []
+        for index in range(CARDS_PER_PLAYER):
+            is_face_up = bool(face_up & (1 << index))
+            if self.opaque and not is_face_up:
+                card = IntegrityCard.UNKNOWN
+            else:
+                card = unpack_card(cards, index)
+            integrity_cards.append(PlayerIntegrityCardState(card, is_face_up))
+
+        gun_code = self.data[offset + GUN]
+        aimed_at = self.data[offset + AIMED_AT]
+        if gun_code == GUN_TAKEN:
+            gun = None
+        else:
+            gun = PlayerGunState(
+                gun_code == HAS_GUN, None if aimed_at == NO_TARGET else aimed_at
+            )
+
+        return PlayerGameState(
+            integrity_cards,
+            gun,
+            EQUIPMENT_CARDS[self.data[offset + EQUIPMENT]],
+            cast(PlayerHealthState, self.data[offset + HEALTH]),
+        )
+
+    def copy(self) -> "PackedTableTopState":
+        return PackedTableTopState(self.num_players, array("b", self.data), self.opaque)
+
+    def tobytes(self) -> bytes:
+        return self.data.tobytes()
+
+    @staticmethod
+    def frombytes(
+        num_players: int, data: bytes, opaque: bool = False
+    ) -> "PackedTableTopState":
+        return PackedTableTopState(num_players, array("b", data), opaque)
+
+    def opaque_state(self) -> "PackedTableTopState":
+        opaque = self.copy()
+        opaque.opaque = True
+        for offset in range(0, len(opaque.data), FIELDS):
+            face_up = opaque.data[offset + FACE_UP]
+            mask = 0
+            for index in range(CARDS_PER_PLAYER):
+                if face_up & (1 << index):
+                    mask |= 0b11 << (2 * index)
+            opaque.data[offset + CARDS] &= mask
+            if opaque.data[offset + EQUIPMENT] != NO_EQUIPMENT:
+                opaque.data[offset + EQUIPMENT] = UNKNOWN_EQUIPMENT
+        return opaque
+
+    # Queries, mirroring TableTopGameState
+
+    def is_player_alive(self, player: Player) -> bool:
+        return self.data[player * FIELDS + HEALTH] != PlayerHealthState.DEAD
+
+    def get_player_health(self, player: Player) -> PlayerHealthState:
+        return cast(PlayerHealthState, self.data[player * FIELDS + HEALTH])
+
+    def get_card(self, player: Player, index: Card) -> IntegrityCard:
+        if self.opaque and not self.is_face_up(player, index):
+            return IntegrityCard.UNKNOWN
+        return unpack_card(self.data[player * FIELDS + CARDS], index)
+
+    def get_cards(self, player: Player) -> List[IntegrityCard]:
+        return [self.get_card(player, index) for index in range(CARDS_PER_PLAYER)]
+
+    def is_face_up(self, player: Player, index: Card) -> bool:
+        return bool(self.data[player * FIELDS + FACE_UP] & (1 << index))
+
+    def has_gun(self, player: Player) -> bool:
+        return self.data[player * FIELDS + GUN] == HAS_GUN
+
+    def get_aimed_at(self, player: Player) -> Optional[Player]:
+        aimed_at = self.data[player * FIELDS + AIMED_AT]
+        return None if aimed_at == NO_TARGET else aimed_at
+
+    def get_equipment(self, player: Player) -> Optional[EquipmentCard]:
+        return EQUIPMENT_CARDS[self.data[player * FIELDS + EQUIPMENT]]
+
+    # Mutators, mirroring TableTopGameState. Each writes one column, and records
+    # the previous value with the journal if one is attached.
+
+    def _set(self, player: Player, column: int, value: int):
+        offset = player * FIELDS + column
+        if self.journal is not None:
+            self.journal.record(self._set, player, column, self.data[offset])
+        self.data[offset] = value
+
+    def set_health(self, player: Player, health: PlayerHealthState):
+        self._set(player, HEALTH, cast(int, health))
+
+    def set_equipment(self, player: Player, equipment: Optional[EquipmentCard]):
+        self._set(player, EQUIPMENT, EQUIPMENT_CODES[equipment])
+
+    def set_gun(self, player: Player, gun: Optional[PlayerGunState]):
+        if gun is None:
+            self._set(player, GUN, GUN_TAKEN)
+            self._set(player, AIMED_AT, NO_TARGET)
+        else:
+            self.set_has_gun(player, gun.has_gun)
+            self.set_aimed_at(player, gun.aimed_at)
+
+    def set_has_gun(self, player: Player, has_gun: bool):
+        self._set(player, GUN, HAS_GUN if has_gun else NO_GUN)
+
+    def set_aimed_at(self, player: Player, aimed_at: Optional[Player]):
+        self._set(player, AIMED_AT, NO_TARGET if aimed_at is None else aimed_at)
+
+    def set_card(self, player: Player, index: Card, card: IntegrityCard):
+        cards = self.data[player * FIELDS + CARDS] & ~(0b11 << (2 * index))
+        self._set(player, CARDS, cards | INTEGRITY_CARD_CODES[card] << (2 * index))
+
+    def set_face_up(self, player: Player, index: Card, face_up: bool):
+        mask = self.data[player * FIELDS + FACE_UP] & ~(1 << index)
+        self._set(player, FACE_UP, mask | (int(face_up) << index))
+
+    def swap_cards(
+        self, player_a: Player, card_a: Card, player_b: Player, card_b: Card
+    ):
+        # the face-up flag travels with the card
+        code_a = (self.data[player_a * FIELDS + CARDS] >> (2 * card_a)) & 0b11
+        code_b = (self.data[player_b * FIELDS + CARDS] >> (2 * card_b)) & 0b11
+        up_a = self.is_face_up(player_a, card_a)
+        up_b = self.is_face_up(player_b, card_b)
+
+        self.set_card(player_a, card_a, INTEGRITY_CARDS[code_b])
+        self.set_face_up(player_a, card_a, up_b)
+        self.set_card(player_b, card_b, INTEGRITY_CARDS[code_a])
+        self.set_face_up(player_b, card_b, up_a)
@@ -0,0 +1,115 @@
+from functools import lru_cache
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any, Generic, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from gcbc.core.core_data import (
+        DeckState,
+        EquipmentCard,
+        PlayerGunState,
+        PlayerHealthState,
+        PlayerIntegrityCardState,
+        TableTopGameState,
+    )
+
+"""
+Zobrist hashing of the table. Every feature of a player's state (a card slot, their
+health, their gun, their equipment) has a random 64-bit key, and the key of a table
+is the XOR of the keys of its features. Changing a feature only needs its old key
+XORed out and its new key XORed in, which the TableTopGameState mutators do while
+the state's zobrist key is being tracked.
+
+Keys are derived from a digest of the feature rather than drawn from a seeded
+stream, so they are the same in every process regardless of which features were
+looked up first.
+"""
+
+Key = int
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(*feature: Any) -> Key:
+    digest = blake2b(repr(feature).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def card_key(player: int, index: int, card_state: "PlayerIntegrityCardState") -> Key:
+    return zobrist_key("card", player, index, card_state.card.name, card_state.face_up)
+
+
+def health_key(player: int, health: "PlayerHealthState") -> Key:
+    return zobrist_key("health", player, health)
+
+
+def gun_key(player: int, gun: Optional["PlayerGunState"]) -> Key:
+    if gun is None:
+        return zobrist_key("gun", player, None)
+    return zobrist_key("gun", player, gun.has_gun, gun.aimed_at)
+
+
+def equipment_key(player: int, equipment: Optional["EquipmentCard"]) -> Key:
+    if equipment is None:
+        return 0
+    return zobrist_key("equipment", player, equipment.name)
+
+
+def deck_key(deck_state: "DeckState") -> Key:
+    return zobrist_key("deck", len(deck_state.equipment_cards), deck_state.guns)
+
+
+def position_key(game_state: "TableTopGameState", deck_state: "DeckState") -> Key:
+    """
+    The key of a table and deck together. Starts tracking the table's key if it
+    is not tracked yet.
+    """
+    key = game_state.zobrist
+    if key is None:
+        key = game_state.compute_zobrist()
+    return key ^ deck_key(deck_state)
+
+
+V = TypeVar("V")
+
+
+class TranspositionTable(Generic[V]):
+    """
+    A fixed-size table of values keyed by position key, for search bots to memoize
+    evaluations of positions they reach by different move orders. Each key maps to
+    a single slot; on a collision the entry searched to the greater depth is kept.
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        """
+        :param size: The number of slots, rounded up to a power of two.
+        """
+        self.size = 1 << max(0, size - 1).bit_length()
+        self.mask = self.size - 1
+        self.slots: List[Optional[Tuple[Key, int, V]]] = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(1 for slot in self.slots if slot is not None)
+
+    def get(self, key: Key, min_depth: int = 0) -> Optional[V]:
+        """
+        The value stored for the key, if it was searched to at least min_depth.
+        """
+        slot = self.slots[key & self.mask]
+        if slot is not None and slot[0] == key and slot[1] >= min_depth:
+            self.hits += 1
+            return slot[2]
+
+        self.misses += 1
+        return None
+
+    def put(self, key: Key, value: V, depth: int = 0):
+        index = key & self.mask
+        slot = self.slots[index]
+        if slot is None or slot[0] == key or depth >= slot[1]:
+            self.slots[index] = (key, depth, value)
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.hits = 0
+        self.misses = 0
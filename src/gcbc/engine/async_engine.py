@@ -0,0 +1,111 @@
+import asyncio
+import inspect
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from gcbc.bot.base_bot import AnyBot
+from gcbc.core.core_data import DeckState, Player, TableTopGameState
+from gcbc.engine.engine import BaseGCBCGameEngine, PreRoundAnswer, WinCondition
+
+"""
+An engine that awaits its bots, so that many games can be interleaved on one
+event loop while the bots wait on I/O, e.g. a model server.
+
+Bots may be AsyncBaseBots or plain BaseBots; a plain bot's answer is used as is,
+and blocks the loop while the bot thinks.
+"""
+
+
+async def resolve(answer):
+    if inspect.isawaitable(answer):
+        return await answer
+    return answer
+
+
+class AsyncGCBCGameEngine(BaseGCBCGameEngine):
+    """
+    Same rules as the GCBCGameEngine, which it shares through BaseGCBCGameEngine.
+    The methods that ask the bots for moves are coroutines, and the pre-round
+    bots are asked concurrently on the loop.
+    """
+
+    @staticmethod
+    async def timed_pre_round(
+        bot: AnyBot, game_state: TableTopGameState, deck_state: DeckState
+    ) -> PreRoundAnswer:
+        start_time = time.perf_counter()
+        pre_round_move = await resolve(bot.pre_round(game_state, deck_state))
+        return pre_round_move, time.perf_counter() - start_time
+
+    async def ask_pre_round(self, requests) -> List[Tuple[Player, PreRoundAnswer]]:
+        tasks = {
+            asyncio.ensure_future(
+                self.timed_pre_round(bot, game_state, deck_state)
+            ): player
+            for player, bot, game_state, deck_state in requests
+        }
+        if not tasks:
+            return []
+
+        done, pending = await asyncio.wait(tasks, timeout=self.pre_round_timeout)
+        for task in pending:
+            task.cancel()
+        return [(tasks[task], task.result()) for task in done]
+
+    async def single_pre_round(self):
+        game_state, deck_state, requests = self.pre_round_requests()
+        answers = await self.ask_pre_round(requests)
+        return self.resolve_pre_round(answers, game_state, deck_state)
+
+    async def pre_round(self):
+        run_pre_round = True
+        while run_pre_round:
+            run_pre_round = await self.single_pre_round()
+
+    async def action(self, player: Player, bot: AnyBot):
+        action_to_take = await resolve(
+            bot.action(self.game_state.opaque_state(), self.deck_state.opaque_state())
+        )
+        return self.resolve_action(player, action_to_take)
+
+    async def aim(self, player: Player, bot: AnyBot):
+        maybe_aim = await resolve(bot.aim(self.game_state, self.deck_state))
+        return self.resolve_aim(player, maybe_aim)
+
+    async def run_round(self):
+        await self.pre_round()
+
+        bot = self.bot_manager.get_bot(self.current_player)
+        await self.action(self.current_player, bot)
+        await self.aim(self.current_player, bot)
+
+    async def play_round(self):
+        win_condition = self.win_condition()
+        if win_condition is None:
+            await self.run_round()
+            next_player = self.next_player(self.current_player)
+            self.current_player = next_player
+
+        return win_condition
+
+    async def play(self, max_rounds: int) -> Tuple[Optional[WinCondition], int]:
+        """
+        Plays until someone wins or max_rounds is reached. Returns the win
+        condition, None if the round limit was hit, and the number of rounds.
+        """
+        win_condition = None
+        rounds = 0
+        while win_condition is None and rounds < max_rounds:
+            win_condition = await self.play_round()
+            rounds += 1
+        return win_condition, rounds
+
+
+async def play_many(
+    engines: Iterable[AsyncGCBCGameEngine], max_rounds: int
+) -> List[Tuple[Optional[WinCondition], int]]:
+    """
+    Plays the games interleaved on the running loop, returning the result of
+    each in order.
+    """
+    return await asyncio.gather(*(engine.play(max_rounds) for engine in engines))
@@ -0,0 +1,699 @@
+from dataclasses import dataclass
+from typing import Callable, ClassVar, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerHealthState,
+    TableTopGameState,
+)
+from gcbc.core.packed import (
+    ALL_FACE_UP,
+    CARDS,
+    CARDS_PER_PLAYER,
+    DECK_EQUIPMENT,
+    EQUIPMENT,
+    EQUIPMENT_CARDS,
+    EQUIPMENT_CODES,
+    EQUIPMENT_OPCODES,
+    FACE_UP,
+    FIELDS,
+    GUN,
+    GUN_TAKEN,
+    HAS_GUN,
+    HEALTH,
+    AIMED_AT,
+    INTEGRITY_CARD_CODES,
+    NO_EQUIPMENT,
+    NO_GUN,
+    NO_OP,
+    NO_TARGET,
+    OP_AIM,
+    OP_ARM_AND_AIM,
+    OP_BLACKMAIL,
+    OP_DEFIBRILLATOR,
+    OP_EQUIP,
+    OP_INVESTIGATE,
+    OP_PASS,
+    OP_POLYGRAPH,
+    OP_SHOOT,
+    OP_SWAP,
+    OP_TASER,
+    PackedTableTopState,
+)
+from gcbc.engine.engine import WinCondition
+from gcbc.engine.state_init import GCBCInitalizer
+
+KINGPIN = INTEGRITY_CARD_CODES[IntegrityCard.KINGPIN]
+AGENT = INTEGRITY_CARD_CODES[IntegrityCard.AGENT]
+GOOD_COP = INTEGRITY_CARD_CODES[IntegrityCard.GOOD_COP]
+
+NO_WINNER = -1
+
+ACTION_OPCODES = (OP_INVESTIGATE, OP_EQUIP, OP_ARM_AND_AIM, OP_SHOOT, OP_PASS)
+EQUIPMENT_OPS = (OP_TASER, OP_DEFIBRILLATOR, OP_BLACKMAIL, OP_POLYGRAPH, OP_SWAP)
+
+# every equipment card that can be in a deck, in the order build_deck deals them
+DECK_CARDS = tuple(EQUIPMENT_CODES[card] for card in EQUIPMENT_CARDS[1:-1])
+
+# the opcode that plays each equipment code, NO_OP for no or unknown equipment
+PLAY_EQUIPMENT = np.full(len(EQUIPMENT_CARDS), NO_OP, dtype=np.int8)
+for code, opcode in EQUIPMENT_OPCODES.items():
+    PLAY_EQUIPMENT[code] = opcode
+
+
+@dataclass
+class BatchMoves:
+    """
+    One move per game, as parallel arrays. `args` holds the operator's arguments
+    after the acting player, in the order of its dataclass fields, padded with 0.
+    An opcode of NO_OP means the player makes no move.
+    """
+
+    op: np.ndarray  # (n,)
+    actor: np.ndarray  # (n,)
+    args: np.ndarray  # (n, 4)
+
+    @staticmethod
+    def empty(num_games: int) -> "BatchMoves":
+        return BatchMoves(
+            np.full(num_games, NO_OP, dtype=np.int8),
+            np.zeros(num_games, dtype=np.int8),
+            np.zeros((num_games, 4), dtype=np.int8),
+        )
+
+
+class BatchPolicy:
+    """
+    A bot that plays many games at once. Each method is called with the indices of
+    the games in which it has to move, and the player it is moving for in each,
+    and returns a BatchMoves with one row per game.
+    """
+
+    def pre_round(
+        self, engine: "BatchGCBCGameEngine", games: np.ndarray, players: np.ndarray
+    ) -> Optional[BatchMoves]:
+        """
+        The equipment card to play, if any. Only equipment opcodes are accepted.
+        """
+        return None
+
+    def action(
+        self, engine: "BatchGCBCGameEngine", games: np.ndarray, players: np.ndarray
+    ) -> Optional[BatchMoves]:
+        """
+        The action to take. Invalid actions are replaced by a pass.
+        """
+        return None
+
+    def aim(
+        self, engine: "BatchGCBCGameEngine", games: np.ndarray, players: np.ndarray
+    ) -> Optional[BatchMoves]:
+        """
+        The player to aim at. Only the aim opcode is accepted.
+        """
+        return None
+
+
+class RandomBatchPolicy(BatchPolicy):
+    """
+    Picks actions at random, weighted by `action_weights` over ACTION_OPCODES, and
+    plays held equipment or re-aims with the given probabilities. Targets and
+    cards are drawn uniformly, so many choices are invalid and become passes.
+    """
+
+    def __init__(
+        self,
+        rng: Optional[np.random.Generator] = None,
+        action_weights: Optional[Sequence[float]] = None,
+        equipment_probability: float = 0.2,
+        aim_probability: float = 0.2,
+    ):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        weights = np.asarray(
+            action_weights if action_weights is not None else [1.0] * len(ACTION_OPCODES),
+            dtype=np.float64,
+        )
+        self.action_weights = weights / weights.sum()
+        self.equipment_probability = equipment_probability
+        self.aim_probability = aim_probability
+
+    def _other_players(self, engine: "BatchGCBCGameEngine", players: np.ndarray):
+        offsets = self.rng.integers(1, engine.num_players, size=len(players))
+        return ((players + offsets) % engine.num_players).astype(np.int8)
+
+    def _cards(self, count: int):
+        return self.rng.integers(0, CARDS_PER_PLAYER, size=count).astype(np.int8)
+
+    def pre_round(self, engine, games, players):
+        moves = BatchMoves.empty(len(games))
+        equipment = engine.equipment[games, players]
+        playing = (equipment != NO_EQUIPMENT) & (
+            self.rng.random(len(games)) < self.equipment_probability
+        )
+        if not playing.any():
+            return None
+
+        moves.op[:] = np.where(playing, PLAY_EQUIPMENT[equipment], NO_OP)
+        moves.actor[:] = players
+        moves.args[:, 0] = self._other_players(engine, players)
+        moves.args[:, 1] = self._other_players(engine, players)
+        moves.args[:, 3] = self._cards(len(games))
+
+        # swap takes (playerA, cardA, playerB, cardB), the rest use the first two
+        swap = moves.op == OP_SWAP
+        moves.args[swap, 1] = self._cards(len(games))[swap]
+        moves.args[swap, 2] = self._other_players(engine, players)[swap]
+
+        # a defibrillator is only useful on a dead player
+        defibrillate = moves.op == OP_DEFIBRILLATOR
+        if defibrillate.any():
+            dead = engine.health[games] == PlayerHealthState.DEAD
+            has_dead = dead.any(axis=1)
+            moves.args[defibrillate, 0] = np.argmax(dead, axis=1)[defibrillate]
+            moves.op[defibrillate & ~has_dead] = NO_OP
+
+        return moves
+
+    def action(self, engine, games, players):
+        moves = BatchMoves.empty(len(games))
+        moves.op[:] = self.rng.choice(
+            np.asarray(ACTION_OPCODES, dtype=np.int8),
+            size=len(games),
+            p=self.action_weights,
+        )
+        moves.actor[:] = players
+        moves.args[:, 0] = self._other_players(engine, players)
+        moves.args[:, 1] = self._cards(len(games))
+
+        # equip only takes a card, and shoot targets whoever is aimed at
+        equip = moves.op == OP_EQUIP
+        moves.args[equip, 0] = moves.args[equip, 1]
+        shoot = moves.op == OP_SHOOT
+        moves.args[shoot, 0] = engine.aimed_at[games, players][shoot]
+        return moves
+
+    def aim(self, engine, games, players):
+        aiming = engine.gun[games, players] == HAS_GUN
+        aiming &= self.rng.random(len(games)) < self.aim_probability
+        if not aiming.any():
+            return None
+
+        moves = BatchMoves.empty(len(games))
+        moves.op[aiming] = OP_AIM
+        moves.actor[:] = players
+        moves.args[:, 0] = self._other_players(engine, players)
+        return moves
+
+
+class BatchGCBCGameEngine:
+    """
+    Plays many games of the same size at once. The table of every game is held
+    in (games, players) NumPy arrays using the codes of gcbc.core.packed, and
+    every operator's is_valid and play rules are applied to all games with a move
+    of that kind in one vectorized step.
+
+    Turns follow GCBCGameEngine, except that the pre-round visits each seat once,
+    in seat order, instead of repeatedly taking the fastest bot's equipment card.
+    """
+
+    def __init__(
+        self,
+        cards: np.ndarray,
+        face_up: np.ndarray,
+        gun: np.ndarray,
+        aimed_at: np.ndarray,
+        equipment: np.ndarray,
+        health: np.ndarray,
+        deck: np.ndarray,
+        deck_size: np.ndarray,
+        guns: np.ndarray,
+        policies: Sequence[BatchPolicy],
+    ):
+        self.num_games, self.num_players = health.shape
+        self.cards = cards  # (games, players, 3) card codes
+        self.face_up = face_up  # (games, players) face-up bitmasks
+        self.gun = gun  # (games, players) gun codes
+        self.aimed_at = aimed_at  # (games, players) player or NO_TARGET
+        self.equipment = equipment  # (games, players) equipment codes
+        self.health = health  # (games, players) PlayerHealthState values
+
+        # each deck is a ring buffer, the top card is at deck_head + deck_size - 1
+        self.deck = deck  # (games, capacity) equipment codes
+        self.deck_head = np.zeros(self.num_games, dtype=np.int8)
+        self.deck_size = deck_size  # (games,)
+        self.guns = guns  # (games,)
+
+        if len(policies) == 1:
+            policies = list(policies) * self.num_players
+        if len(policies) != self.num_players:
+            raise ValueError("expected one policy, or one policy per seat")
+        self.policies = list(policies)
+
+        self.current_player = np.zeros(self.num_games, dtype=np.int8)
+        self.winner = np.full(self.num_games, NO_WINNER, dtype=np.int8)
+        self.turns = np.zeros(self.num_games, dtype=np.int32)
+        self.all_games = np.arange(self.num_games)
+
+    @staticmethod
+    def new_games(
+        num_games: int,
+        num_players: int,
+        policies: Sequence[BatchPolicy],
+        rng: Optional[np.random.Generator] = None,
+    ) -> "BatchGCBCGameEngine":
+        """
+        Deals `num_games` fresh games, with the same card counts and deck as
+        GCBCInitalizer.
+        """
+        deals = GCBCInitalizer.deal_many(num_games, num_players, rng)
+        shape = (num_games, num_players)
+
+        return BatchGCBCGameEngine(
+            cards=deals.cards,
+            face_up=np.zeros(shape, dtype=np.int8),
+            gun=np.full(shape, NO_GUN, dtype=np.int8),
+            aimed_at=np.full(shape, NO_TARGET, dtype=np.int8),
+            equipment=np.full(shape, NO_EQUIPMENT, dtype=np.int8),
+            health=np.full(shape, PlayerHealthState.ALIVE, dtype=np.int8),
+            deck=np.tile(np.asarray(DECK_CARDS, dtype=np.int8), (num_games, 1)),
+            deck_size=np.full(num_games, len(DECK_CARDS), dtype=np.int8),
+            guns=np.full(num_games, num_players // 2, dtype=np.int8),
+            policies=policies,
+        )
+
+    @staticmethod
+    def from_states(
+        states: Sequence[Tuple[TableTopGameState, DeckState]],
+        policies: Sequence[BatchPolicy],
+    ) -> "BatchGCBCGameEngine":
+        """
+        Batches existing games, which must all have the same number of players.
+        """
+        packed = np.stack(
+            [
+                np.frombuffer(
+                    PackedTableTopState.from_state(game).tobytes(), dtype=np.int8
+                ).reshape(-1, FIELDS)
+                for game, _ in states
+            ]
+        )
+        capacity = max(len(DECK_CARDS), *(len(deck.equipment_cards) for _, deck in states))
+        deck = np.zeros((len(states), capacity), dtype=np.int8)
+        for index, (_, deck_state) in enumerate(states):
+            for position, card in enumerate(deck_state.equipment_cards):
+                deck[index, position] = EQUIPMENT_CODES[card]
+
+        packed_cards = packed[:, :, CARDS]
+        return BatchGCBCGameEngine(
+            cards=np.stack(
+                [(packed_cards >> (2 * index)) & 0b11 for index in range(CARDS_PER_PLAYER)],
+                axis=2,
+            ).astype(np.int8),
+            face_up=packed[:, :, FACE_UP].copy(),
+            gun=packed[:, :, GUN].copy(),
+            aimed_at=packed[:, :, AIMED_AT].copy(),
+            equipment=packed[:, :, EQUIPMENT].copy(),
+            health=packed[:, :, HEALTH].copy(),
+            deck=deck,
+            deck_size=np.asarray(
+                [len(deck.equipment_cards) for _, deck in states], dtype=np.int8
+            ),
+            guns=np.asarray([deck.guns for _, deck in states], dtype=np.int8),
+            policies=policies,
+        )
+
+    def get_state(self, game: int) -> Tuple[TableTopGameState, DeckState]:
+        """
+        Hydrates one game back into the dataclasses.
+        """
+        rows = np.zeros((self.num_players, FIELDS), dtype=np.int8)
+        cards = self.cards[game].astype(np.int16)
+        rows[:, CARDS] = cards[:, 0] | (cards[:, 1] << 2) | (cards[:, 2] << 4)
+        rows[:, FACE_UP] = self.face_up[game]
+        rows[:, GUN] = self.gun[game]
+        rows[:, AIMED_AT] = self.aimed_at[game]
+        rows[:, EQUIPMENT] = self.equipment[game]
+        rows[:, HEALTH] = self.health[game]
+        packed = PackedTableTopState.frombytes(self.num_players, rows.tobytes())
+
+        capacity = self.deck.shape[1]
+        positions = (self.deck_head[game] + np.arange(self.deck_size[game])) % capacity
+        deck = DeckState(
+            [DECK_EQUIPMENT[code] for code in self.deck[game, positions]],
+            int(self.guns[game]),
+        )
+        return packed.to_state(), deck
+
+    # Helpers shared by the rules. All take parallel arrays of game indices and
+    # players, which may be out of range; gathers clip them and callers mask the
+    # result with _in_range.
+
+    def _in_range(self, players: np.ndarray) -> np.ndarray:
+        return (players >= 0) & (players < self.num_players)
+
+    def _clip(self, players: np.ndarray) -> np.ndarray:
+        return np.clip(players, 0, self.num_players - 1)
+
+    def _alive(self, games: np.ndarray, players: np.ndarray) -> np.ndarray:
+        return self._in_range(players) & (
+            self.health[games, self._clip(players)] != PlayerHealthState.DEAD
+        )
+
+    def _can_flip(
+        self, games: np.ndarray, players: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        in_range = (cards >= 0) & (cards < CARDS_PER_PLAYER)
+        face_up = self.face_up[games, self._clip(players)]
+        face_down = ((face_up >> np.clip(cards, 0, CARDS_PER_PLAYER - 1)) & 1) == 0
+        return in_range & ((face_up == ALL_FACE_UP) | face_down)
+
+    def _holds(
+        self, games: np.ndarray, players: np.ndarray, card: EquipmentCard
+    ) -> np.ndarray:
+        return self.equipment[games, self._clip(players)] == EQUIPMENT_CODES[card]
+
+    def _return_equipment(self, games: np.ndarray, card: EquipmentCard):
+        capacity = self.deck.shape[1]
+        self.deck_head[games] = (self.deck_head[games] - 1) % capacity
+        self.deck[games, self.deck_head[games]] = EQUIPMENT_CODES[card]
+        self.deck_size[games] += 1
+
+    # Validity, one function per opcode, mirroring the operators' is_valid
+
+    def _valid_investigate(self, games, actor, args):
+        return (
+            self._alive(games, actor)
+            & self._alive(games, args[:, 0])
+            & (args[:, 1] >= 0)
+            & (args[:, 1] < CARDS_PER_PLAYER)
+        )
+
+    def _valid_equip(self, games, actor, args):
+        return (
+            self._alive(games, actor)
+            & (self.deck_size[games] > 0)
+            & (self.equipment[games, self._clip(actor)] == NO_EQUIPMENT)
+            & self._can_flip(games, actor, args[:, 0])
+        )
+
+    def _valid_arm_and_aim(self, games, actor, args):
+        return (
+            self._alive(games, actor)
+            & self._alive(games, args[:, 0])
+            & (self.guns[games] > 0)
+            & (self.gun[games, self._clip(actor)] != GUN_TAKEN)
+            & self._can_flip(games, actor, args[:, 1])
+        )
+
+    def _valid_aim(self, games, actor, args):
+        return (
+            self._alive(games, actor)
+            & self._alive(games, args[:, 0])
+            & (self.gun[games, self._clip(actor)] == HAS_GUN)
+        )
+
+    def _valid_shoot(self, games, actor, args):
+        aimed_at = self.aimed_at[games, self._clip(actor)]
+        return (
+            self._alive(games, actor)
+            & (aimed_at == args[:, 0])
+            & self._alive(games, aimed_at)
+            & (self.gun[games, self._clip(actor)] == HAS_GUN)
+        )
+
+    def _valid_pass(self, games, actor, args):
+        return np.ones(len(games), dtype=bool)
+
+    def _valid_taser(self, games, actor, args):
+        target, aimed_at = args[:, 0], args[:, 1]
+        return (
+            self._alive(games, actor)
+            & self._alive(games, target)
+            & self._alive(games, aimed_at)
+            & (actor != target)
+            & (actor != aimed_at)
+            & (self.gun[games, self._clip(target)] != GUN_TAKEN)
+            & self._holds(games, actor, EquipmentCard.TASER)
+        )
+
+    def _valid_defibrillator(self, games, actor, args):
+        target = args[:, 0]
+        return (
+            self._alive(games, actor)
+            & self._in_range(target)
+            & ~self._alive(games, target)
+            & self._holds(games, actor, EquipmentCard.DEFIBRILLATOR)
+        )
+
+    def _valid_blackmail(self, games, actor, args):
+        return (
+            self._alive(games, actor)
+            & self._alive(games, args[:, 0])
+            & self._holds(games, actor, EquipmentCard.BLACKMAIL)
+        )
+
+    def _valid_polygraph(self, games, actor, args):
+        return (
+            self._alive(games, actor)
+            & self._alive(games, args[:, 0])
+            & self._holds(games, actor, EquipmentCard.POLYGRAPH)
+        )
+
+    def _valid_swap(self, games, actor, args):
+        player_a, card_a, player_b, card_b = args.T
+        return (
+            self._alive(games, actor)
+            & self._alive(games, player_a)
+            & self._alive(games, player_b)
+            & (player_a != player_b)
+            & self._holds(games, actor, EquipmentCard.SWAP)
+            & (card_a >= 0)
+            & (card_a < CARDS_PER_PLAYER)
+            & (card_b >= 0)
+            & (card_b < CARDS_PER_PLAYER)
+        )
+
+    # Play, one function per opcode, mirroring the operators' play. Only called
+    # with valid moves, so indices are in range.
+
+    def _play_investigate(self, games, actor, args):
+        pass
+
+    def _play_equip(self, games, actor, args):
+        capacity = self.deck.shape[1]
+        top = (self.deck_head[games] + self.deck_size[games] - 1) % capacity
+        self.equipment[games, actor] = self.deck[games, top]
+        self.deck_size[games] -= 1
+        self.face_up[games, actor] |= (1 << args[:, 0]).astype(np.int8)
+
+    def _play_arm_and_aim(self, games, actor, args):
+        self.guns[games] -= 1
+        self.gun[games, actor] = HAS_GUN
+        self.aimed_at[games, actor] = args[:, 0]
+        self.face_up[games, actor] |= (1 << args[:, 1]).astype(np.int8)
+
+    def _play_aim(self, games, actor, args):
+        self.aimed_at[games, actor] = args[:, 0]
+
+    def _play_shoot(self, games, actor, args):
+        target = args[:, 0]
+        target_cards = self.cards[games, target]
+        special = ((target_cards == KINGPIN) | (target_cards == AGENT)).any(axis=1)
+        wounded = special & (self.health[games, target] == PlayerHealthState.ALIVE)
+        self.health[games, target] = np.where(
+            wounded, PlayerHealthState.WOUNDED, PlayerHealthState.DEAD
+        )
+
+        self.gun[games, actor] = NO_GUN
+        self.aimed_at[games, actor] = NO_TARGET
+        self.guns[games] += 1
+
+    def _play_pass(self, games, actor, args):
+        pass
+
+    def _play_taser(self, games, actor, args):
+        target = args[:, 0]
+        self.gun[games, actor] = self.gun[games, target]
+        self.aimed_at[games, actor] = args[:, 1]
+        self.gun[games, target] = GUN_TAKEN
+        self.aimed_at[games, target] = NO_TARGET
+        self.equipment[games, actor] = NO_EQUIPMENT
+        self._return_equipment(games, EquipmentCard.TASER)
+
+    def _play_defibrillator(self, games, actor, args):
+        self.health[games, args[:, 0]] = PlayerHealthState.ALIVE
+        self.equipment[games, actor] = NO_EQUIPMENT
+        self._return_equipment(games, EquipmentCard.DEFIBRILLATOR)
+
+    def _play_blackmail(self, games, actor, args):
+        target = args[:, 0]
+        cards = self.cards[games, target]
+        # good and bad cops are codes 2 and 3, so flipping toggles the low bit
+        self.cards[games, target] = np.where(cards >= GOOD_COP, cards ^ 1, cards)
+        self.equipment[games, actor] = NO_EQUIPMENT
+        self._return_equipment(games, EquipmentCard.BLACKMAIL)
+
+    def _play_polygraph(self, games, actor, args):
+        self.equipment[games, actor] = NO_EQUIPMENT
+        self._return_equipment(games, EquipmentCard.POLYGRAPH)
+
+    def _play_swap(self, games, actor, args):
+        player_a, card_a, player_b, card_b = args.T
+        up_a = (self.face_up[games, player_a] >> card_a) & 1
+        up_b = (self.face_up[games, player_b] >> card_b) & 1
+        code_a = self.cards[games, player_a, card_a]
+        code_b = self.cards[games, player_b, card_b]
+
+        self.cards[games, player_a, card_a] = code_b
+        self.cards[games, player_b, card_b] = code_a
+        self.face_up[games, player_a] = (
+            self.face_up[games, player_a] & ~(1 << card_a) | (up_b << card_a)
+        ).astype(np.int8)
+        self.face_up[games, player_b] = (
+            self.face_up[games, player_b] & ~(1 << card_b) | (up_a << card_b)
+        ).astype(np.int8)
+
+        self.equipment[games, actor] = NO_EQUIPMENT
+        self._return_equipment(games, EquipmentCard.SWAP)
+
+    # the validity and play functions of each opcode
+    RULES: ClassVar[Dict[int, Tuple[Callable[..., np.ndarray], Callable[..., None]]]] = {
+        OP_INVESTIGATE: (_valid_investigate, _play_investigate),
+        OP_EQUIP: (_valid_equip, _play_equip),
+        OP_ARM_AND_AIM: (_valid_arm_and_aim, _play_arm_and_aim),
+        OP_AIM: (_valid_aim, _play_aim),
+        OP_SHOOT: (_valid_shoot, _play_shoot),
+        OP_PASS: (_valid_pass, _play_pass),
+        OP_TASER: (_valid_taser, _play_taser),
+        OP_DEFIBRILLATOR: (_valid_defibrillator, _play_defibrillator),
+        OP_BLACKMAIL: (_valid_blackmail, _play_blackmail),
+        OP_POLYGRAPH: (_valid_polygraph, _play_polygraph),
+        OP_SWAP: (_valid_swap, _play_swap),
+    }
+
+    def is_valid(self, games: np.ndarray, moves: BatchMoves) -> np.ndarray:
+        """
+        For each game, whether its move is valid. NO_OP is never valid.
+        """
+        valid = np.zeros(len(games), dtype=bool)
+        for opcode, (is_valid, _) in self.RULES.items():
+            rows = np.flatnonzero(moves.op == opcode)
+            if rows.size:
+                valid[rows] = is_valid(
+                    self, games[rows], moves.actor[rows], moves.args[rows]
+                )
+        return valid
+
+    def enact(self, games: np.ndarray, moves: BatchMoves) -> np.ndarray:
+        """
+        Plays every valid move, and returns which were valid.
+        """
+        valid = self.is_valid(games, moves)
+        for opcode, (_, play) in self.RULES.items():
+            rows = np.flatnonzero(valid & (moves.op == opcode))
+            if rows.size:
+                play(self, games[rows], moves.actor[rows], moves.args[rows])
+        return valid
+
+    def _ask(self, phase: str, games: np.ndarray, players: np.ndarray):
+        """
+        Asks each seat's policy for its moves, in the games where it is to move.
+        """
+        moves = BatchMoves.empty(len(games))
+        for seat, policy in enumerate(self.policies):
+            rows = np.flatnonzero(players == seat)
+            if not rows.size:
+                continue
+
+            seat_moves = getattr(policy, phase)(self, games[rows], players[rows])
+            if seat_moves is not None:
+                moves.op[rows] = seat_moves.op
+                moves.actor[rows] = players[rows]
+                moves.args[rows] = seat_moves.args
+        return moves
+
+    def pre_round(self, games: np.ndarray):
+        for seat in range(self.num_players):
+            players = np.full(len(games), seat, dtype=np.int8)
+            playing = self._alive(games, players) & (
+                self.equipment[games, seat] != NO_EQUIPMENT
+            )
+            moves = self._ask("pre_round", games[playing], players[playing])
+            moves.op[~np.isin(moves.op, EQUIPMENT_OPS)] = NO_OP
+            self.enact(games[playing], moves)
+
+    def action(self, games: np.ndarray):
+        players = self.current_player[games]
+        moves = self._ask("action", games, players)
+        moves.op[~np.isin(moves.op, ACTION_OPCODES)] = OP_PASS
+        moves.op[~self.is_valid(games, moves)] = OP_PASS
+        self.enact(games, moves)
+
+    def aim(self, games: np.ndarray):
+        players = self.current_player[games]
+        moves = self._ask("aim", games, players)
+        moves.op[moves.op != OP_AIM] = NO_OP
+        self.enact(games, moves)
+
+    def next_player(self, games: np.ndarray) -> np.ndarray:
+        current = self.current_player[games]
+        next_player = current.copy()
+        found = np.zeros(len(games), dtype=bool)
+        for offset in range(1, self.num_players + 1):
+            candidate = ((current + offset) % self.num_players).astype(np.int8)
+            alive = ~found & self._alive(games, candidate)
+            next_player[alive] = candidate[alive]
+            found |= alive
+        return next_player
+
+    def win_condition(self) -> np.ndarray:
+        """
+        The WinCondition value of every game, or NO_WINNER. Like
+        GCBCGameEngine.win_condition, the first player in seat order that ends the
+        game decides how it ended.
+        """
+        alive = self.health != PlayerHealthState.DEAD
+        has_agent = (self.cards == AGENT).any(axis=2)
+        has_kingpin = (self.cards == KINGPIN).any(axis=2)
+
+        outcome = np.full(self.health.shape, NO_WINNER, dtype=np.int8)
+        outcome[~alive & has_kingpin] = WinCondition.KINGPIN_DEAD.value
+        outcome[~alive & has_agent] = WinCondition.AGENT_DEAD.value
+        outcome[alive & has_agent & has_kingpin] = WinCondition.AGENT_IS_KINGPIN.value
+
+        decided = outcome != NO_WINNER
+        first = np.argmax(decided, axis=1)
+        result = np.where(
+            decided.any(axis=1), outcome[self.all_games, first], NO_WINNER
+        ).astype(np.int8)
+        result[alive.sum(axis=1) == 1] = WinCondition.ONE_PLAYER_ALIVE.value
+        return result
+
+    def step(self) -> np.ndarray:
+        """
+        Plays one turn of every unfinished game, and returns the win conditions.
+        """
+        self.winner = self.win_condition()
+        games = np.flatnonzero(self.winner == NO_WINNER)
+        if games.size:
+            self.pre_round(games)
+            self.action(games)
+            self.aim(games)
+            self.current_player[games] = self.next_player(games)
+            self.turns[games] += 1
+        return self.winner
+
+    def run(self, max_turns: int = 1000) -> np.ndarray:
+        """
+        Plays until every game is won or `max_turns` turns have been played.
+        """
+        for _ in range(max_turns):
+            if (self.step() != NO_WINNER).all():
+                break
+        self.winner = self.win_condition()
+        return self.winner
+
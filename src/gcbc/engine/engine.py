@@ -1,18 +1,29 @@
-from copy import deepcopy
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import enum
 import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from gcbc.bot.base_bot import BaseBot, BotManager
 from gcbc.core.core_data import (
     IntegrityCard,
     Player,
+    RoleType,
     TableTopGameState,
     DeckState,
 )
+from gcbc.core.journal import ChangeJournal
+from gcbc.engine.game_log import GameLogWriter
+from gcbc.engine.seeding import Rng
+from gcbc.engine.state_init import GCBCInitalizer
 from gcbc.operators.action.aim import Aim
 from gcbc.operators.actions import Actions
 from gcbc.operators.base_operator import BaseOperator
 
 
+# a bot's pre-round move, and how many seconds it took to answer
+PreRoundAnswer = Tuple[Optional[BaseOperator], float]
+
+
 class WinCondition(enum.Enum):
     ONE_PLAYER_ALIVE = 0
     AGENT_DEAD = 1
@@ -20,76 +31,176 @@ class WinCondition(enum.Enum):
     AGENT_IS_KINGPIN = 3
 
 
-class GCBCGameEngine:
+class BaseGCBCGameEngine:
+    """
+    The rules of the game, shared by the engines: dealing, enacting operators and
+    resolving the bots' answers into moves. The engines differ only in how they
+    ask the bots for those answers.
+    """
+
     def __init__(
         self,
         game_state: TableTopGameState,
         deck_state: DeckState,
         bot_manager: BotManager,
+        pre_round_timeout: Optional[float] = None,
+        game_log: Optional[GameLogWriter] = None,
+        pre_round_resolution: float = 0.05,
     ):
+        """
+        :param pre_round_timeout: Seconds each bot has to answer in the pre-round.
+                                  Later answers are ignored. None waits for every bot.
+        :param game_log: Records the table the engine starts with, which must be
+                         freshly dealt, and every operator it enacts. A writer
+                         logs one game at a time, so engines playing at once
+                         can't share one.
+        :param pre_round_resolution: Seconds within which pre-round answers count as
+                                     equally fast. Equally fast answers go to the
+                                     first seat in turn order from the current
+                                     player, so bots that answer well within it,
+                                     like most programs, replay the same from the
+                                     same seeds. 0 ranks answers by their exact
+                                     time.
+        """
         self.game_state = game_state
         self.deck_state = deck_state
         self.bot_manager = bot_manager
 
+        self.pre_round_timeout = pre_round_timeout
+        self.pre_round_resolution = pre_round_resolution
+        self.game_log = game_log
+        self.logged_game: Optional[int] = None
+        if game_log is not None:
+            self.logged_game = game_log.start_game(game_state, deck_state)
+
         self.current_player = 0
         self.turn_increment = 1
 
-    def enact(self, operator: BaseOperator) -> bool:
-        new_game_state = deepcopy(self.game_state)
-        new_deck_state = deepcopy(self.deck_state)
+        self.journal = ChangeJournal()
+        # the operators made, each with the undo record taken before it was made
+        self.move_stack: List[Tuple[BaseOperator, Any]] = []
+
+    @classmethod
+    def new_game(cls, bot_manager: BotManager, rng: Optional[Rng] = None, **kwargs):
+        """
+        Deals a new game for the bots in the bot manager from `rng`, or the
+        global random module if none is given.
+        """
+        num_players = len(bot_manager.player_map)
+        return cls(
+            GCBCInitalizer.build_game_state(num_players, rng),
+            GCBCInitalizer.build_deck(num_players, rng),
+            bot_manager,
+            **kwargs,
+        )
 
-        is_valid = operator.is_valid(new_game_state, new_deck_state)
+    def enact(self, operator: BaseOperator) -> bool:
+        """
+        Validate and play the operator in place. The fields the operator touches are
+        journaled, so if playing or notifying raises, the table is rolled back to
+        the state it was in before the operator was enacted.
+        """
+        if not operator.is_valid(self.game_state, self.deck_state):
+            return False
 
-        if is_valid:
+        with self.journal.transaction(self.game_state, self.deck_state):
             new_game_state, new_deck_state = operator.play(
-                new_game_state, new_deck_state
+                self.game_state, self.deck_state
             )
             operator.notify(new_game_state, self.bot_manager)
             operator.private_notify(new_game_state, self.bot_manager)
 
-            self.game_state = new_game_state
-            self.deck_state = new_deck_state
-
-        return is_valid
-
-    def single_pre_round(self):
-        pre_round_moves = []
-
-        for player, bot in self.bot_manager.player_map.items():
-            if not self.game_state.is_player_alive(player):
-                continue
+        self.game_state = new_game_state
+        self.deck_state = new_deck_state
+        if self.game_log is not None:
+            self.game_log.write(operator, self.logged_game)
+        return True
 
-            new_game_state = deepcopy(self.game_state)
-            new_deck_state = deepcopy(self.deck_state)
+    def make(self, operator: BaseOperator) -> bool:
+        """
+        Play the operator in place and push it onto the move stack, without
+        notifying any bots. Used by search bots to explore hypothetical moves,
+        with unmake() taking them back.
+        """
+        if not operator.is_valid(self.game_state, self.deck_state):
+            return False
 
-            start_time = time.time()
-            pre_round_move = bot.pre_round(new_game_state, new_deck_state)
-            end_time = time.time()
+        record = operator.undo_record(self.game_state, self.deck_state)
+        self.game_state, self.deck_state = operator.play(
+            self.game_state, self.deck_state
+        )
+        self.move_stack.append((operator, record))
+        return True
 
-            if pre_round_move is None:
-                continue
+    def unmake(self) -> Optional[BaseOperator]:
+        """
+        Pop the last operator made and undo it. Returns None if the stack is empty.
+        """
+        if not self.move_stack:
+            return None
 
-            if pre_round_move.is_valid(new_game_state, new_deck_state):
-                pre_round_moves.append((pre_round_move, end_time - start_time))
+        operator, record = self.move_stack.pop()
+        self.game_state, self.deck_state = operator.undo(
+            self.game_state, self.deck_state, record
+        )
+        return operator
+
+    def close(self):
+        """
+        Releases anything the engine holds on to for asking the bots.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def pre_round_requests(self):
+        """
+        Every alive bot reads the same read-only snapshot of the table.
+        """
+        game_state = self.game_state.snapshot()
+        deck_state = self.deck_state.snapshot()
+        requests = [
+            (player, bot, game_state, deck_state)
+            for player, bot in self.bot_manager.player_map.items()
+            if self.game_state.is_player_alive(player)
+        ]
+        return game_state, deck_state, requests
+
+    def resolve_pre_round(
+        self,
+        answers: List[Tuple[Player, PreRoundAnswer]],
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+    ) -> bool:
+        pre_round_moves = [
+            (self.pre_round_rank(player, elapsed), pre_round_move)
+            for player, (pre_round_move, elapsed) in answers
+            if (self.pre_round_timeout is None or elapsed <= self.pre_round_timeout)
+            and pre_round_move is not None
+            and pre_round_move.is_valid(game_state, deck_state)
+        ]
 
         if not pre_round_moves:
             return False
 
-        pre_round_moves.sort(reverse=True, key=lambda x: x[1])
-        best = pre_round_moves.pop()[0]
+        _, best = min(pre_round_moves, key=lambda x: x[0])
         self.enact(best)
         return True
 
-    def pre_round(self):
-        run_pre_round = True
-        while run_pre_round:
-            run_pre_round = self.single_pre_round()
-
-    def action(self, player: Player, bot: BaseBot):
-        action_to_take = bot.action(
-            self.game_state.opaque_state(), self.deck_state.opaque_state()
-        )
-
+    def pre_round_rank(self, player: Player, elapsed: float) -> Tuple[float, int]:
+        """
+        The fastest answer wins, counting answers within pre_round_resolution of
+        each other as equally fast, and ties go to the first seat in turn order.
+        """
+        if self.pre_round_resolution > 0:
+            elapsed = elapsed // self.pre_round_resolution
+        num_players = len(self.bot_manager.player_map)
+        return elapsed, (player - self.current_player) % num_players
+
+    def resolve_action(self, player: Player, action_to_take: Optional[BaseOperator]):
         if (action_to_take is None) or (type(action_to_take) == Aim):
             return self.enact(Actions.passMove(player))
 
@@ -98,8 +209,7 @@ class GCBCGameEngine:
         else:
             self.enact(Actions.passMove(player))
 
-    def aim(self, player: Player, bot: BaseBot):
-        maybe_aim = bot.aim(self.game_state, self.deck_state)
+    def resolve_aim(self, player: Player, maybe_aim: Optional[BaseOperator]):
         if maybe_aim is None:
             return False
 
@@ -111,6 +221,133 @@ class GCBCGameEngine:
         else:
             return False
 
+    def next_player(self, curr_player: Player):
+        next_player = (curr_player + self.turn_increment) % len(
+            self.bot_manager.player_map
+        )
+        if self.game_state.is_player_alive(next_player):
+            return next_player
+        else:
+            return self.next_player(next_player)
+
+    def win_condition(self):
+        return find_win_condition(self.game_state, self.bot_manager.player_map.keys())
+
+
+class GCBCGameEngine(BaseGCBCGameEngine):
+    def __init__(
+        self,
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+        bot_manager: BotManager,
+        pre_round_timeout: Optional[float] = None,
+        pre_round_workers: Optional[int] = None,
+        game_log: Optional[GameLogWriter] = None,
+        pre_round_resolution: float = 0.05,
+    ):
+        """
+        :param pre_round_workers: Threads used to ask the bots concurrently in the
+                                  pre-round, by default one per bot, so the table
+                                  waits for the slowest bot up to the timeout. A
+                                  bot still thinking past the timeout isn't asked
+                                  again until it has answered. 0 asks the bots one
+                                  after another on the calling thread, which is
+                                  cheaper for bots that answer in microseconds, but
+                                  then a slow bot stalls the table before its
+                                  answer is ignored. The threads are stopped by
+                                  close(), or when the engine is garbage collected.
+
+        The other parameters are those of BaseGCBCGameEngine.
+        """
+        super().__init__(
+            game_state,
+            deck_state,
+            bot_manager,
+            pre_round_timeout=pre_round_timeout,
+            game_log=game_log,
+            pre_round_resolution=pre_round_resolution,
+        )
+        self.pre_round_workers = pre_round_workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.shutdown_executor: Optional[weakref.finalize] = None
+        # the pre-round question each bot was still answering at the timeout
+        self.unanswered: Dict[Player, Future] = {}
+
+    def close(self):
+        """
+        Stops the pre-round threads. Bots still answering are not waited for.
+        """
+        if self.shutdown_executor is not None:
+            self.shutdown_executor()
+            self.shutdown_executor = None
+            self.executor = None
+        self.unanswered.clear()
+
+    @staticmethod
+    def timed_pre_round(
+        bot: BaseBot, game_state: TableTopGameState, deck_state: DeckState
+    ) -> PreRoundAnswer:
+        start_time = time.perf_counter()
+        pre_round_move = bot.pre_round(game_state, deck_state)
+        return pre_round_move, time.perf_counter() - start_time
+
+    def ask_pre_round(self, requests) -> List[Tuple[Player, PreRoundAnswer]]:
+        """
+        Asks the bot of each (player, bot, game_state, deck_state) request for its
+        pre-round move, and returns the (player, (move, elapsed)) answers that came
+        back before the timeout. Bots still answering an earlier question are
+        left out, so that a bot that hangs holds on to one thread at most.
+        """
+        if self.pre_round_workers == 0:
+            return [
+                (player, self.timed_pre_round(bot, game_state, deck_state))
+                for player, bot, game_state, deck_state in requests
+            ]
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.pre_round_workers or len(self.bot_manager.player_map),
+                thread_name_prefix="gcbc-pre-round",
+            )
+            self.shutdown_executor = weakref.finalize(
+                self, self.executor.shutdown, wait=False, cancel_futures=True
+            )
+        for player, future in list(self.unanswered.items()):
+            if future.done():
+                del self.unanswered[player]
+
+        futures = {
+            self.executor.submit(self.timed_pre_round, bot, game_state, deck_state): player
+            for player, bot, game_state, deck_state in requests
+            if player not in self.unanswered
+        }
+        done, not_done = wait(futures, timeout=self.pre_round_timeout)
+        for future in not_done:
+            # questions still queued are dropped, the bots thinking are remembered
+            if not future.cancel():
+                self.unanswered[futures[future]] = future
+        return [(futures[future], future.result()) for future in done]
+
+    def single_pre_round(self):
+        game_state, deck_state, requests = self.pre_round_requests()
+        answers = self.ask_pre_round(requests)
+        return self.resolve_pre_round(answers, game_state, deck_state)
+
+    def pre_round(self):
+        run_pre_round = True
+        while run_pre_round:
+            run_pre_round = self.single_pre_round()
+
+    def action(self, player: Player, bot: BaseBot):
+        action_to_take = bot.action(
+            self.game_state.opaque_state(), self.deck_state.opaque_state()
+        )
+        return self.resolve_action(player, action_to_take)
+
+    def aim(self, player: Player, bot: BaseBot):
+        maybe_aim = bot.aim(self.game_state, self.deck_state)
+        return self.resolve_aim(player, maybe_aim)
+
     def run_round(self):
         self.pre_round()
 
@@ -127,42 +364,61 @@ class GCBCGameEngine:
 
         return win_condition
 
-    def next_player(self, curr_player: Player):
-        next_player = (curr_player + self.turn_increment) % len(
-            self.bot_manager.player_map
-        )
-        if self.game_state.is_player_alive(next_player):
-            return next_player
-        else:
-            return self.next_player(next_player)
-
-    def win_condition(self):
-        players = self.bot_manager.player_map.keys()
-        num_players_alive = sum(
-            1 for p in players if self.game_state.is_player_alive(p)
-        )
 
-        if num_players_alive == 1:
-            return WinCondition.ONE_PLAYER_ALIVE
+def holds(game_state: TableTopGameState, player: Player, card: IntegrityCard) -> bool:
+    return any(x.card == card for x in game_state.state[player].integrity_cards)
 
-        for p in players:
-            if self.game_state.is_player_alive(p):
-                if self.is_player_x(p, IntegrityCard.AGENT) and self.is_player_x(
-                    p, IntegrityCard.KINGPIN
-                ):
-                    return WinCondition.AGENT_IS_KINGPIN
-            else:
-                if self.is_player_x(p, IntegrityCard.AGENT):
-                    return WinCondition.AGENT_DEAD
 
-                if self.is_player_x(p, IntegrityCard.KINGPIN):
-                    return WinCondition.KINGPIN_DEAD
+def find_win_condition(
+    game_state: TableTopGameState, players: Iterable[Player]
+) -> Optional[WinCondition]:
+    """
+    How the game on the table has been won, if it has, by one of `players`.
+    """
+    players = list(players)
+    num_players_alive = sum(1 for p in players if game_state.is_player_alive(p))
 
-        return None
+    if num_players_alive == 1:
+        return WinCondition.ONE_PLAYER_ALIVE
 
-    def is_player_x(self, player: Player, x: IntegrityCard) -> bool:
-        player_state = self.game_state.state[player]
-        player_cards = [x.card for x in player_state.integrity_cards]
-        if x in player_cards:
-            return True
-        return False
+    for p in players:
+        if game_state.is_player_alive(p):
+            if holds(game_state, p, IntegrityCard.AGENT) and holds(
+                game_state, p, IntegrityCard.KINGPIN
+            ):
+                return WinCondition.AGENT_IS_KINGPIN
+        else:
+            if holds(game_state, p, IntegrityCard.AGENT):
+                return WinCondition.AGENT_DEAD
+
+            if holds(game_state, p, IntegrityCard.KINGPIN):
+                return WinCondition.KINGPIN_DEAD
+
+    return None
+
+
+def find_winners(
+    game_state: TableTopGameState,
+    players: Iterable[Player],
+    win_condition: WinCondition,
+) -> Tuple[Player, ...]:
+    players = list(players)
+
+    match win_condition:
+        case WinCondition.ONE_PLAYER_ALIVE:
+            return tuple(p for p in players if game_state.is_player_alive(p))
+        case WinCondition.AGENT_IS_KINGPIN:
+            # whoever ends up holding both cards wins alone
+            return tuple(
+                p
+                for p in players
+                if game_state.is_player_alive(p)
+                and holds(game_state, p, IntegrityCard.AGENT)
+                and holds(game_state, p, IntegrityCard.KINGPIN)
+            )[:1]
+        case WinCondition.AGENT_DEAD:
+            team = RoleType.BAD
+        case WinCondition.KINGPIN_DEAD:
+            team = RoleType.GOOD
+
+    return tuple(p for p in players if game_state.get_player_team(p) == team)
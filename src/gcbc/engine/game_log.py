@@ -0,0 +1,286 @@
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+import numpy as np
+
+from gcbc.bot.wire import OPERATOR_FIELDS, OPERATOR_OPCODES, OPERATORS
+from gcbc.core.core_data import (
+    DeckState,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+from gcbc.core.packed import (
+    CARDS_PER_PLAYER,
+    DECK_EQUIPMENT,
+    EQUIPMENT_CODES,
+    INTEGRITY_CARD_CODES,
+    INTEGRITY_CARDS,
+)
+from gcbc.operators.base_operator import BaseOperator
+
+"""
+A binary log of played games, for offline training.
+
+The file is a header followed by fixed-width records of RECORD_SIZE signed
+bytes. The first byte of a record is its kind: an operator's opcode for a move,
+or one of the negative codes below for the start of a game. A game is written
+as:
+
+- a GAME record: GAME, num_players
+- a DEAL record per player, in seat order: DEAL, player, the card codes
+- a DECK record: DECK, guns, num_cards, the equipment codes from the bottom up
+- a record per enacted operator: opcode, then its fields in declaration order,
+  the acting player first, padded with zeros
+
+Codes are those of gcbc.core.packed. Records are fixed-width so the reader can
+map the file and view every record as one row of a (records, RECORD_SIZE) array
+without reading or decoding it.
+"""
+
+MAGIC = b"GCBCLOG"
+VERSION = 1
+HEADER = struct.Struct("<7sB")  # magic, version; 8 bytes keeps the records aligned
+
+RECORD_SIZE = 8
+RECORD = struct.Struct(f"<{RECORD_SIZE}b")
+
+# record kinds, moves use their opcode
+GAME = -2
+DEAL = -3
+DECK = -4
+
+MAX_DECK_CARDS = RECORD_SIZE - 3
+
+Path = Union[str, os.PathLike]
+
+# the fields of each operator, in record order
+OPERATOR_ARGS = {
+    operator: attrgetter(*names) for operator, names in OPERATOR_FIELDS.items()
+}
+
+
+class GameLogWriter:
+    """
+    Streams games to a log file. Give it to a GCBCGameEngine as `game_log` to
+    record the game the engine starts with and every operator it enacts.
+
+    Moves carry no game id, so a writer logs one game at a time: once another
+    game has started, writing a move of an earlier one raises ValueError. Give
+    engines that play at the same time a writer each.
+    """
+
+    def __init__(self, path: Union[Path, BinaryIO], buffer_size: int = 1 << 20):
+        if isinstance(path, (str, os.PathLike)):
+            self.file = open(path, "wb", buffering=buffer_size)
+            self.owns_file = True
+        else:
+            self.file = path
+            self.owns_file = False
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.games = 0
+        self.moves = 0
+        self.lock = threading.Lock()
+
+    def start_game(self, game_state: TableTopGameState, deck_state: DeckState) -> int:
+        """
+        Records a freshly dealt table: only the integrity cards of each player
+        and the deck are kept. Returns the game's index in the log, to pass to
+        write().
+        """
+        num_players = len(game_state.state)
+        cards = deck_state.equipment_cards
+        if len(cards) > MAX_DECK_CARDS:
+            raise ValueError(f"can't log more than {MAX_DECK_CARDS} equipment cards")
+
+        padding = (0,) * (RECORD_SIZE - 2 - CARDS_PER_PLAYER)
+        records = [RECORD.pack(GAME, num_players, 0, 0, 0, 0, 0, 0)]
+        for player in range(num_players):
+            records.append(
+                RECORD.pack(
+                    DEAL,
+                    player,
+                    *(
+                        INTEGRITY_CARD_CODES[card_state.card]
+                        for card_state in game_state.state[player].integrity_cards
+                    ),
+                    *padding,
+                )
+            )
+        deck = [EQUIPMENT_CODES[card] for card in cards]
+        deck += [0] * (MAX_DECK_CARDS - len(deck))
+        records.append(RECORD.pack(DECK, deck_state.guns, len(cards), *deck))
+
+        with self.lock:
+            self.file.write(b"".join(records))
+            self.games += 1
+            return self.games - 1
+
+    def write(self, operator: BaseOperator, game: Optional[int] = None):
+        """
+        Records a move of the game last started, which `game`, if given, must be.
+        """
+        cls = type(operator)
+        args = OPERATOR_ARGS[cls](operator)
+        if not isinstance(args, tuple):
+            args = (args,)
+        record = RECORD.pack(
+            OPERATOR_OPCODES[cls],
+            *args,
+            *(0,) * (RECORD_SIZE - 1 - len(args)),
+        )
+        with self.lock:
+            if game is not None and game != self.games - 1:
+                raise ValueError(
+                    f"can't log a move of game {game} after game {self.games - 1} "
+                    "has started: engines playing at once need a GameLogWriter each"
+                )
+            self.file.write(record)
+            self.moves += 1
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def decode_move(record: List[int]) -> BaseOperator:
+    opcode, *args = record
+    operator = OPERATORS[opcode]
+    return operator(*args[: len(OPERATOR_FIELDS[operator])])
+
+
+@dataclass
+class LoggedGame:
+    game_state: TableTopGameState
+    deck_state: DeckState
+    moves: np.ndarray  # (moves, RECORD_SIZE) move records, a view of the log
+
+    def operators(self) -> Iterator[BaseOperator]:
+        for record in self.moves.tolist():
+            yield decode_move(record)
+
+
+class GameLogReader:
+    """
+    Reads a log by mapping it into memory. `records` is a (records, RECORD_SIZE)
+    array over the mapped file, so nothing is read until it is used, and the
+    games are found by scanning the record kinds a chunk at a time. The arrays
+    the reader hands out are views of the mapping, which stays open until they
+    are all dropped.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 1 << 20):
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            size = f.seek(0, os.SEEK_END)
+        if len(header) < HEADER.size or HEADER.unpack(header)[0] != MAGIC:
+            raise ValueError(f"{path} is not a game log")
+        _, version = HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"unsupported game log version {version}")
+
+        # a partly written last record is ignored
+        count = (size - HEADER.size) // RECORD_SIZE
+        self.records = (
+            np.memmap(
+                path,
+                dtype=np.int8,
+                mode="r",
+                offset=HEADER.size,
+                shape=(count, RECORD_SIZE),
+            )
+            if count
+            else np.zeros((0, RECORD_SIZE), dtype=np.int8)
+        )
+        self.chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def game_offsets(self) -> Iterator[int]:
+        """
+        The index of the GAME record of each game.
+        """
+        for start in range(0, len(self.records), self.chunk_size):
+            kinds = self.records[start : start + self.chunk_size, 0]
+            for index in np.flatnonzero(kinds == GAME).tolist():
+                yield start + index
+
+    def game(self, start: int, stop: Optional[int] = None) -> LoggedGame:
+        """
+        Decodes the game whose GAME record is at `start` and ends before `stop`,
+        or at the next game.
+        """
+        records = self.records
+        if records[start, 0] != GAME:
+            raise ValueError(f"record {start} doesn't start a game")
+        num_players = int(records[start, 1])
+        first_move = start + num_players + 2
+
+        if stop is None:
+            stop = first_move
+            while stop < len(records) and records[stop, 0] != GAME:
+                stop += 1
+
+        table_top_state = {}
+        for record in records[start + 1 : start + 1 + num_players].tolist():
+            table_top_state[record[1]] = PlayerGameState(
+                integrity_cards=[
+                    PlayerIntegrityCardState(INTEGRITY_CARDS[code], face_up=False)
+                    for code in record[2 : 2 + CARDS_PER_PLAYER]
+                ],
+                gun=PlayerGunState(has_gun=False, aimed_at=None),
+                equipment=None,
+                health=PlayerHealthState.ALIVE,
+            )
+
+        _, guns, num_cards, *deck = records[first_move - 1].tolist()
+        return LoggedGame(
+            TableTopGameState(table_top_state),
+            DeckState([DECK_EQUIPMENT[code] for code in deck[:num_cards]], guns),
+            records[first_move:stop],
+        )
+
+    def games(self) -> Iterator[LoggedGame]:
+        previous = None
+        for offset in self.game_offsets():
+            if previous is not None:
+                yield self.game(previous, offset)
+            previous = offset
+        if previous is not None:
+            yield self.game(previous, len(self.records))
+
+    def operators(self) -> Iterator[BaseOperator]:
+        """
+        Every move in the log, across games.
+        """
+        for start in range(0, len(self.records), self.chunk_size):
+            for record in self.records[start : start + self.chunk_size].tolist():
+                if record[0] >= 0:
+                    yield decode_move(record)
+
+    def close(self):
+        self.records = None
+
+    def __enter__(self) -> "GameLogReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
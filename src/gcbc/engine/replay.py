@@ -0,0 +1,129 @@
+from typing import Any, List, Sequence, Tuple
+
+from gcbc.bot.wire import decode_state, encode_state
+from gcbc.core.core_data import DeckState, TableTopGameState
+from gcbc.engine.game_log import LoggedGame
+from gcbc.operators.base_operator import BaseOperator
+
+"""
+Replays a recorded game and seeks to any turn of it, e.g. to look at the table
+a bot saw thousands of moves into a long game.
+"""
+
+
+class ReplayEngine:
+    """
+    Replays a sequence of operators from a starting table. Operators are played
+    directly on the table, without validation or notifying any bots, since they
+    were already valid when they were recorded.
+
+    Every `checkpoint_interval` moves the table and deck are saved in their wire
+    encoding, the first time the replay passes that turn. Seeking restores the
+    nearest checkpoint at or before the turn and plays at most
+    `checkpoint_interval` moves from there; short seeks backwards undo moves
+    instead, and seeks forwards carry on from the current turn.
+
+    `turn` is the number of operators played. The table and deck returned by
+    seek() are the replay's own and change as it moves, so copy or snapshot them
+    to keep one.
+    """
+
+    def __init__(
+        self,
+        game_state: TableTopGameState,
+        deck_state: DeckState,
+        operators: Sequence[BaseOperator],
+        checkpoint_interval: int = 256,
+    ):
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1")
+        self.game_state = game_state
+        self.deck_state = deck_state
+        self.operators = operators
+        self.checkpoint_interval = checkpoint_interval
+
+        self.turn = 0
+        # the turn the table was last restored at, moves before it were played
+        # on an earlier copy of the table and can't be undone on this one
+        self.restored_at = 0
+        # the undo record of each operator played since
+        self.undo_records: List[Any] = []
+        self.checkpoints: List[bytes] = [encode_state(game_state, deck_state)]
+
+    @classmethod
+    def from_logged_game(
+        cls, game: LoggedGame, checkpoint_interval: int = 256
+    ) -> "ReplayEngine":
+        return cls(
+            game.game_state, game.deck_state, list(game.operators()), checkpoint_interval
+        )
+
+    def __len__(self) -> int:
+        return len(self.operators)
+
+    def step(self) -> BaseOperator:
+        """
+        Plays the next operator and returns it.
+        """
+        if self.turn >= len(self.operators):
+            raise IndexError("the replay is at the end of the game")
+
+        operator = self.operators[self.turn]
+        self.undo_records.append(operator.undo_record(self.game_state, self.deck_state))
+        self.game_state, self.deck_state = operator.play(
+            self.game_state, self.deck_state
+        )
+        self.turn += 1
+
+        if (
+            self.turn % self.checkpoint_interval == 0
+            and self.turn // self.checkpoint_interval == len(self.checkpoints)
+        ):
+            self.checkpoints.append(encode_state(self.game_state, self.deck_state))
+        return operator
+
+    def step_back(self) -> BaseOperator:
+        """
+        Undoes the last operator played and returns it.
+        """
+        if self.turn == 0:
+            raise IndexError("the replay is at the start of the game")
+        if self.turn == self.restored_at:
+            self.seek(self.turn - 1)
+            return self.operators[self.turn]
+
+        self.turn -= 1
+        operator = self.operators[self.turn]
+        self.game_state, self.deck_state = operator.undo(
+            self.game_state, self.deck_state, self.undo_records.pop()
+        )
+        return operator
+
+    def restore(self, checkpoint: int):
+        self.game_state, self.deck_state = decode_state(self.checkpoints[checkpoint])
+        self.turn = checkpoint * self.checkpoint_interval
+        self.restored_at = self.turn
+        self.undo_records.clear()
+
+    def seek(self, turn: int) -> Tuple[TableTopGameState, DeckState]:
+        """
+        Moves the replay to the table after `turn` operators.
+        """
+        if not 0 <= turn <= len(self.operators):
+            raise IndexError(f"turn must be in 0..{len(self.operators)}")
+
+        checkpoint = min(turn // self.checkpoint_interval, len(self.checkpoints) - 1)
+        checkpoint_turn = checkpoint * self.checkpoint_interval
+
+        if turn < self.turn:
+            if turn >= self.restored_at and self.turn - turn <= turn - checkpoint_turn:
+                while self.turn > turn:
+                    self.step_back()
+                return self.game_state, self.deck_state
+            self.restore(checkpoint)
+        elif self.turn < checkpoint_turn:
+            self.restore(checkpoint)
+
+        while self.turn < turn:
+            self.step()
+        return self.game_state, self.deck_state
@@ -0,0 +1,55 @@
+import random
+from typing import Iterator, Tuple, Union
+
+import numpy as np
+
+"""
+Reproducible random streams for dealing and playing games.
+
+Every stream is derived from a root seed and a key path with NumPy's
+SeedSequence, so streams with different keys are independent, and the stream of
+a key is the same no matter which process or machine asks for it. Keying games
+by their index means a game is dealt the same way however the games are split
+between workers.
+"""
+
+# anything with a shuffle() method, e.g. the random module itself
+Rng = Union[random.Random, np.random.Generator]
+
+
+class SeedStream:
+    def __init__(self, seed: int, path: Tuple[int, ...] = ()):
+        self.seed = seed
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"SeedStream({self.seed}, {self.path})"
+
+    def seed_sequence(self, *key: int) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.seed, spawn_key=self.path + key)
+
+    def child(self, *key: int) -> "SeedStream":
+        """
+        The stream for a sub-key, e.g. one per machine, that can be split further.
+        """
+        return SeedStream(self.seed, self.path + key)
+
+    def rng(self, *key: int) -> random.Random:
+        state = self.seed_sequence(*key).generate_state(4, np.uint64)
+        return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+    def generator(self, *key: int) -> np.random.Generator:
+        return np.random.default_rng(self.seed_sequence(*key))
+
+    def games(
+        self, num_games: int, worker: int = 0, num_workers: int = 1
+    ) -> Iterator[Tuple[int, random.Random]]:
+        """
+        The games worker `worker` of `num_workers` plays, as (game, rng) pairs.
+        Workers take every num_workers-th game, so together they play each of
+        the games exactly once, each with the same rng whatever the split.
+        """
+        if not 0 <= worker < num_workers:
+            raise ValueError(f"worker must be in 0..{num_workers - 1}")
+        for game in range(worker, num_games, num_workers):
+            yield game, self.rng(game)
@@ -1,8 +1,23 @@
 import random
+from array import array
 from re import I
-from typing import List
+from typing import Iterable, List, Optional, Sequence, Union, cast, overload
+
+import numpy as np
 
 from gcbc.core.core_data import *
+from gcbc.core.packed import (
+    AIMED_AT,
+    CARDS,
+    CARDS_PER_PLAYER,
+    FIELDS,
+    HEALTH,
+    INTEGRITY_CARD_CODES,
+    INTEGRITY_CARDS,
+    NO_TARGET,
+    PackedTableTopState,
+)
+from gcbc.engine.seeding import Rng
 
 
 class GCBCInitalizer:
@@ -28,9 +43,15 @@ class GCBCInitalizer:
         return deck
 
     @staticmethod
-    def build_game_state(num_players: int) -> TableTopGameState:
+    def build_game_state(
+        num_players: int, rng: Optional[Rng] = None
+    ) -> TableTopGameState:
+        """
+        Deals the integrity cards, shuffled with `rng`, or the global random
+        module if none is given.
+        """
         deck = GCBCInitalizer.integrity_cards(num_players)
-        random.shuffle(deck)
+        (rng if rng is not None else random).shuffle(deck)
 
         table_top_state = {}
 
@@ -50,7 +71,120 @@ class GCBCInitalizer:
         return TableTopGameState(table_top_state)
 
     @staticmethod
-    def build_deck(num_players: int) -> DeckState:
-        return DeckState(
-            equipment_cards=[x.value for x in EquipmentCard], guns=num_players // 2
+    def deal_many(
+        num_games: int,
+        num_players: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> "Deals":
+        """
+        Deals the integrity cards of `num_games` games at once, each shuffled
+        independently, with the same card counts as build_game_state.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        deck = np.asarray(
+            [
+                INTEGRITY_CARD_CODES[card]
+                for card in GCBCInitalizer.integrity_cards(num_players)
+            ],
+            dtype=np.int8,
+        )
+        # ordering each game's cards by uniform keys shuffles them all in one
+        # vectorized sort, which is quicker than permuting the rows
+        order = rng.random((num_games, len(deck))).argsort(axis=1)
+        dealt = deck[order]
+        return Deals(dealt.reshape(num_games, num_players, CARDS_PER_PLAYER))
+
+    @staticmethod
+    def equipment_cards() -> List[EquipmentCard]:
+        return [x for x in EquipmentCard if x != EquipmentCard.UNKNOWN]
+
+    @staticmethod
+    def build_deck(num_players: int, rng: Optional[Rng] = None) -> DeckState:
+        """
+        A full deck, with the equipment cards shuffled with `rng`, or the global
+        random module if none is given.
+        """
+        cards = GCBCInitalizer.equipment_cards()
+        (rng if rng is not None else random).shuffle(cards)
+        return DeckState(equipment_cards=cards, guns=num_players // 2)
+
+    @staticmethod
+    def reset_decks(
+        decks: Iterable[DeckState],
+        num_players: int,
+        rng: Optional[Rng] = None,
+    ):
+        """
+        Resets many decks in place to a full deck for the given number of players,
+        e.g. between the games of a tournament, instead of building new ones. Each
+        deck is shuffled separately with `rng`, or the global random module if
+        none is given.
+        """
+        cards = GCBCInitalizer.equipment_cards()
+        guns = num_players // 2
+        shuffle = (rng if rng is not None else random).shuffle
+        for deck in decks:
+            shuffle(cards)
+            deck.reset(cards, guns)
+
+
+class Deals(Sequence[TableTopGameState]):
+    """
+    Many starting tables, held as a (games, players, CARDS_PER_PLAYER) array of
+    the integrity card codes of gcbc.core.packed. A game is only built into a
+    TableTopGameState when it is indexed, so millions of deals cost one array.
+    Slicing gives the Deals of those games, sharing the array.
+    """
+
+    def __init__(self, cards: np.ndarray):
+        self.cards = cards
+        self.num_players = cards.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __repr__(self) -> str:
+        return f"Deals({len(self)} games, {self.num_players} players)"
+
+    @overload
+    def __getitem__(self, game: int) -> TableTopGameState:
+        ...
+
+    @overload
+    def __getitem__(self, game: slice) -> "Deals":
+        ...
+
+    def __getitem__(
+        self, game: Union[int, slice]
+    ) -> Union[TableTopGameState, "Deals"]:
+        if isinstance(game, slice):
+            return Deals(self.cards[game])
+        return TableTopGameState(
+            {
+                player: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(INTEGRITY_CARDS[code], face_up=False)
+                        for code in codes
+                    ],
+                    gun=PlayerGunState(has_gun=False, aimed_at=None),
+                    equipment=None,
+                    health=PlayerHealthState.ALIVE,
+                )
+                for player, codes in enumerate(self.cards[game].tolist())
+            }
+        )
+
+    def packed(self, game: int) -> PackedTableTopState:
+        """
+        The table of one game, packed without going through the dataclasses.
+        """
+        cards = self.cards[game].astype(np.int16)
+        packed = PackedTableTopState(self.num_players)
+        packed.data[CARDS :: FIELDS] = array(
+            "b", (cards[:, 0] | (cards[:, 1] << 2) | (cards[:, 2] << 4)).tolist()
+        )
+        packed.data[HEALTH :: FIELDS] = array(
+            "b", [cast(int, PlayerHealthState.ALIVE)] * self.num_players
         )
+        packed.data[AIMED_AT :: FIELDS] = array("b", [NO_TARGET] * self.num_players)
+        return packed
@@ -0,0 +1,221 @@
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.core.core_data import Player
+from gcbc.engine.engine import GCBCGameEngine, WinCondition, find_winners
+from gcbc.engine.seeding import SeedStream
+
+"""
+Runs many games between bots, sharded across worker processes.
+
+Bot factories are called with the seat a bot plays and, as `rng`, the
+random.Random the bot should draw from, or None for the global random module.
+They must be picklable (e.g. a module-level class or function) so they can be
+sent to the workers.
+"""
+
+BotFactory = Callable[..., BaseBot]
+Seating = Tuple[int, ...]  # the index of the bot factory sitting in each seat
+
+
+def rotation_schedule(num_bots: int, num_seats: Optional[int] = None) -> List[Seating]:
+    """
+    Every rotation of the bots around the table, so that each bot plays from
+    each seat equally often. Bots are repeated in order if there are more seats
+    than bots.
+    """
+    num_seats = num_seats or num_bots
+    return [
+        tuple((seat + shift) % num_bots for seat in range(num_seats))
+        for shift in range(num_bots)
+    ]
+
+
+@dataclass
+class GameResult:
+    seating: Seating
+    win_condition: Optional[WinCondition]  # None if the round limit was hit
+    winners: Tuple[Player, ...]
+    rounds: int
+
+
+def winning_players(
+    engine: GCBCGameEngine, win_condition: WinCondition
+) -> Tuple[Player, ...]:
+    return find_winners(
+        engine.game_state, engine.bot_manager.player_map, win_condition
+    )
+
+
+def play_game(
+    bot_factories: Sequence[BotFactory],
+    seating: Seating,
+    max_rounds: int,
+    rng: Optional[random.Random] = None,
+) -> GameResult:
+    """
+    Plays one game. Given `rng`, every bot is handed its own stream drawn from
+    it and the table is dealt from it, so the game only depends on `rng`.
+    """
+    bot_manager = BotManager(
+        {
+            seat: bot_factories[bot](
+                seat, rng=None if rng is None else random.Random(rng.getrandbits(64))
+            )
+            for seat, bot in enumerate(seating)
+        }
+    )
+    # the shards already run in parallel, so the pre-round asks the bots one
+    # after another
+    with GCBCGameEngine.new_game(bot_manager, rng, pre_round_workers=0) as engine:
+        win_condition = None
+        rounds = 0
+        while win_condition is None and rounds < max_rounds:
+            win_condition = engine.play_round()
+            rounds += 1
+
+    if win_condition is None:
+        return GameResult(seating, None, (), rounds)
+
+    return GameResult(
+        seating, win_condition, winning_players(engine, win_condition), rounds
+    )
+
+
+@dataclass
+class TournamentResults:
+    num_seats: int
+    num_bots: int
+    games: int = 0
+    win_conditions: Counter = field(default_factory=Counter)
+    seat_wins: List[int] = field(default_factory=list)
+    bot_wins: List[int] = field(default_factory=list)
+    bot_games: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.seat_wins = self.seat_wins or [0] * self.num_seats
+        self.bot_wins = self.bot_wins or [0] * self.num_bots
+        self.bot_games = self.bot_games or [0] * self.num_bots
+
+    def add(self, result: GameResult):
+        self.games += 1
+        self.win_conditions[result.win_condition] += 1
+        for bot in result.seating:
+            self.bot_games[bot] += 1
+        for seat in result.winners:
+            self.seat_wins[seat] += 1
+            self.bot_wins[result.seating[seat]] += 1
+
+    def merge(self, other: "TournamentResults"):
+        self.games += other.games
+        self.win_conditions.update(other.win_conditions)
+        for seat, wins in enumerate(other.seat_wins):
+            self.seat_wins[seat] += wins
+        for bot, wins in enumerate(other.bot_wins):
+            self.bot_wins[bot] += wins
+        for bot, games in enumerate(other.bot_games):
+            self.bot_games[bot] += games
+
+    def seat_win_rates(self) -> List[float]:
+        return [wins / self.games if self.games else 0.0 for wins in self.seat_wins]
+
+    def bot_win_rates(self) -> List[float]:
+        return [
+            wins / games if games else 0.0
+            for wins, games in zip(self.bot_wins, self.bot_games)
+        ]
+
+
+def play_shard(
+    bot_factories: Sequence[BotFactory],
+    schedule: Sequence[Seating],
+    games: range,
+    seed: int,
+    max_rounds: int,
+) -> TournamentResults:
+    """
+    Plays a contiguous range of the tournament's games. Each game is played from
+    its own stream of the tournament seed, which deals the table and seeds the
+    bots, so results do not depend on which worker runs it or how the games are
+    sharded, as long as the bots answer in the pre-round well within the
+    engine's pre_round_resolution.
+    """
+    stream = SeedStream(seed)
+
+    results = TournamentResults(len(schedule[0]), len(bot_factories))
+    for game in games:
+        results.add(
+            play_game(
+                bot_factories, schedule[game % len(schedule)], max_rounds, stream.rng(game)
+            )
+        )
+    return results
+
+
+class TournamentRunner:
+    def __init__(
+        self,
+        bot_factories: Sequence[BotFactory],
+        num_games: int,
+        schedule: Optional[Sequence[Seating]] = None,
+        workers: Optional[int] = None,
+        seed: int = 0,
+        max_rounds: int = 1000,
+        games_per_shard: Optional[int] = None,
+    ):
+        """
+        :param bot_factories: Creates each bot, given the seat it plays and its
+                              `rng`.
+        :param num_games: The number of games to play.
+        :param schedule: The seatings to cycle through, one per game. Defaults to
+                         rotating the bots through every seat.
+        :param workers: The number of worker processes, defaults to the CPU count.
+        :param seed: The seed every shard's random stream is derived from.
+        :param max_rounds: Games still running after this many rounds are drawn.
+        :param games_per_shard: The number of games a worker plays per task.
+        """
+        self.bot_factories = list(bot_factories)
+        self.num_games = num_games
+        self.schedule = list(schedule or rotation_schedule(len(self.bot_factories)))
+        self.workers = workers
+        self.seed = seed
+        self.max_rounds = max_rounds
+        self.games_per_shard = games_per_shard or max(1, min(100, num_games // 64))
+
+    def shards(self) -> List[range]:
+        return [
+            range(start, min(start + self.games_per_shard, self.num_games))
+            for start in range(0, self.num_games, self.games_per_shard)
+        ]
+
+    def stream(self) -> Iterator[TournamentResults]:
+        """
+        Yields the aggregated results so far each time a shard finishes.
+        """
+        totals = TournamentResults(len(self.schedule[0]), len(self.bot_factories))
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    play_shard,
+                    self.bot_factories,
+                    self.schedule,
+                    shard,
+                    self.seed,
+                    self.max_rounds,
+                )
+                for shard in self.shards()
+            ]
+            for future in as_completed(futures):
+                totals.merge(future.result())
+                yield totals
+
+    def run(self) -> TournamentResults:
+        totals = TournamentResults(len(self.schedule[0]), len(self.bot_factories))
+        for totals in self.stream():
+            pass
+        return totals
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from typing import Optional
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import (
-    ActionType,
     DeckState,
     Player,
     TableTopGameState,
 )
+from gcbc.core.events import AimEvent
 from gcbc.operators.base_operator import BaseAction
 
 
@@ -20,18 +21,23 @@ class Aim(BaseAction):
             and self.target in game.state
             and game.is_player_alive(self.actor)
             and game.is_player_alive(self.target)
+            and game.state[self.actor].gun is not None
             and game.state[self.actor].gun.has_gun
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        game.state[self.actor].gun.aimed_at = self.target
+        game.set_aimed_at(self.actor, self.target)
+        return game, deck
+
+    def undo_record(self, game: TableTopGameState, deck: DeckState) -> Optional[Player]:
+        # whoever the gun was aimed at before
+        return game.state[self.actor].gun.aimed_at
+
+    def undo(
+        self, game: TableTopGameState, deck: DeckState, record: Optional[Player]
+    ):
+        game.set_aimed_at(self.actor, record)
         return game, deck
 
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
-        notif_manager.emit_public_notification(
-            {
-                "action": ActionType.AIM,
-                "actor": self.actor,
-                "target": self.target,
-            }
-        )
+        notif_manager.emit_public_notification(AimEvent(self.actor, self.target))
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import (
-    ActionType,
     DeckState,
     Player,
     TableTopGameState,
 )
 from gcbc.core.core_data import Card
+from gcbc.core.events import ArmAndAimEvent
 from gcbc.operators.base_operator import BaseAction
 
 
@@ -28,6 +29,10 @@ class ArmAndAim(BaseAction):
         if deck.guns <= 0:
             return False
 
+        # a gun that was tasered away cannot be re-armed
+        if actor_state.gun is None:
+            return False
+
         integrity_cards = actor_state.integrity_cards
         if not (0 <= self.card_to_flip < len(integrity_cards)):
             return False
@@ -39,24 +44,44 @@ class ArmAndAim(BaseAction):
         return all_cards_face_up or card_face_down
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        actor_state = game.get_player_state(self.actor)
-
         if deck.get_gun():
-            actor_state.gun.has_gun = True
-            actor_state.gun.aimed_at = self.target
+            game.set_has_gun(self.actor, True)
+            game.set_aimed_at(self.actor, self.target)
 
             # Flip the card
-            card_to_flip_state = actor_state.integrity_cards[self.card_to_flip]
-            card_to_flip_state.face_up = True
+            game.set_face_up(self.actor, self.card_to_flip, True)
+
+        return game, deck
+
+    def undo_record(
+        self, game: TableTopGameState, deck: DeckState
+    ) -> Optional[Tuple[bool, Optional[Player], bool]]:
+        # the gun and the card before arming, or None if there is no gun to take
+        if deck.guns <= 0:
+            return None
+        actor_state = game.get_player_state(self.actor)
+        return (
+            actor_state.gun.has_gun,
+            actor_state.gun.aimed_at,
+            actor_state.integrity_cards[self.card_to_flip].face_up,
+        )
+
+    def undo(
+        self,
+        game: TableTopGameState,
+        deck: DeckState,
+        record: Optional[Tuple[bool, Optional[Player], bool]],
+    ):
+        if record is not None:
+            has_gun, aimed_at, face_up = record
+            game.set_face_up(self.actor, self.card_to_flip, face_up)
+            game.set_aimed_at(self.actor, aimed_at)
+            game.set_has_gun(self.actor, has_gun)
+            deck.return_gun()
 
         return game, deck
 
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
         notif_manager.emit_public_notification(
-            {
-                "action": ActionType.ARM_AND_AIM,
-                "actor": self.actor,
-                "target": self.target,
-                "card_to_flip": self.card_to_flip,
-            }
+            ArmAndAimEvent(self.actor, self.target, self.card_to_flip)
         )
@@ -1,13 +1,14 @@
-from copy import deepcopy
 from dataclasses import dataclass
+from typing import Optional, Tuple, cast
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import (
-    ActionType,
     Card,
     DeckState,
+    EquipmentCard,
     Player,
     TableTopGameState,
 )
+from gcbc.core.events import EquipEvent, PrivateEquipEvent
 from gcbc.operators.base_operator import BaseAction
 
 
@@ -42,39 +43,48 @@ class Equip(BaseAction):
         return all_cards_face_up or card_face_down
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        actor_state = game.state[self.actor]
-
         # Draw an equipment card
         equipment_card = deck.draw_equipment_card()
         if equipment_card:
-            actor_state.equipment = equipment_card
+            game.set_equipment(self.actor, equipment_card)
 
             # Flip the card
-            card_to_flip_state = actor_state.integrity_cards[self.card_to_flip]
-            card_to_flip_state.face_up = True
+            game.set_face_up(self.actor, self.card_to_flip, True)
+
+        return game, deck
+
+    def undo_record(
+        self, game: TableTopGameState, deck: DeckState
+    ) -> Optional[Tuple[EquipmentCard, bool]]:
+        # the card to be drawn and whether the card to flip was face-up, or None
+        # if there is no card to draw
+        if len(deck.equipment_cards) <= 0:
+            return None
+        face_up = game.state[self.actor].integrity_cards[self.card_to_flip].face_up
+        return deck.equipment_cards[-1], face_up
+
+    def undo(
+        self,
+        game: TableTopGameState,
+        deck: DeckState,
+        record: Optional[Tuple[EquipmentCard, bool]],
+    ):
+        if record is not None:
+            drawn, face_up = record
+            game.set_face_up(self.actor, self.card_to_flip, face_up)
+            game.set_equipment(self.actor, None)
+            deck.undraw_equipment_card(drawn)
 
         return game, deck
 
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
-        notif_manager.emit_public_notification(
-            {
-                "action": ActionType.EQUIP,
-                "actor": self.actor,
-                "card_to_flip": self.card_to_flip,
-            }
-        )
+        notif_manager.emit_public_notification(EquipEvent(self.actor, self.card_to_flip))
 
     def private_notify(
         self, game: TableTopGameState, notif_manager: BotManager
     ):
-        equipped_card = game.state[self.actor].equipment
+        # the card play() just drew
+        equipped_card = cast(EquipmentCard, game.state[self.actor].equipment)
         notif_manager.emit_private_notification(
-            self.actor,
-            {
-                "action": ActionType.EQUIP,
-                "private_data": {
-                    "actor": self.actor,
-                    "equipped_card": equipped_card,
-                },
-            },
+            self.actor, PrivateEquipEvent(self.actor, equipped_card)
         )
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import (
-    ActionType,
     Card,
     DeckState,
     Player,
     TableTopGameState,
 )
+from gcbc.core.events import InvestigateEvent, PrivateInvestigateEvent
 from gcbc.operators.base_operator import BaseAction
 
 
@@ -29,14 +29,12 @@ class Investigate(BaseAction):
         # The investigate action doesn't modify the game state
         return game, deck
 
+    def undo(self, game: TableTopGameState, deck: DeckState, record: None):
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
         notif_manager.emit_public_notification(
-            {
-                "action": ActionType.INVESTIGATE,
-                "actor": self.actor,
-                "target": self.target,
-                "target_card": self.target_card,
-            }
+            InvestigateEvent(self.actor, self.target, self.target_card)
         )
 
     def private_notify(
@@ -45,13 +43,7 @@ class Investigate(BaseAction):
         card_value = game.state[self.target].integrity_cards[self.target_card].card
         notif_manager.emit_private_notification(
             self.actor,
-            {
-                "action": ActionType.INVESTIGATE,
-                "private_data": {
-                    "actor": self.actor,
-                    "target": self.target,
-                    "target_card": self.target_card,
-                    "card_value": card_value,
-                },
-            }
+            PrivateInvestigateEvent(
+                self.actor, self.target, self.target_card, card_value
+            ),
         )
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from gcbc.core.core_data import (
-    ActionType,
     DeckState,
     Player,
     TableTopGameState,
 )
 from gcbc.bot.base_bot import BotManager
+from gcbc.core.events import PassEvent
 from gcbc.operators.base_operator import BaseAction
 
 
@@ -19,10 +19,8 @@ class Pass(BaseAction):
     def play(self, game: TableTopGameState, deck: DeckState):
         return game, deck
 
+    def undo(self, game: TableTopGameState, deck: DeckState, record: None):
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
-        notif_manager.emit_public_notification(
-            {
-                "action": ActionType.PASS,
-                "actor": self.actor,
-            }
-        )
+        notif_manager.emit_public_notification(PassEvent(self.actor))
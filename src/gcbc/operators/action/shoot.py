@@ -1,7 +1,5 @@
-from copy import deepcopy
 from dataclasses import dataclass
 from gcbc.core.core_data import (
-    ActionType,
     Card,
     DeckState,
     Player,
@@ -9,6 +7,7 @@ from gcbc.core.core_data import (
 )
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import IntegrityCard, PlayerHealthState
+from gcbc.core.events import ShootEvent
 from gcbc.operators.base_operator import BaseAction
 
 
@@ -22,6 +21,9 @@ class Shoot(BaseAction):
             return False
 
         actor_state = game.state[self.actor]
+        if actor_state.gun is None:
+            return False
+
         target = actor_state.gun.aimed_at
 
         return (
@@ -34,7 +36,6 @@ class Shoot(BaseAction):
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        actor_state = game.state[self.actor]
         target_state = game.state[self.target]
 
         # Check if the target has AGENT or KINGPIN card
@@ -46,24 +47,35 @@ class Shoot(BaseAction):
         # Update the health state of the target
         if has_special_card:
             if target_state.health == PlayerHealthState.ALIVE:
-                target_state.health = PlayerHealthState.WOUNDED
+                game.set_health(self.target, PlayerHealthState.WOUNDED)
             else:
-                target_state.health = PlayerHealthState.DEAD
+                game.set_health(self.target, PlayerHealthState.DEAD)
         else:
-            target_state.health = PlayerHealthState.DEAD
+            game.set_health(self.target, PlayerHealthState.DEAD)
 
         # Return the gun to the deck
-        actor_state.gun.has_gun = False
-        actor_state.gun.aimed_at = None
+        game.set_has_gun(self.actor, False)
+        game.set_aimed_at(self.actor, None)
         deck.return_gun()
 
         return game, deck
 
+    def undo_record(
+        self, game: TableTopGameState, deck: DeckState
+    ) -> PlayerHealthState:
+        return game.state[self.target].health
+
+    def undo(
+        self, game: TableTopGameState, deck: DeckState, record: PlayerHealthState
+    ):
+        # Shoot is only valid while aiming at the target, so that is the aim to
+        # restore
+        deck.get_gun()
+        game.set_aimed_at(self.actor, self.target)
+        game.set_has_gun(self.actor, True)
+        game.set_health(self.target, record)
+
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
-        notif_manager.emit_public_notification(
-            {
-                "action": ActionType.SHOOT,
-                "actor": self.actor,
-                "target": self.target,
-            }
-        )
+        notif_manager.emit_public_notification(ShootEvent(self.actor, self.target))
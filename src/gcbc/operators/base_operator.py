@@ -1,3 +1,5 @@
+from typing import Any
+
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import DeckState, TableTopGameState
 
@@ -15,15 +17,36 @@ class BaseOperator:
     ) -> tuple[TableTopGameState, DeckState]:
         """
         Performs the action on the given state, and returns the new state.
-        Does not mutate the given state.
+        Mutates the given state in place, through the TableTopGameState and
+        DeckState mutators so that the change can be journaled and rolled back.
         """
         pass
 
-    def notify(self, game: TableTopGameState, notif_manager: BotManager):
+    def undo_record(self, game: TableTopGameState, deck: DeckState) -> Any:
+        """
+        What undo() needs to revert a play of this operator, e.g. the health of
+        a player before they are shot. Called on the state about to be played on.
+        The record is kept by the caller, not the operator, so the same operator
+        can be played again before it is undone.
+        """
+        return None
+
+    def undo(
+        self, game: TableTopGameState, deck: DeckState, record: Any
+    ) -> tuple[TableTopGameState, DeckState]:
+        """
+        Reverts a play of this operator on the given state, given the
+        undo_record() taken before it, and returns the restored state. Operators
+        must be undone in the reverse order they were played.
+        """
+        raise NotImplementedError
+
+    def notify(self, game: TableTopGameState, notif_manager: BotManager) -> None:
         """
-        Emit a notification dict that includes any relevant metadata associated with
-        this action that can be used to notify other players. The dict will
-        only include information that is publicly available to all players.
+        Emit a Notification, one of the events of gcbc.core.events, that includes
+        any relevant metadata associated with this action that can be used to
+        notify other players. The event will only include information that is
+        publicly available to all players.
 
         examples include the acting player, the target player, any cards in
         the case of swaps, etc.
@@ -32,11 +55,12 @@ class BaseOperator:
 
     def private_notify(
         self, game: TableTopGameState, notif_manager: BotManager
-    ):
+    ) -> None:
         """
-        Emit a notification dict that includes any relevant metadata associated with
-        this action that can be used to notify other players. The dict will
-        only include information that is privately availalbe to a few players.
+        Emit a Notification, one of the private events of gcbc.core.events, that
+        includes any relevant metadata associated with this action that can be
+        used to notify other players. The event will only include information
+        that is privately available to a few players.
         """
         pass
 
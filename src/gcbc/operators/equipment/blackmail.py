@@ -7,6 +7,7 @@ from gcbc.core.core_data import (
     TableTopGameState,
 )
 from gcbc.core.core_data import EquipmentCard
+from gcbc.core.events import BlackmailEvent
 from gcbc.operators.base_operator import BaseEquipment
 
 
@@ -25,19 +26,23 @@ class Blackmail(BaseEquipment):
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        new_state = game.state
-        for integrity_card in new_state[self.target].integrity_cards:
-            integrity_card.card = integrity_card.card.flip()
+        target_cards = game.state[self.target].integrity_cards
+        for index, integrity_card in enumerate(target_cards):
+            game.set_card(self.target, index, integrity_card.card.flip())
 
         deck.return_equipment_card(EquipmentCard.BLACKMAIL)
-        new_state[self.user].equipment = None
+        game.set_equipment(self.user, None)
+        return game, deck
+
+    def undo(self, game: TableTopGameState, deck: DeckState, record: None):
+        # flipping is its own inverse
+        target_cards = game.state[self.target].integrity_cards
+        for index, integrity_card in enumerate(target_cards):
+            game.set_card(self.target, index, integrity_card.card.flip())
+
+        deck.unreturn_equipment_card()
+        game.set_equipment(self.user, EquipmentCard.BLACKMAIL)
         return game, deck
 
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
-        notif_manager.emit_public_notification(
-            {
-                "action": EquipmentCard.BLACKMAIL,
-                "actor": self.user,
-                "target": self.target,
-            }
-        )
+        notif_manager.emit_public_notification(BlackmailEvent(self.user, self.target))
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from dataclasses import dataclass
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import (
@@ -7,6 +6,7 @@ from gcbc.core.core_data import (
     TableTopGameState,
 )
 from gcbc.core.core_data import EquipmentCard, PlayerHealthState
+from gcbc.core.events import DefibrillatorEvent
 from gcbc.operators.base_operator import BaseEquipment
 
 
@@ -25,17 +25,25 @@ class Defibrillator(BaseEquipment):
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        new_state = game.state
-        new_state[self.target].health = PlayerHealthState.ALIVE
-        new_state[self.user].equipment = None
+        game.set_health(self.target, PlayerHealthState.ALIVE)
+        game.set_equipment(self.user, None)
         deck.return_equipment_card(EquipmentCard.DEFIBRILLATOR)
         return game, deck
 
+    def undo_record(
+        self, game: TableTopGameState, deck: DeckState
+    ) -> PlayerHealthState:
+        return game.get_player_health(self.target)
+
+    def undo(
+        self, game: TableTopGameState, deck: DeckState, record: PlayerHealthState
+    ):
+        deck.unreturn_equipment_card()
+        game.set_equipment(self.user, EquipmentCard.DEFIBRILLATOR)
+        game.set_health(self.target, record)
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
         notif_manager.emit_public_notification(
-            {
-                "action": EquipmentCard.DEFIBRILLATOR,
-                "actor": self.user,
-                "revived": self.target,
-            }
+            DefibrillatorEvent(self.user, self.target)
         )
@@ -7,6 +7,7 @@ from gcbc.core.core_data import (
     TableTopGameState,
 )
 from gcbc.core.core_data import EquipmentCard
+from gcbc.core.events import PolygraphEvent, PrivatePolygraphEvent
 from gcbc.operators.base_operator import BaseEquipment
 
 
@@ -25,34 +26,26 @@ class Polygraph(BaseEquipment):
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        new_state = game.state
-        new_state[self.user].equipment = None
+        game.set_equipment(self.user, None)
         deck.return_equipment_card(EquipmentCard.POLYGRAPH)
         return game, deck
 
+    def undo(self, game: TableTopGameState, deck: DeckState, record: None):
+        deck.unreturn_equipment_card()
+        game.set_equipment(self.user, EquipmentCard.POLYGRAPH)
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
-        notif_manager.emit_public_notification(
-            {
-                "action": EquipmentCard.POLYGRAPH,
-                "actor": self.user,
-                "target": self.target,
-            }
-        )
+        notif_manager.emit_public_notification(PolygraphEvent(self.user, self.target))
 
     def private_notify(
         self, game: TableTopGameState, notif_manager: BotManager
     ):
-        actor_cards = [card.card for card in game.state[self.user].integrity_cards]
-        target_cards = [card.card for card in game.state[self.target].integrity_cards]
-        payload = {
-            "action": EquipmentCard.POLYGRAPH,
-            "private_data": {
-                "actor": self.user,
-                "target": self.target,
-                "actor_cards": actor_cards,
-                "target_cards": target_cards,
-            },
-        }
+        actor_cards = tuple(card.card for card in game.state[self.user].integrity_cards)
+        target_cards = tuple(
+            card.card for card in game.state[self.target].integrity_cards
+        )
+        payload = PrivatePolygraphEvent(self.user, self.target, actor_cards, target_cards)
 
         notif_manager.emit_private_notification(self.user, payload)
         notif_manager.emit_private_notification(self.target, payload)
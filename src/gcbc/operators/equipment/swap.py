@@ -7,6 +7,7 @@ from gcbc.core.core_data import (
     TableTopGameState,
 )
 from gcbc.core.core_data import EquipmentCard
+from gcbc.core.events import SwapEvent, PrivateSwapEvent
 from gcbc.operators.base_operator import BaseEquipment
 
 
@@ -33,47 +34,38 @@ class Swap(BaseEquipment):
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        new_state = game.state
-
         # Swap the integrity cards
-        temp_card = new_state[self.playerA].integrity_cards[self.cardA]
-        new_state[self.playerA].integrity_cards[self.cardA] = new_state[
-            self.playerB
-        ].integrity_cards[self.cardB]
-        new_state[self.playerB].integrity_cards[self.cardB] = temp_card
+        game.swap_cards(self.playerA, self.cardA, self.playerB, self.cardB)
 
-        new_state[self.user].equipment = None
+        game.set_equipment(self.user, None)
         deck.return_equipment_card(EquipmentCard.SWAP)
         return game, deck
 
+    def undo(self, game: TableTopGameState, deck: DeckState, record: None):
+        # swapping is its own inverse
+        deck.unreturn_equipment_card()
+        game.set_equipment(self.user, EquipmentCard.SWAP)
+        game.swap_cards(self.playerA, self.cardA, self.playerB, self.cardB)
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
         notif_manager.emit_public_notification(
-            {
-                "action": EquipmentCard.SWAP,
-                "actor": self.user,
-                "playerA": self.playerA,
-                "cardA": self.cardA,
-                "playerB": self.playerB,
-                "cardB": self.cardB,
-            }
+            SwapEvent(self.user, self.playerA, self.cardA, self.playerB, self.cardB)
         )
 
     def private_notify(self, game: TableTopGameState, notif_manager: BotManager):
         original_cardA = game.state[self.playerA].integrity_cards[self.cardA].card
         original_cardB = game.state[self.playerB].integrity_cards[self.cardB].card
 
-        payload = {
-            "action": EquipmentCard.SWAP,
-            "private_data": {
-                "actor": self.user,
-                "playerA": self.playerA,
-                "cardA": self.cardA,
-                "cardAValue": original_cardA,
-                "playerB": self.playerB,
-                "cardB": self.cardB,
-                "cardBValue": original_cardB,
-            },
-        }
+        payload = PrivateSwapEvent(
+            self.user,
+            self.playerA,
+            self.cardA,
+            original_cardA,
+            self.playerB,
+            self.cardB,
+            original_cardB,
+        )
 
         notif_manager.emit_private_notification(self.playerA, payload)
         notif_manager.emit_private_notification(self.playerB, payload)
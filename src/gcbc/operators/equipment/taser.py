@@ -1,12 +1,14 @@
-from copy import deepcopy
 from dataclasses import dataclass
+from typing import Optional, Tuple
 from gcbc.bot.base_bot import BotManager
 from gcbc.core.core_data import (
     DeckState,
     Player,
+    PlayerGunState,
     TableTopGameState,
 )
 from gcbc.core.core_data import EquipmentCard
+from gcbc.core.events import TaserEvent
 from gcbc.operators.base_operator import BaseEquipment
 
 
@@ -31,20 +33,35 @@ class Taser(BaseEquipment):
         )
 
     def play(self, game: TableTopGameState, deck: DeckState):
-        new_state = game.state
-        new_state[self.user].gun = new_state[self.target].gun
-        new_state[self.target].gun = None
-        new_state[self.user].gun.aimed_at = self.aimed_at
-        new_state[self.user].equipment = None
+        stolen_gun = game.state[self.target].gun
+        game.set_gun(self.user, stolen_gun)
+        game.set_gun(self.target, None)
+        game.set_aimed_at(self.user, self.aimed_at)
+        game.set_equipment(self.user, None)
         deck.return_equipment_card(EquipmentCard.TASER)
         return game, deck
 
+    def undo_record(
+        self, game: TableTopGameState, deck: DeckState
+    ) -> Tuple[Optional[PlayerGunState], Optional[Player]]:
+        # the user's own gun, and who the stolen gun was aimed at
+        return game.state[self.user].gun, game.state[self.target].gun.aimed_at
+
+    def undo(
+        self,
+        game: TableTopGameState,
+        deck: DeckState,
+        record: Tuple[Optional[PlayerGunState], Optional[Player]],
+    ):
+        previous_gun, previous_aimed_at = record
+        deck.unreturn_equipment_card()
+        game.set_equipment(self.user, EquipmentCard.TASER)
+        game.set_aimed_at(self.user, previous_aimed_at)
+        game.set_gun(self.target, game.state[self.user].gun)
+        game.set_gun(self.user, previous_gun)
+        return game, deck
+
     def notify(self, game: TableTopGameState, notif_manager: BotManager):
         notif_manager.emit_public_notification(
-            {
-                "action": EquipmentCard.TASER,
-                "actor": self.user,
-                "stolen_from": self.target,
-                "aimed_at": self.aimed_at,
-            }
+            TaserEvent(self.user, self.target, self.aimed_at)
         )
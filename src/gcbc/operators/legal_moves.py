@@ -0,0 +1,182 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from gcbc.core.core_data import (
+    Card,
+    DeckState,
+    EquipmentCard,
+    Player,
+    TableTopGameState,
+    TurnPhase,
+)
+from gcbc.operators.action.aim import Aim
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.equip import Equip
+from gcbc.operators.action.investigate import Investigate
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.base_operator import BaseOperator
+from gcbc.operators.equipment.blackmail import Blackmail
+from gcbc.operators.equipment.defibrillator import Defibrillator
+from gcbc.operators.equipment.polygraph import Polygraph
+from gcbc.operators.equipment.swap import Swap
+from gcbc.operators.equipment.taser import Taser
+
+"""
+Enumerates the operators that are valid for a player in a given phase, without
+building and validating candidates one at a time. The facts the operators'
+is_valid checks rely on are computed once per table in TableFacts and shared by
+every candidate.
+"""
+
+
+@dataclass
+class TableFacts:
+    alive: List[Player]
+    dead: List[Player]
+    num_cards: Dict[Player, int]
+    flippable: Dict[Player, List[Card]]  # cards Equip and ArmAndAim may flip
+    gun_holders: List[Player]  # players whose gun has not been tasered away
+    armed: List[Player]  # players holding a gun, whether or not it is aimed
+
+    @staticmethod
+    def from_state(game_state: TableTopGameState) -> "TableFacts":
+        alive, dead = [], []
+        num_cards, flippable = {}, {}
+        gun_holders, armed = [], []
+
+        for player, player_state in game_state.state.items():
+            if game_state.is_player_alive(player):
+                alive.append(player)
+            else:
+                dead.append(player)
+
+            cards = player_state.integrity_cards
+            num_cards[player] = len(cards)
+            face_down = [index for index, card in enumerate(cards) if not card.face_up]
+            # a card has to be flipped face-up, unless they all are already
+            flippable[player] = face_down or list(range(len(cards)))
+
+            if player_state.gun is not None:
+                gun_holders.append(player)
+                if player_state.gun.has_gun:
+                    armed.append(player)
+
+        return TableFacts(alive, dead, num_cards, flippable, gun_holders, armed)
+
+
+def legal_actions(
+    game_state: TableTopGameState,
+    deck_state: DeckState,
+    player: Player,
+    facts: TableFacts,
+) -> List[BaseOperator]:
+    if player not in facts.alive:
+        return [Pass(player)]
+
+    moves: List[BaseOperator] = [
+        Investigate(player, target, card)
+        for target in facts.alive
+        for card in range(facts.num_cards[target])
+    ]
+
+    if (
+        len(deck_state.equipment_cards) > 0
+        and game_state.state[player].equipment is None
+    ):
+        moves.extend(Equip(player, card) for card in facts.flippable[player])
+
+    if deck_state.guns > 0 and player in facts.gun_holders:
+        moves.extend(
+            ArmAndAim(player, target, card)
+            for target in facts.alive
+            for card in facts.flippable[player]
+        )
+
+    if player in facts.armed:
+        aimed_at = game_state.state[player].gun.aimed_at
+        if aimed_at is not None and aimed_at in facts.alive:
+            moves.append(Shoot(player, aimed_at))
+
+    moves.append(Pass(player))
+    return moves
+
+
+def legal_aims(player: Player, facts: TableFacts) -> List[BaseOperator]:
+    if player not in facts.alive or player not in facts.armed:
+        return []
+
+    return [Aim(player, target) for target in facts.alive]
+
+
+def legal_equipment(
+    game_state: TableTopGameState, player: Player, facts: TableFacts
+) -> List[BaseOperator]:
+    equipment = game_state.state[player].equipment
+    if equipment is None or player not in facts.alive:
+        return []
+
+    match equipment:
+        case EquipmentCard.BLACKMAIL:
+            return [Blackmail(player, target) for target in facts.alive]
+        case EquipmentCard.POLYGRAPH:
+            return [Polygraph(player, target) for target in facts.alive]
+        case EquipmentCard.DEFIBRILLATOR:
+            return [Defibrillator(player, target) for target in facts.dead]
+        case EquipmentCard.TASER:
+            return [
+                Taser(player, target, aimed_at)
+                for target in facts.gun_holders
+                if target != player and target in facts.alive
+                for aimed_at in facts.alive
+                if aimed_at != player
+            ]
+        case EquipmentCard.SWAP:
+            # swapping (a, card_a) with (b, card_b) is the same move as swapping
+            # (b, card_b) with (a, card_a), so only the canonical ordering, the
+            # lower seat as playerA, is generated
+            return [
+                Swap(player, player_a, card_a, player_b, card_b)
+                for i, player_a in enumerate(facts.alive)
+                for player_b in facts.alive[i + 1 :]
+                for card_a in range(facts.num_cards[player_a])
+                for card_b in range(facts.num_cards[player_b])
+            ]
+
+    return []
+
+
+def legal_moves(
+    game_state: TableTopGameState,
+    deck_state: DeckState,
+    player: Player,
+    phase: TurnPhase,
+    facts: Optional[TableFacts] = None,
+) -> List[BaseOperator]:
+    """
+    Every operator the player can make in the given phase that is_valid accepts,
+    up to the order of a Swap's positions: a Swap and its mirror image are the
+    same move, and only the one with the lower seat as playerA is listed.
+    Callers matching moves made elsewhere against these should put their Swaps
+    in that order first.
+
+    :param game_state: The table, which may be the opaque view a bot is given.
+    :param deck_state: The deck, which may be the opaque view a bot is given.
+    :param player: The player to enumerate moves for.
+    :param phase: PRE_ROUND for the player's equipment card, ACTION for the moves on
+                  their turn (always including Pass), or AIM for re-aiming their gun.
+    :param facts: Facts about the table, computed from game_state if not given. Pass
+                  them in to share them when enumerating for several players.
+    :return: The legal operators, in a deterministic order.
+    """
+    facts = facts or TableFacts.from_state(game_state)
+
+    match phase:
+        case TurnPhase.PRE_ROUND:
+            return legal_equipment(game_state, player, facts)
+        case TurnPhase.ACTION:
+            return legal_actions(game_state, deck_state, player, facts)
+        case TurnPhase.AIM:
+            return legal_aims(player, facts)
+
+    return []
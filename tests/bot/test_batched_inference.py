@@ -0,0 +1,127 @@
+import asyncio
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from gcbc.bot.base_bot import BotManager
+from gcbc.bot.batched_inference import AsyncPolicyBot, InferenceBatcher, PolicyBot
+from gcbc.bot.observation import num_moves, observation_size
+from gcbc.core.core_data import TurnPhase
+from gcbc.engine.async_engine import AsyncGCBCGameEngine, play_many
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.legal_moves import legal_moves
+
+NUM_PLAYERS = 4
+
+
+class LinearModel:
+    """
+    Random linear scores, recording the size of every batch it is run on.
+    """
+
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        self.weights = rng.normal(
+            size=(observation_size(NUM_PLAYERS), num_moves(NUM_PLAYERS))
+        ).astype(np.float32)
+        self.batch_sizes = []
+
+    def __call__(self, observations):
+        self.batch_sizes.append(len(observations))
+        return observations @ self.weights
+
+
+def new_engine(engine_class, bot_class, batcher, seed, **kwargs):
+    random.seed(seed)
+    return engine_class(
+        GCBCInitalizer.build_game_state(NUM_PLAYERS),
+        GCBCInitalizer.build_deck(NUM_PLAYERS),
+        BotManager({player: bot_class(player, batcher) for player in range(NUM_PLAYERS)}),
+        **kwargs,
+    )
+
+
+class TestInferenceBatcher(unittest.TestCase):
+    def test_flushes_on_size_and_time(self):
+        model = LinearModel()
+        observation = np.ones(observation_size(NUM_PLAYERS), dtype=np.float32)
+
+        with InferenceBatcher(model, max_batch_size=4, max_wait=0.5) as batcher:
+            futures = [batcher.submit(observation) for _ in range(4)]
+            for future in futures:
+                np.testing.assert_allclose(
+                    future.result(timeout=0.4), observation @ model.weights, rtol=1e-5
+                )
+
+            # a lone observation waits out max_wait
+            batcher.submit(observation).result(timeout=2)
+
+        self.assertEqual(model.batch_sizes, [4, 1])
+        self.assertEqual((batcher.batches, batcher.observations), (2, 5))
+        with self.assertRaises(RuntimeError):
+            batcher.submit(observation)
+
+    def test_model_errors_reach_every_caller(self):
+        def model(observations):
+            raise ValueError("bad batch")
+
+        with InferenceBatcher(model, max_batch_size=2, max_wait=1) as batcher:
+            futures = [batcher.submit(np.zeros(3)) for _ in range(2)]
+            for future in futures:
+                with self.assertRaises(ValueError):
+                    future.result(timeout=2)
+
+    def test_games_on_threads_share_batches(self):
+        model = LinearModel()
+        with InferenceBatcher(model, max_batch_size=16, max_wait=0.01) as batcher:
+            engines = [
+                new_engine(GCBCGameEngine, PolicyBot, batcher, seed, pre_round_workers=0)
+                for seed in range(16)
+            ]
+
+            def play(engine):
+                for _ in range(10):
+                    if engine.play_round() is not None:
+                        break
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(play, engines))
+
+        self.assertGreater(batcher.observations, 16 * 10)
+        self.assertGreater(max(model.batch_sizes), 1)
+        self.assertLess(batcher.batches, batcher.observations / 2)
+
+    def test_games_on_the_loop_share_batches(self):
+        model = LinearModel()
+        with InferenceBatcher(model, max_batch_size=16, max_wait=0.01) as batcher:
+            engines = [
+                new_engine(AsyncGCBCGameEngine, AsyncPolicyBot, batcher, seed)
+                for seed in range(16)
+            ]
+
+            results = asyncio.run(play_many(engines, max_rounds=10))
+
+        self.assertEqual(len(results), 16)
+        self.assertLess(batcher.batches, batcher.observations / 4)
+
+    def test_ties_are_broken_with_the_bot_rng(self):
+        game_state = GCBCInitalizer.build_game_state(NUM_PLAYERS)
+        deck_state = GCBCInitalizer.build_deck(NUM_PLAYERS)
+        moves = legal_moves(game_state, deck_state, 0, TurnPhase.ACTION)
+        scores = np.zeros(num_moves(NUM_PLAYERS))
+
+        def choices(seed):
+            bot = PolicyBot(0, None, rng=random.Random(seed))
+            return [bot._choose(moves, scores, NUM_PLAYERS) for _ in range(20)]
+
+        state = random.getstate()
+        self.assertEqual(choices(1), choices(1))
+        self.assertGreater(len(set(map(repr, choices(1)))), 1)
+        self.assertEqual(random.getstate(), state)
+
+
+if __name__ == "__main__":
+    unittest.main()
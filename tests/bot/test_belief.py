@@ -0,0 +1,160 @@
+import unittest
+from collections import Counter, defaultdict
+from itertools import permutations
+
+from gcbc.bot.base_bot import BotManager
+from gcbc.bot.belief import BeliefState
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import IntegrityCard, PlayerHealthState, RoleType
+from gcbc.core.events import BlackmailEvent, ShootEvent, SwapEvent
+from gcbc.core.packed import INTEGRITY_CARDS
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.seeding import SeedStream
+from gcbc.engine.state_init import GCBCInitalizer
+
+
+class BelievingBot(RandomBot):
+    receives_events = True
+
+    def __init__(self, player, num_players, rng):
+        super().__init__(player, aim_probability=0.1, rng=rng)
+        self.belief = BeliefState(player, num_players)
+
+    def on_public_notification(self, notification):
+        self.belief.on_public_notification(notification)
+
+    def on_private_notification(self, notification):
+        self.belief.on_private_notification(notification)
+
+
+class TestBeliefState(unittest.TestCase):
+    def test_counts_follow_a_game(self):
+        stream = SeedStream(2)
+        bots = {
+            player: BelievingBot(player, 8, stream.rng(player)) for player in range(8)
+        }
+        engine = GCBCGameEngine.new_game(
+            BotManager(bots), stream.rng(100), pre_round_workers=0
+        )
+        dealt = Counter(GCBCInitalizer.integrity_cards(8))
+
+        for round in range(160):
+            if engine.play_round() is not None:
+                break
+
+            game_state = engine.game_state
+            opaque = game_state.opaque_state()
+            for bot in bots.values():
+                belief = bot.belief
+                belief.observe_table(opaque)
+
+                seen = Counter()
+                for (player, index), card in belief.cards.items():
+                    card_state = game_state.state[player].integrity_cards[index]
+                    self.assertEqual(card_state.card, card)
+                    seen[card.flip() if (player, index) in belief.flipped else card] += 1
+                for player, player_state in game_state.state.items():
+                    for index, card_state in enumerate(player_state.integrity_cards):
+                        if card_state.face_up:
+                            self.assertIn((player, index), belief.cards)
+
+                self.assertEqual(
+                    belief.unseen,
+                    [dealt[card] - seen[card] for card in INTEGRITY_CARDS],
+                )
+                self.assertEqual(belief.num_unseen, 24 - len(belief.cards))
+
+                posterior = belief.posterior(opaque)
+                for player in game_state.state:
+                    self.assertAlmostEqual(
+                        belief.kingpin_probability(player), posterior.kingpin[player]
+                    )
+                    self.assertAlmostEqual(
+                        belief.agent_probability(player), posterior.agent[player]
+                    )
+                    probabilities = belief.team_probabilities(player)
+                    self.assertAlmostEqual(
+                        probabilities[RoleType.GOOD], posterior.good[player]
+                    )
+                    self.assertAlmostEqual(probabilities[RoleType.BAD], posterior.bad[player])
+
+        self.assertGreater(round, 100)
+
+    def test_matches_enumeration(self):
+        belief = BeliefState(0, 4)
+        belief.learn((0, 0), IntegrityCard.GOOD_COP)
+        belief.learn((0, 1), IntegrityCard.BAD_COP)
+        belief.learn((0, 2), IntegrityCard.GOOD_COP)
+        belief.learn((2, 1), IntegrityCard.BAD_COP)
+        belief.on_public_notification(BlackmailEvent(actor=0, target=1))
+        belief.on_public_notification(
+            SwapEvent(actor=0, playerA=1, cardA=2, playerB=2, cardB=1)
+        )
+        game_state = GCBCInitalizer.build_game_state(4)
+        game_state.set_health(3, PlayerHealthState.DEAD)
+        belief.on_public_notification(ShootEvent(actor=0, target=3))
+        belief.observe_table(game_state.opaque_state())
+
+        # every arrangement of the unseen cards over the unseen positions in
+        # which the game goes on
+        hidden = [
+            (player, index)
+            for player in range(4)
+            for index in range(3)
+            if (player, index) not in belief.cards
+        ]
+        codes = Counter(GCBCInitalizer.integrity_cards(4))
+        for (player, index), card in belief.cards.items():
+            codes[card.flip() if (player, index) in belief.flipped else card] -= 1
+
+        kingpin = Counter()
+        agent = Counter()
+        teams = defaultdict(Counter)
+        cards = Counter()
+        total = 0
+        for arrangement in set(permutations(codes.elements())):
+            table = dict(belief.cards)
+            for position, card in zip(hidden, arrangement):
+                table[position] = card.flip() if position in belief.flipped else card
+            hands = [[table[(player, index)] for index in range(3)] for player in range(4)]
+            # player 3 is dead
+            if IntegrityCard.KINGPIN in hands[3] or IntegrityCard.AGENT in hands[3]:
+                continue
+            if any(
+                IntegrityCard.KINGPIN in hand and IntegrityCard.AGENT in hand
+                for hand in hands
+            ):
+                continue
+            total += 1
+            for player, hand in enumerate(hands):
+                kingpin[player] += IntegrityCard.KINGPIN in hand
+                agent[player] += IntegrityCard.AGENT in hand
+                if IntegrityCard.KINGPIN in hand:
+                    team = RoleType.BAD
+                elif IntegrityCard.AGENT in hand:
+                    team = RoleType.GOOD
+                else:
+                    good = hand.count(IntegrityCard.GOOD_COP)
+                    team = RoleType.GOOD if good >= 2 else RoleType.BAD
+                teams[player][team] += 1
+            cards[table[(1, 0)]] += 1
+
+        posterior = belief.posterior(game_state.opaque_state())
+        for player in range(4):
+            self.assertAlmostEqual(
+                belief.kingpin_probability(player), kingpin[player] / total
+            )
+            self.assertAlmostEqual(belief.agent_probability(player), agent[player] / total)
+            probabilities = belief.team_probabilities(player)
+            for team in RoleType:
+                self.assertAlmostEqual(
+                    probabilities.get(team, 0.0), teams[player][team] / total
+                )
+            self.assertAlmostEqual(probabilities[RoleType.BAD], posterior.bad[player])
+        self.assertEqual(belief.kingpin_probability(3), 0.0)
+        for card, probability in belief.card_probabilities(1, 0).items():
+            self.assertAlmostEqual(probability, cards[card] / total)
+
+
+if __name__ == "__main__":
+    unittest.main()
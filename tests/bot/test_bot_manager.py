@@ -0,0 +1,117 @@
+import unittest
+from unittest.mock import Mock
+
+from gcbc.bot.base_bot import AsyncBaseBot, BaseBot, BotManager
+from gcbc.core.core_data import ActionType, IntegrityCard
+from gcbc.core.events import PassEvent, PrivateSwapEvent, SwapEvent
+
+
+class RecordingBot(BaseBot):
+    def __init__(self):
+        self.public = []
+        self.private = []
+
+    def on_public_notification(self, notification):
+        self.public.append(notification)
+
+    def on_private_notification(self, notification):
+        self.private.append(notification)
+
+
+class SwapBot(RecordingBot):
+    receives_events = True
+    subscriptions = {SwapEvent, PrivateSwapEvent}
+
+
+class TestBotManager(unittest.TestCase):
+    def setUp(self):
+        self.recording_bot = RecordingBot()
+        self.swap_bot = SwapBot()
+        self.mock_bot = Mock(BaseBot)
+        self.bot_manager = BotManager(
+            {
+                0: self.recording_bot,
+                1: self.swap_bot,
+                2: BaseBot(),
+                3: AsyncBaseBot(),
+                4: self.mock_bot,
+            }
+        )
+        self.swap = SwapEvent(1, 0, 0, 1, 1)
+        self.private_swap = PrivateSwapEvent(
+            1, 0, 0, IntegrityCard.AGENT, 1, 1, IntegrityCard.KINGPIN
+        )
+
+    def test_only_subscribed_bots_are_notified(self):
+        self.bot_manager.emit_public_notification(PassEvent(0))
+        self.bot_manager.emit_public_notification(self.swap)
+
+        self.assertEqual(
+            self.recording_bot.public,
+            [{"action": ActionType.PASS, "actor": 0}, self.swap.as_dict()],
+        )
+        self.assertEqual(self.swap_bot.public, [self.swap])
+        self.assertEqual(self.mock_bot.on_public_notification.call_count, 2)
+
+        # bots that do not override the handler are left out
+        self.assertEqual(len(self.bot_manager.public_subscribers(PassEvent)), 2)
+        self.assertEqual(len(self.bot_manager.public_subscribers(SwapEvent)), 3)
+
+    def test_private_notifications(self):
+        for player in range(5):
+            self.bot_manager.emit_private_notification(player, self.private_swap)
+        self.bot_manager.emit_private_notification(1, PassEvent(1))
+
+        self.assertEqual(self.recording_bot.private, [self.private_swap.as_dict()])
+        self.assertEqual(self.swap_bot.private, [self.private_swap])
+        self.mock_bot.on_private_notification.assert_called_once_with(
+            self.private_swap.as_dict()
+        )
+        self.assertEqual(self.bot_manager.private_subscribers(2, PrivateSwapEvent), [])
+
+    def test_dicts_go_to_every_handler(self):
+        self.bot_manager.emit_public_notification({"action": ActionType.PASS, "actor": 0})
+
+        self.assertEqual(len(self.recording_bot.public), 1)
+        self.assertEqual(len(self.swap_bot.public), 1)
+
+    def test_seat(self):
+        self.bot_manager.emit_public_notification(PassEvent(0))
+        new_bot = RecordingBot()
+        self.bot_manager.seat(2, new_bot)
+        self.bot_manager.emit_public_notification(PassEvent(0))
+
+        self.assertEqual(len(new_bot.public), 1)
+        with self.assertRaises(TypeError):
+            self.bot_manager.player_map[2] = BaseBot()
+
+    def test_new_player_map(self):
+        self.bot_manager.emit_public_notification(PassEvent(0))
+        new_bot = RecordingBot()
+        self.bot_manager.player_map = {0: new_bot}
+        self.bot_manager.emit_public_notification(PassEvent(0))
+
+        self.assertEqual(len(new_bot.public), 1)
+        self.assertEqual(len(self.recording_bot.public), 1)
+
+    def test_refresh(self):
+        self.bot_manager.emit_public_notification(PassEvent(0))
+        received = []
+        self.bot_manager.get_bot(2).on_public_notification = received.append
+        self.bot_manager.refresh()
+        self.bot_manager.emit_public_notification(PassEvent(0))
+
+        self.assertEqual(len(received), 1)
+
+    def test_handlers_assigned_to_a_bot(self):
+        bot = BaseBot()
+        received = []
+        bot.on_public_notification = received.append
+        bot_manager = BotManager({0: bot})
+        bot_manager.emit_public_notification(PassEvent(0))
+
+        self.assertEqual(received, [{"action": ActionType.PASS, "actor": 0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
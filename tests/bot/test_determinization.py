@@ -0,0 +1,151 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from gcbc.bot.base_bot import BotManager
+from gcbc.bot.determinization import DeterminizationSampler, Knowledge
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import EquipmentCard, IntegrityCard, PlayerHealthState
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.seeding import SeedStream
+from gcbc.engine.state_init import GCBCInitalizer
+
+
+class KnowingBot(RandomBot):
+    receives_events = True
+
+    def __init__(self, player, rng):
+        super().__init__(player, aim_probability=0.1, rng=rng)
+        self.knowledge = Knowledge(player)
+
+    def on_public_notification(self, notification):
+        self.knowledge.on_public_notification(notification)
+
+    def on_private_notification(self, notification):
+        self.knowledge.on_private_notification(notification)
+
+
+class TestDeterminizationSampler(unittest.TestCase):
+    def assert_consistent(self, world, game_state, deck_state, knowledge):
+        world_state, world_deck = world
+        dealt = Counter()
+        for player, player_state in game_state.state.items():
+            world_player = world_state.state[player]
+            self.assertEqual(world_player.health, player_state.health)
+            self.assertEqual(world_player.gun, player_state.gun)
+            self.assertEqual(
+                world_player.equipment is None, player_state.equipment is None
+            )
+            if player == knowledge.player:
+                self.assertEqual(world_player.equipment, player_state.equipment)
+
+            cards = [card.card for card in world_player.integrity_cards]
+            for index, card_state in enumerate(player_state.integrity_cards):
+                card = cards[index]
+                if card_state.face_up or (player, index) in knowledge.cards:
+                    self.assertEqual(card, card_state.card)
+                dealt[card.flip() if (player, index) in knowledge.flipped else card] += 1
+
+            if player_state.health == PlayerHealthState.DEAD:
+                self.assertNotIn(IntegrityCard.KINGPIN, cards)
+                self.assertNotIn(IntegrityCard.AGENT, cards)
+            self.assertFalse(
+                IntegrityCard.KINGPIN in cards and IntegrityCard.AGENT in cards
+            )
+
+        self.assertEqual(
+            dealt, Counter(GCBCInitalizer.integrity_cards(len(game_state.state)))
+        )
+        self.assertEqual(len(world_deck.equipment_cards), len(deck_state.equipment_cards))
+        held = [
+            player_state.equipment
+            for player_state in world_state.state.values()
+            if player_state.equipment is not None
+        ]
+        self.assertCountEqual(
+            held + list(world_deck.equipment_cards), GCBCInitalizer.equipment_cards()
+        )
+
+    def test_worlds_are_consistent_through_a_game(self):
+        stream = SeedStream(2)
+        bots = {player: KnowingBot(player, stream.rng(player)) for player in range(8)}
+        engine = GCBCGameEngine.new_game(
+            BotManager(bots), stream.rng(100), pre_round_workers=0
+        )
+        rng = np.random.default_rng(0)
+
+        for round in range(160):
+            if engine.play_round() is not None:
+                break
+            if round % 20:
+                continue
+
+            game_state, deck_state = engine.game_state, engine.deck_state
+            for player, bot in bots.items():
+                knowledge = bot.knowledge
+                # what the bot learned is still true
+                for (other, index), card in knowledge.cards.items():
+                    self.assertEqual(
+                        game_state.state[other].integrity_cards[index].card, card
+                    )
+
+                sampler = DeterminizationSampler(
+                    game_state.opaque_state(), deck_state.opaque_state(), knowledge
+                )
+                for world in sampler.sample_many(10, rng):
+                    self.assert_consistent(world, game_state, deck_state, knowledge)
+
+        self.assertGreater(round, 100)
+
+    def test_uniform_over_unknown_positions(self):
+        game_state = GCBCInitalizer.build_game_state(4)
+        deck_state = GCBCInitalizer.build_deck(4)
+        for index, card in enumerate(
+            (IntegrityCard.GOOD_COP, IntegrityCard.GOOD_COP, IntegrityCard.BAD_COP)
+        ):
+            game_state.set_card(0, index, card)
+            game_state.set_face_up(0, index, True)
+        game_state.set_health(3, PlayerHealthState.DEAD)
+
+        sampler = DeterminizationSampler(
+            game_state.opaque_state(), deck_state.opaque_state()
+        )
+        worlds = sampler.sample_many(6000, np.random.default_rng(1))
+        kingpin = np.argwhere(worlds.cards == 0)
+        agent = np.argwhere(worlds.cards == 1)
+        self.assertEqual(len(kingpin), 6000)
+        self.assertEqual(len(agent), 6000)
+
+        # the kingpin is equally likely in each position of players 1 and 2, and
+        # the agent is then with the other one
+        positions = Counter(map(tuple, kingpin[:, 1:].tolist()))
+        self.assertEqual({player for player, _ in positions}, {1, 2})
+        for count in positions.values():
+            self.assertAlmostEqual(count / 6000, 1 / 6, delta=0.02)
+        self.assertTrue((kingpin[:, 1] + agent[:, 1] == 3).all())
+
+        # the cops left over are shared out evenly
+        self.assertAlmostEqual(
+            (worlds.cards[:, 3] == 2).mean(), 3 / 7, delta=0.02
+        )
+
+    def test_rejects_impossible_knowledge(self):
+        game_state = GCBCInitalizer.build_game_state(4)
+        deck_state = GCBCInitalizer.build_deck(4)
+        knowledge = Knowledge(0)
+        knowledge.cards[(1, 0)] = IntegrityCard.KINGPIN
+        knowledge.cards[(2, 0)] = IntegrityCard.KINGPIN
+        with self.assertRaises(ValueError):
+            DeterminizationSampler(
+                game_state.opaque_state(), deck_state.opaque_state(), knowledge
+            )
+
+        # every equipment card is in the deck, so no one can hold one
+        game_state.set_equipment(1, EquipmentCard.TASER)
+        with self.assertRaises(ValueError):
+            DeterminizationSampler(game_state.opaque_state(), deck_state)
+
+
+if __name__ == "__main__":
+    unittest.main()
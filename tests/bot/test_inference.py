@@ -0,0 +1,156 @@
+import unittest
+from collections import Counter
+from itertools import permutations
+
+import numpy as np
+
+from gcbc.bot.base_bot import BotManager
+from gcbc.bot.belief import BeliefState
+from gcbc.bot.determinization import DeterminizationSampler, Knowledge
+from gcbc.bot.inference import infer
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import IntegrityCard, PlayerHealthState, RoleType
+from gcbc.core.events import BlackmailEvent, SwapEvent
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.seeding import SeedStream
+from gcbc.engine.state_init import GCBCInitalizer
+
+
+class BelievingBot(RandomBot):
+    receives_events = True
+
+    def __init__(self, player, num_players, rng):
+        super().__init__(player, aim_probability=0.1, rng=rng)
+        self.belief = BeliefState(player, num_players)
+
+    def on_public_notification(self, notification):
+        self.belief.on_public_notification(notification)
+
+    def on_private_notification(self, notification):
+        self.belief.on_private_notification(notification)
+
+
+class TestInfer(unittest.TestCase):
+    def test_matches_enumeration(self):
+        game_state = GCBCInitalizer.build_game_state(4)
+        game_state.set_card(0, 0, IntegrityCard.GOOD_COP)
+        game_state.set_face_up(0, 0, True)
+        game_state.set_health(3, PlayerHealthState.DEAD)
+        opaque = game_state.opaque_state()
+
+        knowledge = Knowledge(1)
+        knowledge.cards[(1, 0)] = IntegrityCard.BAD_COP
+        knowledge.cards[(1, 1)] = IntegrityCard.GOOD_COP
+        knowledge.cards[(1, 2)] = IntegrityCard.BAD_COP
+        knowledge.on_public_notification(BlackmailEvent(actor=1, target=2))
+        knowledge.on_public_notification(
+            SwapEvent(actor=1, playerA=2, cardA=0, playerB=3, cardB=1)
+        )
+
+        # every arrangement of the unseen dealt cards in which the game goes on
+        table = dict(knowledge.cards)
+        table[(0, 0)] = IntegrityCard.GOOD_COP
+        hidden = [
+            (player, index)
+            for player in range(4)
+            for index in range(3)
+            if (player, index) not in table
+        ]
+        dealt = Counter(GCBCInitalizer.integrity_cards(4))
+        for position, card in table.items():
+            dealt[card.flip() if position in knowledge.flipped else card] -= 1
+
+        counts = {card: Counter() for card in ("kingpin", "agent", "good")}
+        total = 0
+        for arrangement in set(permutations(dealt.elements())):
+            world = dict(table)
+            for position, card in zip(hidden, arrangement):
+                world[position] = card.flip() if position in knowledge.flipped else card
+            hands = [[world[(player, index)] for index in range(3)] for player in range(4)]
+            # player 3 is dead
+            if IntegrityCard.KINGPIN in hands[3] or IntegrityCard.AGENT in hands[3]:
+                continue
+            if any(
+                IntegrityCard.KINGPIN in hand and IntegrityCard.AGENT in hand
+                for hand in hands
+            ):
+                continue
+            total += 1
+            for player, hand in enumerate(hands):
+                counts["kingpin"][player] += IntegrityCard.KINGPIN in hand
+                counts["agent"][player] += IntegrityCard.AGENT in hand
+                counts["good"][player] += (
+                    IntegrityCard.AGENT in hand
+                    or IntegrityCard.KINGPIN not in hand
+                    and hand.count(IntegrityCard.GOOD_COP) >= 2
+                )
+
+        posterior = infer(opaque, knowledge)
+        for player in range(4):
+            self.assertAlmostEqual(
+                posterior.kingpin[player], counts["kingpin"][player] / total
+            )
+            self.assertAlmostEqual(posterior.agent[player], counts["agent"][player] / total)
+            self.assertAlmostEqual(posterior.good[player], counts["good"][player] / total)
+            self.assertAlmostEqual(posterior.good[player] + posterior.bad[player], 1.0)
+        self.assertEqual(posterior.kingpin[3], 0.0)
+        self.assertEqual(
+            posterior.team_probabilities(1)[RoleType.BAD], posterior.bad[1]
+        )
+
+    def test_agrees_with_the_sampler_through_a_game(self):
+        stream = SeedStream(3)
+        bots = {
+            player: BelievingBot(player, 8, stream.rng(player)) for player in range(8)
+        }
+        engine = GCBCGameEngine.new_game(
+            BotManager(bots), stream.rng(100), pre_round_workers=0
+        )
+        rng = np.random.default_rng(0)
+
+        for round in range(120):
+            if engine.play_round() is not None:
+                break
+            if round % 30:
+                continue
+
+            game_state = engine.game_state.opaque_state()
+            for player in (0, 5):
+                belief = bots[player].belief
+                belief.observe_table(game_state)
+                posterior = belief.posterior(game_state)
+
+                worlds = DeterminizationSampler(
+                    game_state, engine.deck_state.opaque_state(), belief
+                ).sample_many(4000, rng)
+                kingpin = (worlds.cards == 0).any(axis=2).mean(axis=0)
+                good = np.array(
+                    [
+                        [world.get_player_team(seat) == RoleType.GOOD for seat in range(8)]
+                        for world, _ in worlds[:1000]
+                    ]
+                ).mean(axis=0)
+                np.testing.assert_allclose(posterior.kingpin, kingpin, atol=0.04)
+                np.testing.assert_allclose(posterior.good, good, atol=0.08)
+
+        self.assertGreater(round, 90)
+
+    def test_rejects_impossible_tables(self):
+        game_state = GCBCInitalizer.build_game_state(4)
+        knowledge = Knowledge(0)
+        knowledge.cards[(1, 0)] = IntegrityCard.AGENT
+        knowledge.cards[(2, 0)] = IntegrityCard.AGENT
+        with self.assertRaises(ValueError):
+            infer(game_state.opaque_state(), knowledge)
+
+        # the kingpin can only be with the agent
+        knowledge = Knowledge(0)
+        knowledge.cards[(1, 0)] = IntegrityCard.AGENT
+        for player in (0, 2, 3):
+            game_state.set_health(player, PlayerHealthState.DEAD)
+        with self.assertRaises(ValueError):
+            infer(game_state.opaque_state(), knowledge)
+
+
+if __name__ == "__main__":
+    unittest.main()
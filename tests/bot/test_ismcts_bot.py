@@ -0,0 +1,151 @@
+import random
+import time
+import unittest
+
+import numpy as np
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.bot.determinization import DeterminizationSampler
+from gcbc.bot.ismcts_bot import ISMCTSBot, key_move, move_key, notification_key
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import IntegrityCard, PlayerHealthState, TurnPhase
+from gcbc.core.events import ShootEvent, SwapEvent
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.seeding import SeedStream
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.equipment.swap import Swap
+
+
+class TestISMCTSBot(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.game_state = GCBCInitalizer.build_game_state(4)
+        self.deck_state = GCBCInitalizer.build_deck(4)
+
+    def finishing_shot(self):
+        """
+        Player 0 holds the agent face-up and aims at player 2, who holds the
+        kingpin face-up and is already wounded.
+        """
+        cards = {
+            0: (IntegrityCard.AGENT, IntegrityCard.GOOD_COP, IntegrityCard.GOOD_COP),
+            1: (IntegrityCard.GOOD_COP, IntegrityCard.GOOD_COP, IntegrityCard.BAD_COP),
+            2: (IntegrityCard.KINGPIN, IntegrityCard.BAD_COP, IntegrityCard.BAD_COP),
+            3: (IntegrityCard.GOOD_COP, IntegrityCard.BAD_COP, IntegrityCard.BAD_COP),
+        }
+        for player, hand in cards.items():
+            for index, card in enumerate(hand):
+                self.game_state.set_card(player, index, card)
+        self.game_state.set_face_up(0, 0, True)
+        self.game_state.set_face_up(2, 0, True)
+        self.game_state.set_health(2, PlayerHealthState.WOUNDED)
+        ArmAndAim(0, 2, 1).play(self.game_state, self.deck_state)
+
+    def test_move_keys(self):
+        move = Swap(0, 1, 2, 3, 0)
+        self.assertEqual(key_move(move_key(move)), move)
+        self.assertIsNone(key_move(move_key(None)))
+        self.assertEqual(notification_key(SwapEvent(0, 1, 2, 3, 0)), move_key(move))
+        # a swap's mirror image is the move legal_moves lists
+        self.assertEqual(notification_key(SwapEvent(0, 3, 0, 1, 2)), move_key(move))
+        self.assertEqual(move_key(Swap(0, 3, 0, 1, 2)), move_key(move))
+        self.assertEqual(
+            notification_key(ShootEvent(0, 2).as_dict()), move_key(Shoot(0, 2))
+        )
+
+    def test_takes_the_winning_shot(self):
+        self.finishing_shot()
+        bot = ISMCTSBot(0, simulations=300, rng=random.Random(0))
+        move = bot.action(self.game_state.opaque_state(), self.deck_state.opaque_state())
+        self.assertEqual(move, Shoot(0, 2))
+
+        # the tree follows the shot, and the game is over beneath it
+        bot.on_public_notification(ShootEvent(0, 2))
+        self.assertEqual(len(bot.trees), 1)
+        self.assertGreater(bot.trees[0].visits, 0)
+        self.assertEqual(bot.trees[0].children, {})
+
+    def test_samples_hidden_cards_in_the_pre_round(self):
+        bot = ISMCTSBot(1, simulations=10, rng=random.Random(0))
+        # the engine hands pre_round() the whole table
+        snapshot = self.game_state.snapshot(), self.deck_state.snapshot()
+        bot.pre_round(*snapshot)
+
+        game_state, deck_state = bot.view(*snapshot)
+        worlds = DeterminizationSampler(
+            game_state, deck_state, bot.knowledge
+        ).sample_many(50, np.random.default_rng(0))
+        own = [card.card for card in self.game_state.state[1].integrity_cards]
+        hands = {tuple(cards.ravel()) for cards in worlds.cards[:, [0, 2, 3]]}
+        self.assertGreater(len(hands), 1)
+        for world, _ in worlds:
+            self.assertEqual(
+                [card.card for card in world.state[1].integrity_cards], own
+            )
+
+    def test_reuses_its_tree(self):
+        bot = ISMCTSBot(0, simulations=200, rng=random.Random(0))
+        engine = GCBCGameEngine(
+            self.game_state,
+            self.deck_state,
+            BotManager({0: bot, 1: BaseBot(), 2: BaseBot(), 3: BaseBot()}),
+            pre_round_workers=0,
+        )
+        view = (self.game_state.opaque_state(), self.deck_state.opaque_state())
+        bot.action(*view)
+        (root,) = bot.trees
+        self.assertEqual(root.turn, (0, TurnPhase.ACTION))
+
+        # a search from the same turn carries on growing the tree
+        move = bot.action(*view)
+        self.assertEqual(bot.trees, [root])
+        self.assertEqual(sum(child.visits for child in root.children.values()), 400)
+
+        # and the tree follows the move once it is enacted
+        child = root.descend(move_key(move))
+        self.assertGreater(child.visits, 0)
+        self.assertTrue(engine.enact(move))
+        self.assertEqual(bot.trees, [child])
+
+    def test_budgets(self):
+        bot = ISMCTSBot(0, simulations=None, time_budget=0.1, rng=random.Random(0))
+        start = time.perf_counter()
+        bot.action(self.game_state.opaque_state(), self.deck_state.opaque_state())
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertGreater(bot.trees[0].visits, 0)
+
+        with self.assertRaises(ValueError):
+            ISMCTSBot(0, simulations=None)
+
+    def test_root_parallel(self):
+        self.finishing_shot()
+        bot = ISMCTSBot(0, simulations=400, workers=2, rng=random.Random(0))
+        try:
+            move = bot.action(
+                self.game_state.opaque_state(), self.deck_state.opaque_state()
+            )
+        finally:
+            bot.close()
+        self.assertEqual(move, Shoot(0, 2))
+        self.assertEqual(len(bot.trees), 2)
+        for tree in bot.trees:
+            self.assertEqual(tree.visits, 200)
+
+    def test_plays_a_game(self):
+        stream = SeedStream(5)
+        bots = {0: ISMCTSBot(0, simulations=30, rng=stream.rng(0))}
+        for player in range(1, 5):
+            bots[player] = RandomBot(player, rng=stream.rng(player))
+        engine = GCBCGameEngine.new_game(
+            BotManager(bots), stream.rng(100), pre_round_workers=0
+        )
+        rounds = 0
+        while engine.play_round() is None and rounds < 40:
+            rounds += 1
+        self.assertGreater(rounds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from gcbc.bot.observation import (
+    AIM_FEATURES,
+    CARD_ONE_HOT,
+    EQUIPMENT_ONE_HOT,
+    GUN_FEATURES,
+    encode_observation,
+    move_index,
+    num_moves,
+    observation_size,
+    seat_size,
+)
+from gcbc.core.core_data import (
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGunState,
+    TurnPhase,
+)
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.legal_moves import legal_moves
+
+
+class TestObservation(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.num_players = 5
+        self.game_state = GCBCInitalizer.build_game_state(self.num_players)
+        self.deck_state = GCBCInitalizer.build_deck(self.num_players)
+        self.size = seat_size(self.num_players)
+
+    def card(self, observation, seat, index):
+        offset = seat * self.size + index * len(CARD_ONE_HOT)
+        one_hot = observation[offset : offset + len(CARD_ONE_HOT)]
+        self.assertEqual(one_hot.sum(), 1)
+        return list(CARD_ONE_HOT)[one_hot.argmax()]
+
+    def test_encode_observation(self):
+        self.game_state.set_face_up(4, 2, True)
+        self.game_state.set_gun(4, PlayerGunState(has_gun=True, aimed_at=1))
+        self.game_state.set_equipment(3, EquipmentCard.SWAP)
+        self.game_state.set_equipment(2, EquipmentCard.TASER)
+
+        observation = encode_observation(self.game_state, self.deck_state, 3)
+        self.assertEqual(observation.shape, (observation_size(self.num_players),))
+
+        # player 3 sees their own hand and equipment, seat 1 is player 4
+        for index in range(3):
+            self.assertEqual(
+                self.card(observation, 0, index),
+                self.game_state.state[3].integrity_cards[index].card,
+            )
+        equipment = AIM_FEATURES + self.num_players
+        self.assertEqual(observation[equipment + EQUIPMENT_ONE_HOT[EquipmentCard.SWAP]], 1)
+        self.assertEqual(self.card(observation, 1, 0), IntegrityCard.UNKNOWN)
+        self.assertEqual(
+            self.card(observation, 1, 2), self.game_state.state[4].integrity_cards[2].card
+        )
+        self.assertEqual(observation[self.size + GUN_FEATURES], 1)
+        self.assertEqual(observation[self.size + AIM_FEATURES + 3], 1)  # player 1
+        self.assertEqual(
+            observation[4 * self.size + equipment + EQUIPMENT_ONE_HOT[EquipmentCard.UNKNOWN]], 1
+        )
+        self.assertEqual(observation[-2], self.deck_state.guns)
+        self.assertEqual(observation[-1], len(self.deck_state.equipment_cards))
+
+        # an opaque state hides the player's own hand too
+        opaque = encode_observation(
+            self.game_state.opaque_state(), self.deck_state.opaque_state(), 3
+        )
+        self.assertEqual(self.card(opaque, 0, 0), IntegrityCard.UNKNOWN)
+        self.assertTrue((opaque[self.size :] == observation[self.size :]).all())
+
+    def test_move_index(self):
+        self.game_state.set_equipment(0, EquipmentCard.POLYGRAPH)
+        moves = [
+            move
+            for phase in TurnPhase
+            for move in legal_moves(self.game_state, self.deck_state, 0, phase)
+        ]
+        indexes = {move_index(move, 0, self.num_players) for move in moves}
+
+        # polygraph, investigate or arm and aim at any of the 5 players, or pass
+        self.assertEqual(len(indexes), 16)
+        self.assertTrue(all(0 <= index < num_moves(self.num_players) - 1 for index in indexes))
+        self.assertEqual(move_index(None, 0, self.num_players), num_moves(self.num_players) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
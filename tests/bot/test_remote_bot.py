@@ -0,0 +1,174 @@
+import multiprocessing
+import os
+import random
+import threading
+import time
+import unittest
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.bot.random_bot import RandomBot
+from gcbc.bot.remote_bot import (
+    CLOSE,
+    PRE_ROUND,
+    PUBLIC_NOTIFICATION,
+    SEAT,
+    SEQUENCE_BYTES,
+    BotSupervisor,
+    bot_worker,
+)
+from gcbc.bot.wire import decode_operator, encode_notification, encode_state
+from gcbc.core.events import PassEvent
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.action.pass_action import Pass
+
+
+class PidBot(BaseBot):
+    """
+    Passes, and reports the notifications it has seen and the worker it runs in
+    through the actor of its pass.
+    """
+
+    def __init__(self, player):
+        self.player = player
+        self.notifications = 0
+
+    def action(self, game_state, deck_state):
+        return Pass(os.getpid() % 100)
+
+    def pre_round(self, game_state, deck_state):
+        return Pass(self.notifications)
+
+    def on_public_notification(self, notification):
+        self.notifications += 1
+
+
+class CrashingBot(BaseBot):
+    def __init__(self, player):
+        pass
+
+    def action(self, game_state, deck_state):
+        os._exit(1)
+
+    def aim(self, game_state, deck_state):
+        time.sleep(10)
+
+
+class SlowFirstBot(BaseBot):
+    """
+    Takes a while over its first move only, and numbers its moves.
+    """
+
+    def __init__(self, player):
+        self.moves = 0
+
+    def pre_round(self, game_state, deck_state):
+        self.moves += 1
+        if self.moves == 1:
+            time.sleep(0.5)
+        return Pass(self.moves)
+
+    action = pre_round
+
+
+class TestRemoteBot(unittest.TestCase):
+    def setUp(self):
+        random.seed(4)
+        self.game_state = GCBCInitalizer.build_game_state(4)
+        self.deck_state = GCBCInitalizer.build_deck(4)
+
+    def test_plays_a_game(self):
+        with BotSupervisor(RandomBot, workers=4) as supervisor:
+            bots = {player: supervisor.acquire(player) for player in range(4)}
+            engine = GCBCGameEngine(
+                self.game_state, self.deck_state, BotManager(bots), pre_round_workers=4
+            )
+
+            win_condition = None
+            rounds = 0
+            while win_condition is None and rounds < 300:
+                win_condition = engine.play_round()
+                rounds += 1
+            engine.close()
+
+            self.assertEqual(win_condition, engine.win_condition())
+            self.assertEqual(supervisor.restarts, 0)
+
+    def test_workers_are_pooled(self):
+        with BotSupervisor(PidBot, workers=1) as supervisor:
+            bot = supervisor.acquire(0)
+            pid = bot.action(self.game_state, self.deck_state).actor
+            self.assertNotEqual(pid, os.getpid() % 100)
+
+            bot.on_public_notification({"actor": 1})
+            self.assertEqual(bot.pre_round(self.game_state, self.deck_state), Pass(1))
+            supervisor.release(bot)
+
+            # the same worker plays the next seat, with a new bot
+            bot = supervisor.acquire(1)
+            self.assertEqual(bot.action(self.game_state, self.deck_state).actor, pid)
+            self.assertEqual(bot.pre_round(self.game_state, self.deck_state), Pass(0))
+
+    def test_restarts_workers(self):
+        with BotSupervisor(CrashingBot, timeout=0.5) as supervisor:
+            bot = supervisor.acquire(0)
+            worker = bot.worker
+
+            self.assertIsNone(bot.action(self.game_state, self.deck_state))
+            self.assertEqual(supervisor.restarts, 1)
+            self.assertIsNot(bot.worker, worker)
+
+            start_time = time.perf_counter()
+            self.assertIsNone(bot.aim(self.game_state, self.deck_state))
+            self.assertLess(time.perf_counter() - start_time, 2)
+            self.assertEqual(supervisor.restarts, 2)
+            self.assertTrue(bot.worker.is_alive())
+
+    def test_late_replies_are_dropped(self):
+        with BotSupervisor(SlowFirstBot) as supervisor:
+            bot = supervisor.acquire(0)
+
+            # the engine gives up on the first request, which is still waited on
+            # by its thread when the next request is sent
+            answers = []
+            thread = threading.Thread(
+                target=lambda: answers.append(
+                    bot.pre_round(self.game_state, self.deck_state)
+                )
+            )
+            thread.start()
+            time.sleep(0.1)
+
+            self.assertEqual(bot.action(self.game_state, self.deck_state), Pass(2))
+            thread.join()
+            self.assertEqual(answers, [None])
+            self.assertEqual(supervisor.restarts, 0)
+
+    def test_worker_waits_to_be_seated(self):
+        conn, worker_conn = multiprocessing.Pipe()
+        thread = threading.Thread(target=bot_worker, args=(worker_conn, PidBot))
+        thread.start()
+
+        notification = bytes([PUBLIC_NOTIFICATION]) + encode_notification(PassEvent(0))
+        pre_round = (
+            bytes([PRE_ROUND])
+            + (1).to_bytes(SEQUENCE_BYTES, "little")
+            + encode_state(self.game_state, self.deck_state)
+        )
+
+        # before a bot is seated, notifications are dropped and moves skipped
+        conn.send_bytes(notification)
+        conn.send_bytes(pre_round)
+        self.assertIsNone(decode_operator(conn.recv_bytes()[SEQUENCE_BYTES:]))
+
+        conn.send_bytes(bytes([SEAT, 0]))
+        conn.send_bytes(notification)
+        conn.send_bytes(pre_round)
+        self.assertEqual(decode_operator(conn.recv_bytes()[SEQUENCE_BYTES:]), Pass(1))
+
+        conn.send_bytes(bytes([CLOSE]))
+        thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import pickle
+import random
+import unittest
+
+from gcbc.bot.wire import (
+    decode_notification,
+    decode_operator,
+    decode_state,
+    encode_notification,
+    encode_operator,
+    encode_state,
+)
+from gcbc.core.core_data import (
+    ActionType,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGunState,
+    TurnPhase,
+)
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.legal_moves import legal_moves
+
+
+class TestWire(unittest.TestCase):
+    def setUp(self):
+        random.seed(2)
+        self.game_state = GCBCInitalizer.build_game_state(6)
+        self.deck_state = GCBCInitalizer.build_deck(6)
+        self.game_state.set_face_up(1, 0, True)
+        self.game_state.set_equipment(2, EquipmentCard.TASER)
+        self.game_state.set_gun(3, None)
+
+    def test_state_round_trip(self):
+        self.assertEqual(
+            decode_state(encode_state(self.game_state, self.deck_state)),
+            (self.game_state, self.deck_state),
+        )
+        self.assertEqual(
+            decode_state(
+                encode_state(self.game_state.snapshot(), self.deck_state.snapshot())
+            ),
+            (self.game_state, self.deck_state),
+        )
+
+        opaque = (self.game_state.opaque_state(), self.deck_state.opaque_state())
+        self.assertEqual(decode_state(encode_state(*opaque)), opaque)
+        self.assertLess(
+            len(encode_state(self.game_state, self.deck_state)),
+            len(pickle.dumps((self.game_state, self.deck_state))) / 10,
+        )
+
+    def test_operator_round_trip(self):
+        self.game_state.set_equipment(0, EquipmentCard.SWAP)
+        self.game_state.set_gun(4, PlayerGunState(has_gun=True, aimed_at=0))
+        moves = [
+            move
+            for phase in TurnPhase
+            for player in range(6)
+            for move in legal_moves(self.game_state, self.deck_state, player, phase)
+        ]
+
+        self.assertEqual(
+            {type(move).__name__ for move in moves},
+            {"Investigate", "Equip", "ArmAndAim", "Aim", "Shoot", "Pass", "Taser", "Swap"},
+        )
+        for move in moves:
+            self.assertEqual(repr(decode_operator(encode_operator(move))), repr(move))
+        self.assertIsNone(decode_operator(encode_operator(None)))
+
+    def test_notification_round_trip(self):
+        notifications = [
+            {"action": ActionType.PASS, "actor": 3},
+            {
+                "action": EquipmentCard.POLYGRAPH,
+                "private_data": {
+                    "actor": 0,
+                    "target": 5,
+                    "actor_cards": [IntegrityCard.KINGPIN, IntegrityCard.GOOD_COP],
+                    "target_cards": [IntegrityCard.BAD_COP],
+                },
+            },
+            {"name": "ünïcode", "big": -(2**40), "flag": True, "missing": None},
+        ]
+
+        for notification in notifications:
+            self.assertEqual(
+                decode_notification(encode_notification(notification)), notification
+            )
+        with self.assertRaises(TypeError):
+            encode_notification({"state": self.game_state})
+
+
+if __name__ == "__main__":
+    unittest.main()
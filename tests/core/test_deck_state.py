@@ -0,0 +1,67 @@
+import random
+import unittest
+from collections import deque
+
+from gcbc.core.core_data import DeckState, EquipmentCard
+from gcbc.engine.state_init import GCBCInitalizer
+
+
+class TestDeckState(unittest.TestCase):
+    def setUp(self):
+        self.deck_state = DeckState(
+            equipment_cards=[EquipmentCard.TASER, EquipmentCard.POLYGRAPH], guns=2
+        )
+
+    def test_backed_by_deque(self):
+        self.assertIsInstance(self.deck_state.equipment_cards, deque)
+        self.assertEqual(
+            self.deck_state,
+            DeckState(
+                equipment_cards=deque([EquipmentCard.TASER, EquipmentCard.POLYGRAPH]),
+                guns=2,
+            ),
+        )
+
+    def test_draw_and_return(self):
+        self.assertEqual(self.deck_state.draw_equipment_card(), EquipmentCard.POLYGRAPH)
+
+        self.deck_state.return_equipment_card(EquipmentCard.SWAP)
+        self.assertEqual(
+            list(self.deck_state.equipment_cards),
+            [EquipmentCard.SWAP, EquipmentCard.TASER],
+        )
+        self.assertEqual(self.deck_state.unreturn_equipment_card(), EquipmentCard.SWAP)
+
+        self.deck_state.undraw_equipment_card(EquipmentCard.POLYGRAPH)
+        self.assertEqual(
+            list(self.deck_state.equipment_cards),
+            [EquipmentCard.TASER, EquipmentCard.POLYGRAPH],
+        )
+
+        self.assertEqual(self.deck_state.draw_equipment_card(), EquipmentCard.POLYGRAPH)
+        self.assertEqual(self.deck_state.draw_equipment_card(), EquipmentCard.TASER)
+        self.assertIsNone(self.deck_state.draw_equipment_card())
+
+    def test_reset(self):
+        cards = self.deck_state.equipment_cards
+        self.deck_state.reset([EquipmentCard.SWAP], guns=1)
+
+        self.assertIs(self.deck_state.equipment_cards, cards)
+        self.assertEqual(self.deck_state, DeckState([EquipmentCard.SWAP], guns=1))
+
+    def test_reset_decks(self):
+        decks = [GCBCInitalizer.build_deck(4) for _ in range(20)]
+        for deck in decks:
+            deck.draw_equipment_card()
+            deck.get_gun()
+
+        GCBCInitalizer.reset_decks(decks, 6, random.Random(3))
+
+        for deck in decks:
+            self.assertEqual(deck.guns, 3)
+            self.assertCountEqual(deck.equipment_cards, GCBCInitalizer.equipment_cards())
+        self.assertGreater(len({tuple(deck.equipment_cards) for deck in decks}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
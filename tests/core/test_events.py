@@ -0,0 +1,90 @@
+import unittest
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.core.core_data import ActionType, EquipmentCard, IntegrityCard
+from gcbc.core.events import PassEvent, PrivatePolygraphEvent, SwapEvent
+
+
+class EventBot(BaseBot):
+    receives_events = True
+
+    def __init__(self):
+        self.notifications = []
+
+    def on_public_notification(self, notification):
+        self.notifications.append(notification)
+
+    def on_private_notification(self, notification):
+        self.notifications.append(notification)
+
+
+class DictBot(EventBot):
+    receives_events = False
+
+
+class TestEvents(unittest.TestCase):
+    def test_as_dict(self):
+        self.assertEqual(
+            SwapEvent(0, 1, 2, 3, 0).as_dict(),
+            {
+                "action": EquipmentCard.SWAP,
+                "actor": 0,
+                "playerA": 1,
+                "cardA": 2,
+                "playerB": 3,
+                "cardB": 0,
+            },
+        )
+        self.assertEqual(
+            PrivatePolygraphEvent(
+                0, 1, (IntegrityCard.AGENT,), (IntegrityCard.KINGPIN,)
+            ).as_dict(),
+            {
+                "action": EquipmentCard.POLYGRAPH,
+                "private_data": {
+                    "actor": 0,
+                    "target": 1,
+                    "actor_cards": [IntegrityCard.AGENT],
+                    "target_cards": [IntegrityCard.KINGPIN],
+                },
+            },
+        )
+
+    def test_frozen_and_slotted(self):
+        event = PassEvent(2)
+
+        self.assertFalse(hasattr(event, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            event.actor = 3
+        self.assertEqual(event, PassEvent(2))
+        self.assertEqual(event, {"action": ActionType.PASS, "actor": 2})
+        self.assertNotEqual(event, PassEvent(3))
+        self.assertEqual(len({event, PassEvent(2)}), 1)
+
+    def test_fan_out(self):
+        event_bots = [EventBot(), EventBot()]
+        dict_bots = [DictBot(), DictBot()]
+        mock_bot = Mock(BaseBot)
+        bot_manager = BotManager(
+            dict(enumerate(event_bots + dict_bots + [mock_bot]))
+        )
+
+        event = PassEvent(0)
+        bot_manager.emit_public_notification(event)
+        bot_manager.emit_private_notification(0, event)
+        bot_manager.emit_private_notification(2, event)
+
+        # event bots share the event, the rest share one dict built from it
+        self.assertIs(event_bots[0].notifications[0], event)
+        self.assertIs(event_bots[1].notifications[0], event)
+        self.assertIs(event_bots[0].notifications[1], event)
+        self.assertEqual(dict_bots[0].notifications[0], event.as_dict())
+        self.assertIs(dict_bots[0].notifications[0], dict_bots[1].notifications[0])
+        self.assertIsInstance(dict_bots[0].notifications[1], dict)
+        self.assertIsInstance(mock_bot.on_public_notification.call_args.args[0], dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
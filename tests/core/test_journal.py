@@ -0,0 +1,106 @@
+import unittest
+from copy import deepcopy
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+from gcbc.core.journal import ChangeJournal
+
+
+class TestChangeJournal(unittest.TestCase):
+    def setUp(self):
+        self.player_1 = 0
+        self.player_2 = 1
+
+        self.game_state = TableTopGameState(
+            state={
+                self.player_1: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.AGENT, face_up=True),
+                    ],
+                    gun=PlayerGunState(has_gun=True, aimed_at=self.player_2),
+                    equipment=EquipmentCard.TASER,
+                    health=PlayerHealthState.ALIVE,
+                ),
+                self.player_2: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.KINGPIN, face_up=False),
+                    ],
+                    gun=PlayerGunState(has_gun=False, aimed_at=None),
+                    equipment=None,
+                    health=PlayerHealthState.ALIVE,
+                ),
+            }
+        )
+
+        self.deck_state = DeckState(
+            equipment_cards=[EquipmentCard.SWAP, EquipmentCard.DEFIBRILLATOR],
+            guns=1,
+        )
+
+        self.journal = ChangeJournal()
+
+    def mutate_everything(self):
+        self.game_state.set_health(self.player_2, PlayerHealthState.DEAD)
+        self.game_state.set_equipment(self.player_1, None)
+        self.game_state.set_aimed_at(self.player_1, None)
+        self.game_state.set_has_gun(self.player_1, False)
+        self.game_state.set_card(self.player_2, 0, IntegrityCard.BAD_COP)
+        self.game_state.set_face_up(self.player_1, 0, True)
+        self.game_state.swap_cards(self.player_1, 1, self.player_2, 2)
+        self.game_state.set_gun(self.player_2, self.game_state.state[self.player_1].gun)
+        self.game_state.set_gun(self.player_1, None)
+        self.deck_state.get_gun()
+        self.deck_state.return_gun()
+        self.deck_state.draw_equipment_card()
+        self.deck_state.return_equipment_card(EquipmentCard.TASER)
+
+    def test_rollback_restores_state(self):
+        original_game_state = deepcopy(self.game_state)
+        original_deck_state = deepcopy(self.deck_state)
+
+        with self.assertRaises(RuntimeError):
+            with self.journal.transaction(self.game_state, self.deck_state):
+                self.mutate_everything()
+                self.assertNotEqual(self.game_state, original_game_state)
+                raise RuntimeError("operator failed")
+
+        self.assertEqual(self.game_state, original_game_state)
+        self.assertEqual(self.deck_state, original_deck_state)
+        self.assertEqual(len(self.journal), 0)
+        self.assertIsNone(self.game_state.journal)
+        self.assertIsNone(self.deck_state.journal)
+
+    def test_commit_keeps_changes(self):
+        with self.journal.transaction(self.game_state, self.deck_state):
+            self.mutate_everything()
+            self.assertEqual(len(self.journal), 13)
+
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(
+            self.game_state.get_player_health(self.player_2), PlayerHealthState.DEAD
+        )
+        self.assertIsNone(self.game_state.state[self.player_1].gun)
+        self.assertEqual(self.deck_state.equipment_cards[0], EquipmentCard.TASER)
+
+    def test_mutators_without_journal(self):
+        self.mutate_everything()
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(
+            self.game_state.state[self.player_2].integrity_cards[2].card,
+            IntegrityCard.BAD_COP,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import unittest
+from copy import deepcopy
+from dataclasses import FrozenInstanceError
+
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+    UnknownEquipmentCards,
+)
+from gcbc.operators.action.equip import Equip
+
+
+class TestOpaqueState(unittest.TestCase):
+    def setUp(self):
+        self.player_1 = 0
+        self.player_2 = 1
+
+        self.game_state = TableTopGameState(
+            state={
+                self.player_1: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.AGENT, face_up=False),
+                    ],
+                    gun=PlayerGunState(has_gun=True, aimed_at=self.player_2),
+                    equipment=EquipmentCard.SWAP,
+                    health=PlayerHealthState.ALIVE,
+                ),
+                self.player_2: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.KINGPIN, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                    ],
+                    gun=None,
+                    equipment=None,
+                    health=PlayerHealthState.WOUNDED,
+                ),
+            }
+        )
+        self.deck_state = DeckState(
+            equipment_cards=[EquipmentCard.TASER, EquipmentCard.POLYGRAPH], guns=1
+        )
+
+    def test_opaque_state(self):
+        opaque = self.game_state.opaque_state()
+
+        self.assertEqual(
+            opaque.state[self.player_1],
+            PlayerGameState(
+                integrity_cards=[
+                    PlayerIntegrityCardState(card=IntegrityCard.UNKNOWN, face_up=False),
+                    PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                    PlayerIntegrityCardState(card=IntegrityCard.UNKNOWN, face_up=False),
+                ],
+                gun=PlayerGunState(has_gun=True, aimed_at=self.player_2),
+                equipment=EquipmentCard.UNKNOWN,
+                health=PlayerHealthState.ALIVE,
+            ),
+        )
+        self.assertIsNone(opaque.state[self.player_2].gun)
+        self.assertIsNot(
+            opaque.state[self.player_1].gun, self.game_state.state[self.player_1].gun
+        )
+
+    def test_views_are_cached_until_the_player_changes(self):
+        opaque = self.game_state.opaque_state()
+        again = self.game_state.opaque_state()
+        self.assertIs(again.state[self.player_1], opaque.state[self.player_1])
+        self.assertIs(again.state[self.player_2], opaque.state[self.player_2])
+
+        self.game_state.set_face_up(self.player_2, 0, True)
+        changed = self.game_state.opaque_state()
+        self.assertIs(changed.state[self.player_1], opaque.state[self.player_1])
+        self.assertEqual(changed.state[self.player_2].integrity_cards[0].card, IntegrityCard.KINGPIN)
+
+        self.game_state.swap_cards(self.player_1, 1, self.player_2, 1)
+        swapped = self.game_state.opaque_state()
+        self.assertIsNot(swapped.state[self.player_1], opaque.state[self.player_1])
+        self.assertEqual(swapped.state[self.player_1].integrity_cards[1].card, IntegrityCard.UNKNOWN)
+        self.assertEqual(swapped.state[self.player_2].integrity_cards[1].card, IntegrityCard.BAD_COP)
+
+    def test_views_are_read_only(self):
+        opaque = self.game_state.opaque_state()
+        with self.assertRaises(FrozenInstanceError):
+            opaque.state[self.player_2].health = PlayerHealthState.DEAD
+        with self.assertRaises(FrozenInstanceError):
+            opaque.set_health(self.player_2, PlayerHealthState.DEAD)
+
+        # a bot changes a thawed copy, which leaves later views alone
+        thawed = opaque.thaw()
+        thawed.set_health(self.player_2, PlayerHealthState.DEAD)
+        self.assertEqual(
+            self.game_state.opaque_state().state[self.player_2].health,
+            PlayerHealthState.WOUNDED,
+        )
+
+    def test_views_follow_direct_changes(self):
+        self.game_state.opaque_state()
+        self.game_state.state[self.player_2].health = PlayerHealthState.DEAD
+        self.game_state.state[self.player_2].integrity_cards[0].face_up = True
+
+        opaque = self.game_state.opaque_state()
+        self.assertEqual(opaque.state[self.player_2].health, PlayerHealthState.DEAD)
+        self.assertEqual(
+            opaque.state[self.player_2].integrity_cards[0].card, IntegrityCard.KINGPIN
+        )
+
+    def test_views_follow_direct_changes_to_cards_and_guns(self):
+        self.game_state.opaque_state()
+        self.game_state.swap_cards(self.player_1, 0, self.player_2, 0)
+        self.game_state.opaque_state()
+        self.game_state.state[self.player_1].integrity_cards[0].face_up = True
+        self.game_state.state[self.player_1].gun.has_gun = False
+
+        opaque = self.game_state.opaque_state()
+        self.assertEqual(
+            opaque.state[self.player_1].integrity_cards[0].card, IntegrityCard.KINGPIN
+        )
+        self.assertFalse(opaque.state[self.player_1].gun.has_gun)
+
+    def test_deepcopy_does_not_share_views(self):
+        opaque = self.game_state.opaque_state()
+        copied = deepcopy(self.game_state)
+        self.assertEqual(copied.opaque_state(), opaque)
+
+        copied.set_face_up(self.player_2, 0, True)
+        self.assertEqual(self.game_state.opaque_state(), opaque)
+        self.assertNotEqual(copied.opaque_state(), opaque)
+
+    def test_deck_opaque_state(self):
+        opaque = self.deck_state.opaque_state()
+
+        self.assertEqual(len(opaque.equipment_cards), 2)
+        self.assertEqual(opaque.guns, 1)
+        self.assertEqual(list(opaque.equipment_cards), [EquipmentCard.UNKNOWN] * 2)
+        self.assertEqual(opaque.equipment_cards[-1], EquipmentCard.UNKNOWN)
+        self.assertEqual(
+            opaque, DeckState(equipment_cards=[EquipmentCard.UNKNOWN] * 2, guns=1)
+        )
+        self.assertEqual(opaque.equipment_cards, UnknownEquipmentCards(2))
+        with self.assertRaises(IndexError):
+            opaque.equipment_cards[2]
+
+    def test_operators_play_on_the_opaque_deck(self):
+        game_state = self.game_state.opaque_state().thaw()
+        deck_state = self.deck_state.opaque_state()
+
+        equip = Equip(self.player_2, 0)
+        self.assertTrue(equip.is_valid(game_state, deck_state))
+        record = equip.undo_record(game_state, deck_state)
+        game_state, deck_state = equip.play(game_state, deck_state)
+        self.assertEqual(game_state.state[self.player_2].equipment, EquipmentCard.UNKNOWN)
+        self.assertEqual(len(deck_state.equipment_cards), 1)
+
+        game_state, deck_state = equip.undo(game_state, deck_state, record)
+        self.assertIsNone(game_state.state[self.player_2].equipment)
+        self.assertEqual(deck_state.equipment_cards, UnknownEquipmentCards(2))
+        self.assertEqual(len(self.deck_state.equipment_cards), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
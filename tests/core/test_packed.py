@@ -0,0 +1,126 @@
+import unittest
+from gcbc.core.core_data import (
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+from gcbc.core.journal import ChangeJournal
+from gcbc.core.packed import FIELDS, PackedTableTopState
+
+
+class TestPackedTableTopState(unittest.TestCase):
+    def setUp(self):
+        self.player_1 = 0
+        self.player_2 = 1
+        self.player_3 = 2
+
+        self.game_state = TableTopGameState(
+            state={
+                self.player_1: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.AGENT, face_up=True),
+                    ],
+                    gun=PlayerGunState(has_gun=True, aimed_at=self.player_3),
+                    equipment=EquipmentCard.SWAP,
+                    health=PlayerHealthState.WOUNDED,
+                ),
+                self.player_2: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.KINGPIN, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                    ],
+                    gun=None,
+                    equipment=None,
+                    health=PlayerHealthState.ALIVE,
+                ),
+                self.player_3: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                    ],
+                    gun=PlayerGunState(has_gun=False, aimed_at=None),
+                    equipment=None,
+                    health=PlayerHealthState.DEAD,
+                ),
+            }
+        )
+
+        self.packed = PackedTableTopState.from_state(self.game_state)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.packed.tobytes()), 3 * FIELDS)
+        self.assertEqual(self.packed.to_state(), self.game_state)
+
+        from_bytes = PackedTableTopState.frombytes(3, self.packed.tobytes())
+        self.assertEqual(from_bytes, self.packed)
+
+    def test_queries(self):
+        self.assertTrue(self.packed.is_player_alive(self.player_1))
+        self.assertFalse(self.packed.is_player_alive(self.player_3))
+        self.assertEqual(
+            self.packed.get_player_health(self.player_1), PlayerHealthState.WOUNDED
+        )
+        self.assertEqual(
+            self.packed.get_cards(self.player_2),
+            [IntegrityCard.KINGPIN, IntegrityCard.BAD_COP, IntegrityCard.BAD_COP],
+        )
+        self.assertTrue(self.packed.is_face_up(self.player_1, 2))
+        self.assertTrue(self.packed.has_gun(self.player_1))
+        self.assertFalse(self.packed.has_gun(self.player_2))
+        self.assertEqual(self.packed.get_aimed_at(self.player_1), self.player_3)
+        self.assertIsNone(self.packed.get_aimed_at(self.player_3))
+        self.assertEqual(self.packed.get_equipment(self.player_1), EquipmentCard.SWAP)
+
+    def test_opaque_state(self):
+        opaque = self.packed.opaque_state()
+
+        self.assertEqual(opaque.to_state(), self.game_state.opaque_state())
+        self.assertEqual(
+            PackedTableTopState.from_state(self.game_state.opaque_state()), opaque
+        )
+
+    def test_mutators_match_dataclasses(self):
+        mutations = [
+            ("set_health", (self.player_3, PlayerHealthState.ALIVE)),
+            ("set_equipment", (self.player_1, None)),
+            ("set_has_gun", (self.player_3, True)),
+            ("set_aimed_at", (self.player_3, self.player_1)),
+            ("set_card", (self.player_2, 1, IntegrityCard.GOOD_COP)),
+            ("set_face_up", (self.player_3, 0, True)),
+            ("swap_cards", (self.player_1, 2, self.player_2, 0)),
+            ("set_gun", (self.player_1, None)),
+        ]
+
+        for name, args in mutations:
+            getattr(self.game_state, name)(*args)
+            getattr(self.packed, name)(*args)
+            self.assertEqual(self.packed.to_state(), self.game_state, name)
+
+    def test_mutators_are_journaled(self):
+        original = self.packed.copy()
+        journal = ChangeJournal()
+
+        with self.assertRaises(RuntimeError):
+            with journal.transaction(self.packed):
+                self.packed.swap_cards(self.player_1, 0, self.player_2, 0)
+                self.packed.set_health(self.player_1, PlayerHealthState.DEAD)
+                raise RuntimeError()
+
+        self.assertEqual(self.packed, original)
+
+    def test_requires_three_cards(self):
+        self.game_state.state[self.player_1].integrity_cards.pop()
+        with self.assertRaises(ValueError):
+            PackedTableTopState.from_state(self.game_state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import pickle
+import unittest
+from copy import deepcopy
+from dataclasses import FrozenInstanceError
+
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+from gcbc.operators.equipment.swap import Swap
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.player_1 = 0
+        self.player_2 = 1
+
+        self.game_state = TableTopGameState(
+            state={
+                self.player_1: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.AGENT, face_up=False),
+                    ],
+                    gun=PlayerGunState(has_gun=True, aimed_at=self.player_2),
+                    equipment=EquipmentCard.SWAP,
+                    health=PlayerHealthState.ALIVE,
+                ),
+                self.player_2: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.KINGPIN, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=False),
+                    ],
+                    gun=None,
+                    equipment=None,
+                    health=PlayerHealthState.WOUNDED,
+                ),
+            }
+        )
+        self.deck_state = DeckState(
+            equipment_cards=[EquipmentCard.TASER, EquipmentCard.POLYGRAPH], guns=1
+        )
+
+    def test_snapshot_equals_state(self):
+        snapshot = self.game_state.snapshot()
+
+        self.assertIsInstance(snapshot, TableTopGameState)
+        self.assertEqual(snapshot, self.game_state)
+        self.assertEqual(self.game_state, snapshot)
+        self.assertTrue(snapshot.is_player_alive(self.player_2))
+        self.assertEqual(snapshot.opaque_state(), self.game_state.opaque_state())
+        self.assertEqual(self.deck_state.snapshot(), self.deck_state)
+        self.assertTrue(
+            Swap(self.player_1, self.player_1, 0, self.player_2, 1).is_valid(
+                snapshot, self.deck_state.snapshot()
+            )
+        )
+
+    def test_mutation_raises(self):
+        snapshot = self.game_state.snapshot()
+        deck_snapshot = self.deck_state.snapshot()
+
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.state[self.player_1].health = PlayerHealthState.DEAD
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.state[self.player_1].gun.aimed_at = None
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.state[self.player_1].integrity_cards[0].face_up = True
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.set_face_up(self.player_1, 0, True)
+        with self.assertRaises(FrozenInstanceError):
+            Swap(self.player_1, self.player_1, 0, self.player_2, 1).play(
+                snapshot, deck_snapshot
+            )
+        with self.assertRaises(FrozenInstanceError):
+            deck_snapshot.draw_equipment_card()
+        with self.assertRaises(TypeError):
+            snapshot.state[self.player_1] = None
+        with self.assertRaises(TypeError):
+            snapshot.state[self.player_1].integrity_cards[0] = None
+
+        self.assertEqual(snapshot, self.game_state)
+        self.assertEqual(deck_snapshot, self.deck_state)
+
+    def test_snapshots_share_unchanged_players(self):
+        snapshot = self.game_state.snapshot()
+        self.game_state.set_health(self.player_2, PlayerHealthState.DEAD)
+        after = self.game_state.snapshot()
+
+        self.assertIs(after.state[self.player_1], snapshot.state[self.player_1])
+        self.assertEqual(snapshot.state[self.player_2].health, PlayerHealthState.WOUNDED)
+        self.assertEqual(after.state[self.player_2].health, PlayerHealthState.DEAD)
+
+    def test_thaw_copy_and_pickle(self):
+        snapshot = self.game_state.snapshot()
+
+        thawed = snapshot.thaw()
+        thawed.set_health(self.player_1, PlayerHealthState.DEAD)
+        self.assertEqual(snapshot, self.game_state)
+        self.assertEqual(self.deck_state.snapshot().thaw(), self.deck_state)
+
+        self.assertIs(deepcopy(snapshot), snapshot)
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), self.game_state)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.deck_state.snapshot())), self.deck_state
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+from copy import deepcopy
+from unittest.mock import Mock
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.core.core_data import TurnPhase
+from gcbc.core.zobrist import TranspositionTable, position_key
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.legal_moves import legal_moves
+
+
+class TestZobrist(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.num_players = 5
+        self.engine = GCBCGameEngine(
+            GCBCInitalizer.build_game_state(self.num_players),
+            GCBCInitalizer.build_deck(self.num_players),
+            BotManager({player: Mock(BaseBot) for player in range(self.num_players)}),
+        )
+
+    def random_move(self):
+        player = random.randrange(self.num_players)
+        phase = random.choice(list(TurnPhase))
+        moves = legal_moves(self.engine.game_state, self.engine.deck_state, player, phase)
+        return random.choice(moves) if moves else None
+
+    def test_incremental_matches_recomputed(self):
+        game_state = self.engine.game_state
+        keys = [game_state.compute_zobrist()]
+
+        for _ in range(200):
+            move = self.random_move()
+            if move is None or not self.engine.make(move):
+                continue
+            self.assertEqual(game_state.zobrist, deepcopy(game_state).compute_zobrist())
+            keys.append(game_state.zobrist)
+
+        while self.engine.unmake() is not None:
+            keys.pop()
+            self.assertEqual(game_state.zobrist, keys[-1])
+        self.assertEqual(keys, [game_state.compute_zobrist()])
+
+    def test_equal_states_have_equal_keys(self):
+        game_state, deck_state = self.engine.game_state, self.engine.deck_state
+        other = deepcopy(game_state)
+        key = position_key(game_state, deck_state)
+        self.assertEqual(position_key(other, deck_state), key)
+
+        other.set_face_up(0, 0, True)
+        self.assertNotEqual(position_key(other, deck_state), key)
+        other.set_face_up(0, 0, False)
+        self.assertEqual(position_key(other, deck_state), key)
+
+        deck_state.get_gun()
+        self.assertNotEqual(position_key(game_state, deck_state), key)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_get_and_put(self):
+        table = TranspositionTable(size=6)
+        self.assertEqual(table.size, 8)
+
+        table.put(3, "a", depth=1)
+        self.assertEqual(table.get(3), "a")
+        self.assertIsNone(table.get(3, min_depth=2))
+        self.assertIsNone(table.get(11))
+        self.assertEqual((table.hits, table.misses), (1, 2))
+
+        # 11 shares a slot with 3, and only replaces it when searched as deep
+        table.put(11, "b", depth=0)
+        self.assertEqual(table.get(3), "a")
+        table.put(11, "b", depth=1)
+        self.assertEqual(table.get(11), "b")
+        self.assertIsNone(table.get(3))
+
+    def test_bounded(self):
+        table = TranspositionTable(size=16)
+        for key in range(100):
+            table.put(key, key)
+
+        self.assertEqual(len(table), 16)
+        self.assertEqual(table.get(99), 99)
+
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
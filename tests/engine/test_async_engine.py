@@ -0,0 +1,162 @@
+import asyncio
+import random
+import unittest
+from collections import Counter
+from unittest.mock import AsyncMock, Mock, patch
+
+from gcbc.bot.base_bot import AsyncBaseBot, BotManager
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import DeckState
+from gcbc.engine.async_engine import AsyncGCBCGameEngine, play_many
+from gcbc.engine.state_init import GCBCInitalizer
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.base_operator import BaseEquipment
+
+
+class Waiting:
+    """
+    Counts the games with a bot waiting on the server, and the most at once.
+    """
+
+    def __init__(self):
+        self.games = Counter()
+        self.most = 0
+        self.seen = set()
+
+    async def wait(self, game, delay):
+        self.seen.add(game)
+        self.games[game] += 1
+        self.most = max(self.most, len(self.games))
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.games[game] -= 1
+            if not self.games[game]:
+                del self.games[game]
+
+
+class AsyncRandomBot(AsyncBaseBot):
+    """
+    A RandomBot that waits on a pretend model server before every answer.
+    """
+
+    def __init__(self, player, delay=0.0, waiting=None, game=None):
+        self.bot = RandomBot(player)
+        self.delay = delay
+        self.waiting = waiting or Waiting()
+        self.game = game
+
+    async def pre_round(self, game_state, deck_state):
+        await self.waiting.wait(self.game, self.delay)
+        return self.bot.pre_round(game_state, deck_state)
+
+    async def action(self, game_state, deck_state):
+        await self.waiting.wait(self.game, self.delay)
+        return self.bot.action(game_state, deck_state)
+
+    async def aim(self, game_state, deck_state):
+        await self.waiting.wait(self.game, self.delay)
+        return self.bot.aim(game_state, deck_state)
+
+
+class SlowBot(AsyncBaseBot):
+    def __init__(self, delay, move):
+        self.delay = delay
+        self.move = move
+        self.cancelled = False
+
+    async def pre_round(self, game_state, deck_state):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.move
+
+
+def deal(num_players, seed):
+    random.seed(seed)
+    return (
+        GCBCInitalizer.build_game_state(num_players),
+        GCBCInitalizer.build_deck(num_players),
+    )
+
+
+class TestAsyncGCBCGameEngine(unittest.IsolatedAsyncioTestCase):
+    def make_engine(self, engine_class, bot_class, seed, **kwargs):
+        game_state, deck_state = deal(4, seed)
+        return engine_class(
+            game_state,
+            deck_state,
+            BotManager({player: bot_class(player) for player in range(4)}),
+            **kwargs,
+        )
+
+    async def test_action_and_aim_are_awaited(self):
+        engine = self.make_engine(AsyncGCBCGameEngine, AsyncRandomBot, seed=3)
+        bot = Mock(AsyncBaseBot)
+        bot.action = AsyncMock(return_value=Pass(0))
+        bot.aim = AsyncMock(return_value=None)
+
+        with patch.object(engine, 'enact', return_value=True) as mock_enact:
+            self.assertTrue(await engine.action(0, bot))
+            self.assertFalse(await engine.aim(0, bot))
+
+        bot.action.assert_awaited_once()
+        bot.aim.assert_awaited_once_with(engine.game_state, engine.deck_state)
+        mock_enact.assert_called_once_with(Pass(0))
+
+    async def test_sync_bots(self):
+        engine = self.make_engine(AsyncGCBCGameEngine, RandomBot, seed=3)
+        win_condition, rounds = await engine.play(max_rounds=300)
+
+        self.assertEqual(win_condition, engine.win_condition())
+        self.assertLessEqual(rounds, 300)
+
+    async def test_play_many_interleaves_games(self):
+        waiting = Waiting()
+        engines = [
+            self.make_engine(
+                AsyncGCBCGameEngine,
+                lambda player, game=seed: AsyncRandomBot(player, 0.0, waiting, game),
+                seed=seed,
+            )
+            for seed in range(20)
+        ]
+
+        results = await play_many(engines, max_rounds=5)
+
+        # played one after another, only one game would ever be waiting; some
+        # games are won as dealt, and never ask a bot
+        self.assertEqual(len(results), 20)
+        self.assertGreater(len(waiting.seen), 10)
+        self.assertEqual(waiting.most, len(waiting.seen))
+
+    async def test_single_pre_round_with_timeout(self):
+        equipments = {}
+        for player in range(3):
+            equipments[player] = Mock(BaseEquipment)
+            equipments[player].is_valid.return_value = player != 2
+        bots = {
+            0: SlowBot(1.0, equipments[0]),
+            1: SlowBot(0.05, equipments[1]),
+            2: SlowBot(0.01, equipments[2]),
+        }
+        engine = AsyncGCBCGameEngine(
+            Mock(),
+            Mock(DeckState),
+            BotManager(bots),
+            pre_round_timeout=0.2,
+        )
+        engine.game_state.is_player_alive.return_value = True
+
+        with patch.object(engine, 'enact') as mock_enact:
+            self.assertTrue(await engine.single_pre_round())
+        await asyncio.sleep(0)
+
+        self.assertTrue(bots[0].cancelled)
+        mock_enact.assert_called_once_with(equipments[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
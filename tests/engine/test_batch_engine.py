@@ -0,0 +1,157 @@
+import unittest
+from copy import deepcopy
+from dataclasses import fields
+
+import numpy as np
+
+from gcbc.core.core_data import PlayerHealthState
+from gcbc.core.packed import (
+    NO_OP,
+    OP_AIM,
+    OP_ARM_AND_AIM,
+    OP_BLACKMAIL,
+    OP_DEFIBRILLATOR,
+    OP_EQUIP,
+    OP_INVESTIGATE,
+    OP_PASS,
+    OP_POLYGRAPH,
+    OP_SHOOT,
+    OP_SWAP,
+    OP_TASER,
+)
+from gcbc.engine.batch_engine import (
+    NO_WINNER,
+    BatchGCBCGameEngine,
+    BatchMoves,
+    RandomBatchPolicy,
+)
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.bot.base_bot import BotManager
+from gcbc.operators.action.aim import Aim
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.equip import Equip
+from gcbc.operators.action.investigate import Investigate
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.equipment.blackmail import Blackmail
+from gcbc.operators.equipment.defibrillator import Defibrillator
+from gcbc.operators.equipment.polygraph import Polygraph
+from gcbc.operators.equipment.swap import Swap
+from gcbc.operators.equipment.taser import Taser
+
+OPERATORS = {
+    OP_INVESTIGATE: Investigate,
+    OP_EQUIP: Equip,
+    OP_ARM_AND_AIM: ArmAndAim,
+    OP_AIM: Aim,
+    OP_SHOOT: Shoot,
+    OP_PASS: Pass,
+    OP_TASER: Taser,
+    OP_DEFIBRILLATOR: Defibrillator,
+    OP_BLACKMAIL: Blackmail,
+    OP_POLYGRAPH: Polygraph,
+    OP_SWAP: Swap,
+}
+
+
+def to_operator(moves: BatchMoves, row: int):
+    operator = OPERATORS[int(moves.op[row])]
+    num_args = sum(1 for field in fields(operator) if field.init) - 1
+    args = [int(arg) for arg in moves.args[row, :num_args]]
+    return operator(int(moves.actor[row]), *args)
+
+
+class TestBatchGCBCGameEngine(unittest.TestCase):
+    def setUp(self):
+        self.num_games = 100
+        self.num_players = 5
+        self.rng = np.random.default_rng(7)
+        self.policy = RandomBatchPolicy(
+            np.random.default_rng(11), equipment_probability=1.0, aim_probability=0.5
+        )
+        self.engine = BatchGCBCGameEngine.new_games(
+            self.num_games, self.num_players, [self.policy], self.rng
+        )
+
+    def random_moves(self, games: np.ndarray) -> BatchMoves:
+        moves = BatchMoves.empty(len(games))
+        moves.op[:] = self.rng.integers(0, len(OPERATORS), size=len(games))
+        moves.actor[:] = self.rng.integers(0, self.num_players, size=len(games))
+        moves.args[:] = self.rng.integers(-1, self.num_players + 1, size=(len(games), 4))
+        return moves
+
+    def test_rules_match_operators(self):
+        games = np.arange(self.num_games)
+
+        for _ in range(25):
+            # mix policy moves, which are mostly sensible, with fully random ones
+            players = self.engine.current_player
+            moves = [
+                self.policy.pre_round(self.engine, games, players),
+                self.policy.action(self.engine, games, players),
+                self.random_moves(games),
+            ]
+
+            for batch in moves:
+                if batch is None:
+                    continue
+                batch.actor[:] = np.where(batch.op == NO_OP, 0, batch.actor)
+                batch.op[batch.op == NO_OP] = OP_PASS
+
+                before = [self.engine.get_state(game) for game in games]
+                valid = self.engine.enact(games, batch)
+
+                for game in games:
+                    game_state, deck_state = deepcopy(before[game])
+                    operator = to_operator(batch, game)
+                    try:
+                        expected_valid = operator.is_valid(game_state, deck_state)
+                        if expected_valid:
+                            operator.play(game_state, deck_state)
+                    except (AttributeError, IndexError, KeyError):
+                        # the operators do not guard every malformed move
+                        continue
+
+                    self.assertEqual(valid[game], expected_valid, operator)
+                    self.assertEqual(
+                        self.engine.get_state(game), (game_state, deck_state), operator
+                    )
+
+            self.engine.current_player = self.engine.next_player(games)
+
+    def test_run_until_won(self):
+        winners = self.engine.run(max_turns=1000)
+
+        # a taser can take guns out of play, so not every random game ends
+        self.assertGreater((winners != NO_WINNER).mean(), 0.5)
+        for game in range(self.num_games):
+            game_state, deck_state = self.engine.get_state(game)
+            engine = GCBCGameEngine(
+                game_state,
+                deck_state,
+                BotManager({player: None for player in range(self.num_players)}),
+            )
+            win_condition = engine.win_condition()
+            self.assertEqual(
+                NO_WINNER if win_condition is None else win_condition.value,
+                winners[game],
+            )
+
+    def test_from_states(self):
+        states = [self.engine.get_state(game) for game in range(3)]
+        engine = BatchGCBCGameEngine.from_states(states, [self.policy])
+
+        for game in range(3):
+            self.assertEqual(engine.get_state(game), states[game])
+
+    def test_next_player_skips_dead(self):
+        self.engine.health[0, 1] = PlayerHealthState.DEAD
+        self.engine.health[0, 2] = PlayerHealthState.DEAD
+
+        next_player = self.engine.next_player(np.array([0, 1]))
+
+        self.assertEqual(next_player.tolist(), [3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from gcbc.core.core_data import PlayerHealthState
+from gcbc.core.packed import INTEGRITY_CARD_CODES, PackedTableTopState
+from gcbc.engine.state_init import GCBCInitalizer
+
+
+class TestDeals(unittest.TestCase):
+    def setUp(self):
+        self.deals = GCBCInitalizer.deal_many(500, 5, np.random.default_rng(0))
+
+    def test_deals_the_same_cards(self):
+        self.assertEqual(self.deals.cards.shape, (500, 5, 3))
+
+        expected = Counter(
+            INTEGRITY_CARD_CODES[card] for card in GCBCInitalizer.integrity_cards(5)
+        )
+        for cards in self.deals.cards:
+            self.assertEqual(Counter(cards.ravel().tolist()), expected)
+
+        # the games are shuffled independently
+        self.assertGreater(len({cards.tobytes() for cards in self.deals.cards}), 490)
+        np.testing.assert_array_equal(
+            self.deals.cards,
+            GCBCInitalizer.deal_many(500, 5, np.random.default_rng(0)).cards,
+        )
+
+    def test_hydrates_games(self):
+        game = self.deals[7]
+        fresh = GCBCInitalizer.build_game_state(5)
+
+        self.assertEqual(len(self.deals), 500)
+        for player, player_state in game.state.items():
+            self.assertEqual(
+                [INTEGRITY_CARD_CODES[card.card] for card in player_state.integrity_cards],
+                self.deals.cards[7, player].tolist(),
+            )
+            self.assertEqual(player_state.health, PlayerHealthState.ALIVE)
+            self.assertEqual(player_state.gun, fresh.state[player].gun)
+            self.assertIsNone(player_state.equipment)
+            self.assertFalse(any(card.face_up for card in player_state.integrity_cards))
+
+        self.assertEqual(self.deals.packed(7), PackedTableTopState.from_state(game))
+
+    def test_slices(self):
+        some = self.deals[100:110]
+        self.assertEqual(len(some), 10)
+        self.assertEqual(some[3], self.deals[103])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
+import threading
+import time
 import unittest
+from copy import deepcopy
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock, patch, call
 from gcbc.core.core_data import (
     IntegrityCard,
@@ -108,6 +112,65 @@ class TestGCBCGameEngine(unittest.TestCase):
         action.notify.assert_not_called()
         action.private_notify.assert_not_called()
 
+    def test_enact_rolls_back_on_failure(self):
+        self.bot_manager.get_bot(self.player_3).on_public_notification.side_effect = (
+            RuntimeError("bot crashed")
+        )
+        shoot = Actions.shoot(self.player_2, self.player_3)
+
+        with self.assertRaises(RuntimeError):
+            self.engine.enact(shoot)
+
+        self.assertEqual(self.player_3_state.health, PlayerHealthState.ALIVE)
+        self.assertTrue(self.player_2_state.gun.has_gun)
+        self.assertEqual(self.player_2_state.gun.aimed_at, self.player_3)
+        self.assertEqual(self.deck_state.guns, 1)
+
+    def test_enact_mutates_in_place(self):
+        shoot = Actions.shoot(self.player_2, self.player_3)
+
+        self.assertTrue(self.engine.enact(shoot))
+
+        self.assertIs(self.engine.game_state, self.game_state)
+        self.assertEqual(self.player_3_state.health, PlayerHealthState.WOUNDED)
+        self.assertEqual(self.deck_state.guns, 2)
+
+    def test_make_and_unmake(self):
+        original_game_state = deepcopy(self.game_state)
+        original_deck_state = deepcopy(self.deck_state)
+
+        moves = [
+            Actions.equip(self.player_1, 0),
+            Actions.arm_and_aim(self.player_3, self.player_1, 1),
+            Actions.shoot(self.player_2, self.player_3),
+            Actions.shoot(self.player_3, self.player_1),
+        ]
+        for move in moves:
+            self.assertTrue(self.engine.make(move))
+
+        self.assertFalse(self.engine.make(Actions.shoot(self.player_2, self.player_3)))
+        self.assertEqual(len(self.engine.move_stack), len(moves))
+        self.assertEqual(self.player_1_state.health, PlayerHealthState.WOUNDED)
+
+        for move in reversed(moves):
+            self.assertIs(self.engine.unmake(), move)
+
+        self.assertIsNone(self.engine.unmake())
+        self.assertEqual(self.engine.game_state, original_game_state)
+        self.assertEqual(self.engine.deck_state, original_deck_state)
+
+    def test_make_the_same_operator_twice(self):
+        aim = Aim(self.player_2, self.player_1)
+        self.assertTrue(self.engine.make(aim))
+        self.assertTrue(self.engine.make(Aim(self.player_2, self.player_3)))
+        self.assertTrue(self.engine.make(aim))
+
+        while self.engine.unmake() is not None:
+            pass
+        self.assertEqual(self.player_2_state.gun.aimed_at, self.player_3)
+        for bot in self.bot_manager.player_map.values():
+            bot.on_public_notification.assert_not_called()
+
     def test_single_pre_round(self):
         bot = self.bot_manager.get_bot(self.player_1)
         equipment = Mock(BaseEquipment)
@@ -121,6 +184,90 @@ class TestGCBCGameEngine(unittest.TestCase):
         bot.pre_round.assert_called_once()
         mock_enact.assert_called_once_with(equipment)
 
+    def test_single_pre_round_concurrent_with_timeout(self):
+        engine = GCBCGameEngine(
+            self.game_state,
+            self.deck_state,
+            self.bot_manager,
+            pre_round_timeout=0.2,
+        )
+        equipments = {}
+        for player, delay in [(self.player_1, 0.5), (self.player_2, 0.1), (self.player_3, 0.1)]:
+            equipments[player] = Mock(BaseEquipment)
+            equipments[player].is_valid.return_value = player != self.player_3
+            self.bot_manager.get_bot(player).pre_round.side_effect = (
+                lambda game_state, deck_state, delay=delay, player=player: (
+                    time.sleep(delay) or equipments[player]
+                )
+            )
+
+        start_time = time.perf_counter()
+        with engine, patch.object(engine, 'enact') as mock_enact:
+            result = engine.single_pre_round()
+        elapsed = time.perf_counter() - start_time
+        self.assertIsNone(engine.executor)
+
+        # the slow bot is not waited for, and the others are asked at the same time
+        self.assertTrue(result)
+        self.assertLess(elapsed, 0.4)
+        mock_enact.assert_called_once_with(equipments[self.player_2])
+
+    def test_hung_bots_are_not_asked_again(self):
+        engine = GCBCGameEngine(
+            self.game_state, self.deck_state, self.bot_manager, pre_round_timeout=0.05
+        )
+        release = threading.Event()
+        hung_bot = self.bot_manager.get_bot(self.player_1)
+        hung_bot.pre_round.side_effect = (
+            lambda game_state, deck_state: release.wait() and None
+        )
+        for player in (self.player_2, self.player_3):
+            self.bot_manager.get_bot(player).pre_round.return_value = None
+
+        with engine:
+            for _ in range(3):
+                self.assertFalse(engine.single_pre_round())
+            # the hung bot kept its thread, and the others are still asked
+            self.assertEqual(hung_bot.pre_round.call_count, 1)
+            self.assertEqual(self.bot_manager.get_bot(self.player_2).pre_round.call_count, 3)
+
+            release.set()
+            engine.unanswered[self.player_1].result(timeout=1)
+            self.assertFalse(engine.single_pre_round())
+            self.assertEqual(hung_bot.pre_round.call_count, 2)
+
+    def pre_round_winner(self, elapsed):
+        equipments = {}
+        for player in (self.player_3, self.player_2):
+            equipments[player] = Mock(BaseEquipment)
+            equipments[player].is_valid.return_value = True
+            self.bot_manager.get_bot(player).pre_round.return_value = equipments[player]
+        self.bot_manager.get_bot(self.player_1).pre_round.return_value = None
+
+        with patch.object(
+            self.engine,
+            'timed_pre_round',
+            side_effect=lambda bot, game_state, deck_state: (
+                bot.pre_round(game_state, deck_state),
+                elapsed[self.bot_manager.player_map[self.player_2] is bot],
+            ),
+        ), patch.object(self.engine, 'enact') as mock_enact:
+            self.assertTrue(self.engine.single_pre_round())
+
+        (move,), _ = mock_enact.call_args
+        return next(player for player, equipment in equipments.items() if equipment is move)
+
+    def test_single_pre_round_ties_go_to_the_next_seat_in_turn(self):
+        # answers within the resolution of each other tie
+        self.assertEqual(self.pre_round_winner({True: 0.03, False: 0.01}), self.player_2)
+        self.engine.current_player = self.player_3
+        self.assertEqual(self.pre_round_winner({True: 0.01, False: 0.03}), self.player_3)
+
+        # otherwise the fastest wins
+        self.assertEqual(self.pre_round_winner({True: 0.2, False: 0.01}), self.player_3)
+        self.engine.pre_round_resolution = 0
+        self.assertEqual(self.pre_round_winner({True: 0.02, False: 0.01}), self.player_3)
+
     def test_single_pre_round_no_valid_moves(self):
         for bot in self.bot_manager.player_map.values():
             bot.pre_round.return_value = None
@@ -146,6 +293,29 @@ class TestGCBCGameEngine(unittest.TestCase):
         bot.action.assert_called_once()
         mock_enact.assert_called_once_with(action)
 
+    def test_action_view_cannot_change_the_table(self):
+        bot = self.bot_manager.get_bot(self.player_1)
+
+        def action(game_state, deck_state):
+            with self.assertRaises(FrozenInstanceError):
+                game_state.state[self.player_2].health = PlayerHealthState.DEAD
+            # simulating on a thawed copy is fine
+            simulated = game_state.thaw()
+            simulated.set_health(self.player_2, PlayerHealthState.DEAD)
+            return None
+
+        bot.action.side_effect = action
+        self.engine.action(self.player_1, bot)
+
+        self.assertEqual(
+            self.engine.game_state.get_player_health(self.player_2),
+            PlayerHealthState.ALIVE,
+        )
+        self.assertEqual(
+            self.engine.game_state.opaque_state().state[self.player_2].health,
+            PlayerHealthState.ALIVE,
+        )
+
     def test_action_invalid(self):
         bot = self.bot_manager.get_bot(self.player_1)
         action = Mock(BaseAction)
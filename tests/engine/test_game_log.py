@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from copy import deepcopy
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.bot.random_bot import RandomBot
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.game_log import (
+    GAME,
+    RECORD_SIZE,
+    GameLogReader,
+    GameLogWriter,
+)
+from gcbc.engine.seeding import SeedStream
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.equipment.swap import Swap
+
+
+def bots(num_players, stream=None):
+    return BotManager(
+        {
+            player: BaseBot()
+            if stream is None
+            else RandomBot(player, rng=stream.rng(player))
+            for player in range(num_players)
+        }
+    )
+
+
+class TestGameLog(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "games.log")
+
+    def play_games(self, num_games):
+        engines = []
+        with GameLogWriter(self.path) as game_log:
+            for game in range(num_games):
+                stream = SeedStream(game)
+                engine = GCBCGameEngine.new_game(
+                    bots(5, stream),
+                    stream.rng(100),
+                    pre_round_workers=0,
+                    game_log=game_log,
+                )
+                start = deepcopy((engine.game_state, engine.deck_state))
+                rounds = 0
+                while engine.play_round() is None and rounds < 100:
+                    rounds += 1
+                engines.append((start, engine))
+        return engines
+
+    def test_round_trip(self):
+        engines = self.play_games(4)
+
+        with GameLogReader(self.path) as reader:
+            games = list(reader.games())
+            self.assertEqual(len(games), 4)
+            self.assertEqual(
+                sum(len(game.moves) for game in games),
+                sum(1 for _ in reader.operators()),
+            )
+
+            for game, ((game_state, deck_state), engine) in zip(games, engines):
+                self.assertEqual(game.game_state, game_state)
+                self.assertEqual(game.deck_state, deck_state)
+
+                # replaying the logged moves reaches the same table
+                replay = GCBCGameEngine(
+                    deepcopy(game.game_state), deepcopy(game.deck_state), bots(5)
+                )
+                for operator in game.operators():
+                    self.assertTrue(replay.enact(operator))
+                self.assertEqual(replay.game_state, engine.game_state)
+                self.assertEqual(replay.deck_state, engine.deck_state)
+
+            offsets = list(reader.game_offsets())
+            self.assertEqual(reader.game(offsets[2]).game_state, games[2].game_state)
+
+    def test_records(self):
+        engine = GCBCGameEngine.new_game(bots(4), game_log=GameLogWriter(self.path))
+        self.assertTrue(engine.enact(Pass(0)))
+        # invalid moves aren't logged
+        self.assertFalse(engine.enact(Shoot(1, 2)))
+        engine.game_log.write(Swap(0, 1, 0, 2, 1))
+        engine.game_log.close()
+
+        # a record cut short by a crash is ignored
+        with open(self.path, "ab") as f:
+            f.write(bytes(RECORD_SIZE // 2))
+
+        with GameLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 1 + 4 + 1 + 2)
+            self.assertEqual(reader.records[0, 0], GAME)
+            self.assertEqual(list(reader.operators()), [Pass(0), Swap(0, 1, 0, 2, 1)])
+
+    def test_rejects_interleaved_games(self):
+        with GameLogWriter(self.path) as game_log:
+            first = GCBCGameEngine.new_game(bots(4), game_log=game_log)
+            second = GCBCGameEngine.new_game(bots(4), game_log=game_log)
+            self.assertTrue(second.enact(Pass(0)))
+            with self.assertRaises(ValueError):
+                first.enact(Pass(0))
+
+        with GameLogReader(self.path) as reader:
+            self.assertEqual(list(reader.operators()), [Pass(0)])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a log")
+        with self.assertRaises(ValueError):
+            GameLogReader(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import random
+import tempfile
+import unittest
+from copy import deepcopy
+
+from gcbc.bot.base_bot import BotManager
+from gcbc.bot.random_bot import RandomBot
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.game_log import GameLogReader, GameLogWriter
+from gcbc.engine.replay import ReplayEngine
+from gcbc.engine.seeding import SeedStream
+
+
+class TestReplayEngine(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "game.log")
+
+        stream = SeedStream(2)
+        bots = BotManager(
+            {
+                player: RandomBot(player, aim_probability=0.1, rng=stream.rng(player))
+                for player in range(8)
+            }
+        )
+        with GameLogWriter(path) as game_log:
+            engine = GCBCGameEngine.new_game(bots, stream.rng(100), game_log=game_log)
+            # the engine's pre-round goes to the fastest bot, so the turns are
+            # played here with every bot asked in seat order, to log the same
+            # moves every run
+            for _ in range(300):
+                if engine.win_condition() is not None:
+                    break
+                for player, bot in bots.player_map.items():
+                    move = bot.pre_round(engine.game_state, engine.deck_state)
+                    if move is not None and engine.game_state.is_player_alive(player):
+                        engine.enact(move)
+                player = engine.current_player
+                bot = bots.get_bot(player)
+                engine.resolve_action(
+                    player,
+                    bot.action(
+                        engine.game_state.opaque_state(), engine.deck_state.opaque_state()
+                    ),
+                )
+                engine.resolve_aim(player, bot.aim(engine.game_state, engine.deck_state))
+                engine.current_player = engine.next_player(player)
+
+        with GameLogReader(path) as reader:
+            (self.game,) = reader.games()
+
+        # the table after every turn, played one move at a time
+        game_state, deck_state = deepcopy((self.game.game_state, self.game.deck_state))
+        self.tables = [deepcopy((game_state, deck_state))]
+        for operator in self.game.operators():
+            game_state, deck_state = operator.play(game_state, deck_state)
+            self.tables.append(deepcopy((game_state, deck_state)))
+        self.assertGreater(len(self.tables), 100)
+
+    def test_seeks_to_any_turn(self):
+        replay = ReplayEngine.from_logged_game(self.game, checkpoint_interval=8)
+        self.assertEqual(len(replay), len(self.tables) - 1)
+
+        self.assertEqual(replay.seek(len(replay)), self.tables[-1])
+        self.assertEqual(len(replay.checkpoints), len(replay) // 8 + 1)
+
+        rng = random.Random(0)
+        for turn in [3, 2, 9, 30, 17, 16, 15, 0] + rng.choices(range(len(replay)), k=50):
+            self.assertEqual(replay.seek(turn), self.tables[turn], turn)
+            self.assertEqual(replay.turn, turn)
+
+    def test_steps(self):
+        replay = ReplayEngine.from_logged_game(self.game, checkpoint_interval=8)
+        replay.seek(20)
+        replay.seek(17)
+        # stepping back past the checkpoint the table was restored from
+        for turn in range(16, 11, -1):
+            replay.step_back()
+            replay.step_back()
+            replay.step()
+            self.assertEqual((replay.game_state, replay.deck_state), self.tables[turn])
+
+        with self.assertRaises(IndexError):
+            replay.seek(len(replay) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
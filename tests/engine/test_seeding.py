@@ -0,0 +1,89 @@
+import random
+import unittest
+
+import numpy as np
+
+from gcbc.bot.base_bot import BaseBot, BotManager
+from gcbc.bot.random_bot import RandomBot
+from gcbc.engine.engine import GCBCGameEngine
+from gcbc.engine.seeding import SeedStream
+from gcbc.engine.state_init import GCBCInitalizer
+
+
+class TestSeedStream(unittest.TestCase):
+    def test_streams_are_reproducible_and_independent(self):
+        stream = SeedStream(7)
+
+        self.assertEqual(stream.rng(3).random(), SeedStream(7).rng(3).random())
+        self.assertEqual(stream.child(1).rng(3).random(), stream.rng(1, 3).random())
+        self.assertNotEqual(stream.rng(3).random(), stream.rng(4).random())
+        self.assertNotEqual(stream.rng(3).random(), SeedStream(8).rng(3).random())
+        self.assertEqual(
+            stream.generator(2).integers(1 << 30), SeedStream(7).generator(2).integers(1 << 30)
+        )
+
+    def test_workers_split_the_games(self):
+        stream = SeedStream(7)
+        everything = {game: rng.random() for game, rng in stream.games(10)}
+
+        split = {}
+        for worker in range(3):
+            for game, rng in stream.games(10, worker, 3):
+                self.assertNotIn(game, split)
+                split[game] = rng.random()
+
+        self.assertEqual(split, everything)
+        with self.assertRaises(ValueError):
+            next(stream.games(10, 3, 3))
+
+    def test_dealing(self):
+        random.seed(0)
+        before = random.random()
+
+        random.seed(0)
+        deals = [
+            (
+                GCBCInitalizer.build_game_state(6, rng),
+                GCBCInitalizer.build_deck(6, rng),
+            )
+            for rng in (SeedStream(1).rng(0), SeedStream(1).rng(0))
+        ]
+        # the global stream is left alone
+        self.assertEqual(random.random(), before)
+        self.assertEqual(deals[0], deals[1])
+
+        generator_deal = GCBCInitalizer.build_game_state(6, np.random.default_rng(1))
+        self.assertEqual(
+            generator_deal, GCBCInitalizer.build_game_state(6, np.random.default_rng(1))
+        )
+
+    def test_engine_games_are_reproducible(self):
+        def play(seed):
+            stream = SeedStream(seed)
+            bots = BotManager(
+                {
+                    player: RandomBot(player, equipment_probability=0.0, rng=stream.rng(player))
+                    for player in range(5)
+                }
+            )
+            engine = GCBCGameEngine.new_game(bots, stream.rng(100), pre_round_workers=0)
+            for _ in range(50):
+                engine.play_round()
+            return engine.game_state
+
+        self.assertEqual(play(3), play(3))
+
+    def test_unseeded_decks_use_the_global_random(self):
+        random.seed(0)
+        decks = {tuple(GCBCInitalizer.build_deck(4).equipment_cards) for _ in range(20)}
+        self.assertGreater(len(decks), 1)
+
+        random.seed(1)
+        deck = GCBCGameEngine.new_game(BotManager({0: BaseBot(), 1: BaseBot()})).deck_state
+        random.seed(1)
+        GCBCInitalizer.build_game_state(2)
+        self.assertEqual(deck, GCBCInitalizer.build_deck(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import random
+import unittest
+from unittest.mock import Mock
+
+from gcbc.bot.base_bot import BotManager
+from gcbc.bot.random_bot import RandomBot
+from gcbc.core.core_data import (
+    DeckState,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+from gcbc.engine.engine import GCBCGameEngine, WinCondition
+from gcbc.engine.tournament import (
+    GameResult,
+    TournamentResults,
+    TournamentRunner,
+    play_game,
+    rotation_schedule,
+    winning_players,
+)
+
+
+def player_state(cards, health=PlayerHealthState.ALIVE):
+    return PlayerGameState(
+        integrity_cards=[PlayerIntegrityCardState(card=card, face_up=False) for card in cards],
+        gun=PlayerGunState(has_gun=False, aimed_at=None),
+        equipment=None,
+        health=health,
+    )
+
+
+class TestTournament(unittest.TestCase):
+    def setUp(self):
+        self.game_state = TableTopGameState(
+            state={
+                0: player_state([IntegrityCard.AGENT, IntegrityCard.BAD_COP, IntegrityCard.BAD_COP]),
+                1: player_state([IntegrityCard.KINGPIN, IntegrityCard.GOOD_COP, IntegrityCard.GOOD_COP]),
+                2: player_state([IntegrityCard.GOOD_COP, IntegrityCard.GOOD_COP, IntegrityCard.BAD_COP]),
+                3: player_state([IntegrityCard.BAD_COP, IntegrityCard.BAD_COP, IntegrityCard.GOOD_COP]),
+            }
+        )
+        self.engine = GCBCGameEngine(
+            self.game_state,
+            DeckState(equipment_cards=[], guns=0),
+            BotManager({player: Mock() for player in range(4)}),
+        )
+
+    def test_rotation_schedule(self):
+        self.assertEqual(rotation_schedule(3), [(0, 1, 2), (1, 2, 0), (2, 0, 1)])
+        self.assertEqual(rotation_schedule(2, 4), [(0, 1, 0, 1), (1, 0, 1, 0)])
+
+    def test_winning_players(self):
+        self.assertEqual(winning_players(self.engine, WinCondition.KINGPIN_DEAD), (0, 2))
+        self.assertEqual(winning_players(self.engine, WinCondition.AGENT_DEAD), (1, 3))
+
+        for player in (0, 1, 3):
+            self.game_state.state[player].health = PlayerHealthState.DEAD
+        self.assertEqual(winning_players(self.engine, WinCondition.ONE_PLAYER_ALIVE), (2,))
+
+    def test_results(self):
+        results = TournamentResults(num_seats=2, num_bots=2)
+        results.add(GameResult((0, 1), WinCondition.KINGPIN_DEAD, (1,), 10))
+        results.add(GameResult((1, 0), WinCondition.AGENT_DEAD, (1,), 12))
+        results.add(GameResult((1, 0), None, (), 50))
+
+        self.assertEqual(results.games, 3)
+        self.assertEqual(results.win_conditions[None], 1)
+        self.assertEqual(results.seat_win_rates(), [0.0, 2 / 3])
+        self.assertEqual(results.bot_win_rates(), [1 / 3, 1 / 3])
+
+    def test_games_only_depend_on_their_rng(self):
+        def play(global_seed):
+            random.seed(global_seed)
+            return play_game([RandomBot] * 4, (0, 1, 2, 3), 300, random.Random(5))
+
+        self.assertEqual(play(1), play(2))
+
+    def test_runner_is_deterministic(self):
+        def run(workers, games_per_shard):
+            return TournamentRunner(
+                [RandomBot, RandomBot, RandomBot],
+                num_games=12,
+                workers=workers,
+                seed=3,
+                max_rounds=20,
+                games_per_shard=games_per_shard,
+            ).run()
+
+        random.seed(1)
+        results = run(workers=2, games_per_shard=3)
+
+        self.assertEqual(results.games, 12)
+        self.assertEqual(results.bot_games, [12, 12, 12])
+        # the bots draw from their game's stream, not the global random module
+        random.seed(2)
+        self.assertEqual(results, run(workers=1, games_per_shard=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
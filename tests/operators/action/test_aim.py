@@ -87,6 +87,12 @@ class TestAim(unittest.TestCase):
         self.assertFalse(action.is_valid(self.game_state, self.deck_state))
         self.actor_state.gun.has_gun = True  # Reset
 
+        # Test invalid aim - actor's gun was tasered away
+        gun = self.actor_state.gun
+        self.actor_state.gun = None
+        self.assertFalse(action.is_valid(self.game_state, self.deck_state))
+        self.actor_state.gun = gun  # Reset
+
         # Test invalid aim - target not alive
         self.target_state.health = PlayerHealthState.DEAD
         self.assertFalse(action.is_valid(self.game_state, self.deck_state))
@@ -96,6 +96,12 @@ class TestArmAndAim(unittest.TestCase):
         self.assertFalse(action.is_valid(self.game_state, self.deck_state))
         self.target_state.health = PlayerHealthState.ALIVE  # Reset
 
+        # Test invalid arm and aim - actor's gun was tasered away
+        gun = self.actor_state.gun
+        self.actor_state.gun = None
+        self.assertFalse(action.is_valid(self.game_state, self.deck_state))
+        self.actor_state.gun = gun  # Reset
+
     def test_play(self):
         action = ArmAndAim(actor=self.actor, target=self.target, card_to_flip=0)
         new_game_state, new_deck_state = action.play(self.game_state, self.deck_state)
@@ -0,0 +1,176 @@
+import unittest
+from itertools import product
+
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+    TurnPhase,
+)
+from gcbc.operators.action.aim import Aim
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.equip import Equip
+from gcbc.operators.action.investigate import Investigate
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.equipment.blackmail import Blackmail
+from gcbc.operators.equipment.defibrillator import Defibrillator
+from gcbc.operators.equipment.polygraph import Polygraph
+from gcbc.operators.equipment.swap import Swap
+from gcbc.operators.equipment.taser import Taser
+from gcbc.operators.legal_moves import TableFacts, legal_moves
+
+OPERATORS = {
+    TurnPhase.PRE_ROUND: [Blackmail, Defibrillator, Polygraph, Swap, Taser],
+    TurnPhase.ACTION: [Investigate, Equip, ArmAndAim, Shoot, Pass],
+    TurnPhase.AIM: [Aim],
+}
+NUM_ARGS = {
+    Investigate: 2,
+    Equip: 1,
+    ArmAndAim: 2,
+    Shoot: 1,
+    Pass: 0,
+    Aim: 1,
+    Blackmail: 1,
+    Defibrillator: 1,
+    Polygraph: 1,
+    Swap: 4,
+    Taser: 2,
+}
+
+
+def normalize(operator):
+    if isinstance(operator, Swap) and operator.playerA > operator.playerB:
+        return Swap(
+            operator.user, operator.playerB, operator.cardB, operator.playerA, operator.cardA
+        )
+    return operator
+
+
+class TestLegalMoves(unittest.TestCase):
+    def setUp(self):
+        self.player_1 = 0
+        self.player_2 = 1
+        self.player_3 = 2
+        self.player_4 = 3
+
+        self.game_state = TableTopGameState(
+            state={
+                self.player_1: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.AGENT, face_up=False),
+                    ],
+                    gun=PlayerGunState(has_gun=True, aimed_at=self.player_2),
+                    equipment=None,
+                    health=PlayerHealthState.ALIVE,
+                ),
+                self.player_2: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.KINGPIN, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                    ],
+                    gun=None,
+                    equipment=EquipmentCard.TASER,
+                    health=PlayerHealthState.WOUNDED,
+                ),
+                self.player_3: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=False),
+                    ],
+                    gun=PlayerGunState(has_gun=False, aimed_at=None),
+                    equipment=EquipmentCard.DEFIBRILLATOR,
+                    health=PlayerHealthState.ALIVE,
+                ),
+                self.player_4: PlayerGameState(
+                    integrity_cards=[
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.GOOD_COP, face_up=True),
+                        PlayerIntegrityCardState(card=IntegrityCard.BAD_COP, face_up=True),
+                    ],
+                    gun=PlayerGunState(has_gun=False, aimed_at=None),
+                    equipment=EquipmentCard.SWAP,
+                    health=PlayerHealthState.DEAD,
+                ),
+            }
+        )
+        self.deck_state = DeckState(equipment_cards=[EquipmentCard.POLYGRAPH], guns=1)
+
+    def brute_force(self, player, phase):
+        """
+        Every operator of the phase over a range of arguments wider than the table,
+        filtered through is_valid.
+        """
+        values = range(-1, len(self.game_state.state) + 1)
+        return {
+            repr(normalize(operator(player, *args)))
+            for operator in OPERATORS[phase]
+            for args in product(values, repeat=NUM_ARGS[operator])
+            if operator(player, *args).is_valid(self.game_state, self.deck_state)
+        }
+
+    def assert_matches_brute_force(self):
+        facts = TableFacts.from_state(self.game_state)
+        for player, phase in product(self.game_state.state, TurnPhase):
+            moves = legal_moves(self.game_state, self.deck_state, player, phase, facts)
+            for move in moves:
+                self.assertTrue(move.is_valid(self.game_state, self.deck_state), move)
+            # operators are unhashable dataclasses, so compare their reprs
+            moves = [repr(move) for move in moves]
+            self.assertEqual(len(moves), len(set(moves)))
+            self.assertEqual(set(moves), self.brute_force(player, phase), (player, phase))
+
+    def test_table_facts(self):
+        facts = TableFacts.from_state(self.game_state)
+
+        self.assertEqual(facts.alive, [self.player_1, self.player_2, self.player_3])
+        self.assertEqual(facts.dead, [self.player_4])
+        self.assertEqual(facts.flippable[self.player_1], [0, 2])
+        self.assertEqual(facts.flippable[self.player_2], [0, 1, 2])
+        self.assertEqual(facts.gun_holders, [self.player_1, self.player_3, self.player_4])
+        self.assertEqual(facts.armed, [self.player_1])
+
+    def test_legal_moves(self):
+        self.assertIn(
+            Shoot(self.player_1, self.player_2),
+            legal_moves(self.game_state, self.deck_state, self.player_1, TurnPhase.ACTION),
+        )
+        self.assertEqual(
+            legal_moves(self.game_state, self.deck_state, self.player_3, TurnPhase.PRE_ROUND),
+            [Defibrillator(self.player_3, self.player_4)],
+        )
+        self.assertEqual(
+            legal_moves(self.game_state, self.deck_state, self.player_4, TurnPhase.ACTION),
+            [Pass(self.player_4)],
+        )
+        self.assertEqual(
+            legal_moves(self.game_state, self.deck_state, self.player_3, TurnPhase.AIM), []
+        )
+
+    def test_matches_is_valid(self):
+        self.assert_matches_brute_force()
+
+        self.game_state.state[self.player_1].equipment = EquipmentCard.TASER
+        self.game_state.state[self.player_2].equipment = EquipmentCard.SWAP
+        self.game_state.state[self.player_3].equipment = EquipmentCard.BLACKMAIL
+        self.game_state.state[self.player_3].gun.aimed_at = self.player_4
+        self.game_state.state[self.player_3].gun.has_gun = True
+        self.assert_matches_brute_force()
+
+        self.game_state.state[self.player_1].equipment = EquipmentCard.POLYGRAPH
+        self.deck_state = DeckState(equipment_cards=[], guns=0)
+        self.assert_matches_brute_force()
+
+
+if __name__ == "__main__":
+    unittest.main()
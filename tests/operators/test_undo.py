@@ -0,0 +1,84 @@
+import unittest
+from copy import deepcopy
+
+from gcbc.core.core_data import (
+    DeckState,
+    EquipmentCard,
+    IntegrityCard,
+    PlayerGameState,
+    PlayerGunState,
+    PlayerHealthState,
+    PlayerIntegrityCardState,
+    TableTopGameState,
+)
+from gcbc.operators.action.aim import Aim
+from gcbc.operators.action.arm_and_aim import ArmAndAim
+from gcbc.operators.action.equip import Equip
+from gcbc.operators.action.investigate import Investigate
+from gcbc.operators.action.pass_action import Pass
+from gcbc.operators.action.shoot import Shoot
+from gcbc.operators.equipment.blackmail import Blackmail
+from gcbc.operators.equipment.defibrillator import Defibrillator
+from gcbc.operators.equipment.polygraph import Polygraph
+from gcbc.operators.equipment.swap import Swap
+from gcbc.operators.equipment.taser import Taser
+
+# each operator, with the equipment seat 0 holds for it
+OPERATORS = [
+    (Aim(actor=0, target=2), None),
+    (ArmAndAim(actor=3, target=1, card_to_flip=0), None),
+    (Equip(actor=3, card_to_flip=0), None),
+    (Investigate(actor=0, target=1, target_card=0), None),
+    (Pass(actor=0), None),
+    (Shoot(actor=0, target=1), None),
+    (Blackmail(user=0, target=1), EquipmentCard.BLACKMAIL),
+    (Defibrillator(user=0, target=4), EquipmentCard.DEFIBRILLATOR),
+    (Polygraph(user=0, target=1), EquipmentCard.POLYGRAPH),
+    (Swap(user=0, playerA=1, cardA=0, playerB=2, cardB=1), EquipmentCard.SWAP),
+    (Taser(user=0, target=1, aimed_at=2), EquipmentCard.TASER),
+]
+
+
+def player(cards, gun=None, health=PlayerHealthState.ALIVE):
+    return PlayerGameState(
+        integrity_cards=[PlayerIntegrityCardState(card, face_up=False) for card in cards],
+        gun=gun or PlayerGunState(has_gun=False, aimed_at=None),
+        equipment=None,
+        health=health,
+    )
+
+
+class TestUndo(unittest.TestCase):
+    def setUp(self):
+        good, bad = IntegrityCard.GOOD_COP, IntegrityCard.BAD_COP
+        self.game_state = TableTopGameState(
+            state={
+                0: player([good, bad, good], PlayerGunState(has_gun=True, aimed_at=1)),
+                1: player([IntegrityCard.KINGPIN, bad, bad], PlayerGunState(True, 2)),
+                2: player([good, good, bad]),
+                3: player([IntegrityCard.AGENT, good, bad]),
+                4: player([bad, good, bad], health=PlayerHealthState.DEAD),
+            }
+        )
+        self.deck_state = DeckState(
+            equipment_cards=[EquipmentCard.TASER, EquipmentCard.SWAP], guns=2
+        )
+
+    def test_undo(self):
+        for operator, equipment in OPERATORS:
+            with self.subTest(operator=operator):
+                self.game_state.state[0].equipment = equipment
+                self.assertTrue(operator.is_valid(self.game_state, self.deck_state))
+                original_game_state = deepcopy(self.game_state)
+                original_deck_state = deepcopy(self.deck_state)
+
+                record = operator.undo_record(self.game_state, self.deck_state)
+                game_state, deck_state = operator.play(self.game_state, self.deck_state)
+                game_state, deck_state = operator.undo(game_state, deck_state, record)
+
+                self.assertEqual(game_state, original_game_state)
+                self.assertEqual(deck_state, original_deck_state)
+
+
+if __name__ == "__main__":
+    unittest.main()